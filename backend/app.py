@@ -3,35 +3,297 @@ PM Internship Scheme - Flask Backend with Resume Upload
 Government of India
 """
 
-from flask import Flask, request, jsonify
+# First, so start-up timings include every other import
+import startup
+
+import hmac
+import logging
+import sys
+import time
+from flask import Flask, g, request, jsonify
 from flask_cors import CORS
-import json
-from recommendation_engine import RecommendationEngine
-from resume_parser import ResumeParser, extract_text_from_pdf, extract_text_from_docx
+import config
+import metrics
+import profiling
+from catalog_store import ReadOnlyCatalogError, validate_internship
+from extraction_pool import ExtractionPool, ExtractionTimeout, ExtractionCancelled, ExtractionBusy
+from recommendation_engine import (
+    MAX_RECOMMENDATIONS, RELEVANCE_THRESHOLD, CursorError, CursorExpired, RecommendationEngine, validate_profile
+)
+from records import RECOMMENDATION_FIELDS, serialize
+from reference_data import ReferenceData
+from response_encoding import FastJSONProvider, available_encodings, compress_response
+from resume_cache import (
+    ResumeCache, normalize_text, fingerprint as resume_settings_fingerprint,
+    file_key as resume_cache_key, text_key as resume_text_key
+)
+from resume_jobs import ResumeJobQueue, QueueFull
+from resume_parser import ResumeParser, parse_pdf_resume, extract_text_from_docx, warm_up as warm_up_extraction
+
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
-CORS(app)
+# ETag / Retry-After must be readable by the Flutter web client
+CORS(app, expose_headers=['ETag', 'Retry-After'])
+# jsonify() serializes with orjson when installed (JSON_ENCODER)
+app.json = FastJSONProvider(app, config.JSON_ENCODER)
+# Response compression this process can offer, in preference order
+compression_encodings = available_encodings(config.COMPRESSION_ENCODINGS)
+
+# Eager: build now and warm up before reporting healthy; lazy: build on first use
+startup_phase = startup.Startup(config.STARTUP_MODE)
+startup_phase.mark('imports')
+eager = startup_phase.mode == 'eager'
 
 # Initialize engines
-recommendation_engine = RecommendationEngine()
-resume_parser = ResumeParser()
+if eager:
+    recommendation_engine = RecommendationEngine()
+    startup_phase.mark('catalog')
+    resume_parser = ResumeParser()
+    startup_phase.mark('parser')
+else:
+    recommendation_engine = startup.Lazy(RecommendationEngine)
+    resume_parser = startup.Lazy(ResumeParser)
+
+# Sector / skill pick-lists from the catalog file, kept in memory
+reference_data = startup.Lazy(lambda: ReferenceData(recommendation_engine.data_path))
+
+# PDF/DOCX extraction runs in worker processes with a wall-clock limit;
+# in eager mode each worker imports the PDF/DOCX libraries as it starts
+extraction_pool = ExtractionPool(
+    max_workers=config.EXTRACTION_WORKERS,
+    timeout=config.EXTRACTION_TIMEOUT,
+    queue_timeout=config.EXTRACTION_QUEUE_TIMEOUT,
+    initializer=warm_up_extraction if eager else None,
+    initargs=(config.PDF_BACKEND,)
+)
+
+# Parsed resumes keyed by content hash (memory, plus SQLite if configured)
+resume_cache = ResumeCache(
+    max_entries=config.RESUME_CACHE_SIZE,
+    sqlite_path=config.RESUME_CACHE_PATH or None,
+    max_disk_entries=config.RESUME_CACHE_DISK_ENTRIES
+)
 
 # File upload configuration
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt'}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
+def cache_stat(field):
+    """Scrape-time collector for one QueryCache / ResumeCache stats field"""
+    def collect():
+        caches = {
+            "recommend": recommendation_engine.cache,
+            "ranked": recommendation_engine.ranked_cache,
+            "resume": resume_cache
+        }
+        return {(name,): cache.stats()[field] for name, cache in caches.items()}
+    return collect
+
+# Sizes and cache counters, read when /api/metrics is scraped
+metrics.REGISTRY.register(metrics.Collected(
+    'pmi_catalog_internships', 'Postings in the current catalog', 'gauge',
+    lambda: recommendation_engine.catalog.stats()["internships"]
+))
+metrics.REGISTRY.register(metrics.Collected(
+    'pmi_catalog_version', 'Current catalog version', 'gauge',
+    lambda: recommendation_engine.catalog_version
+))
+metrics.REGISTRY.register(metrics.Collected(
+    'pmi_startup_seconds', 'Time taken by each start-up phase', 'gauge',
+    lambda: {
+        (phase,): ms / 1000 for phase, ms in startup_phase.phases.items() if isinstance(ms, (int, float))
+    },
+    ('phase',)
+))
+metrics.REGISTRY.register(metrics.Collected(
+    'pmi_cache_hits_total', 'Cache lookups that found an entry', 'counter', cache_stat('hits'), ('cache',)
+))
+metrics.REGISTRY.register(metrics.Collected(
+    'pmi_cache_misses_total', 'Cache lookups that found nothing', 'counter', cache_stat('misses'), ('cache',)
+))
+metrics.REGISTRY.register(metrics.Collected(
+    'pmi_cache_entries', 'Entries held in memory', 'gauge', cache_stat('entries'), ('cache',)
+))
+
+def record_exception(where, expected=False):
+    """
+    Count an exception caught by a handler and log it: with its traceback,
+    or as a one-line warning when `expected` (e.g. an unreadable file)
+    """
+    metrics.EXCEPTIONS.inc(where)
+    if expected:
+        logger.warning("%s failed: %s", where, sys.exc_info()[1])
+    else:
+        logger.exception("Unhandled error in %s", where)
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
+def health_status():
+    """(payload, status) for /api/health, shared with the ASGI app"""
+    if not startup_phase.ready:
+        return {
+            "status": "starting",
+            "message": "PM Internship API is warming up",
+            "startup": startup_phase.stats()
+        }, 503
+    
+    return {
         "status": "healthy",
         "message": "PM Internship API is running",
         "version": "2.0.0",
-        "features": ["recommendations", "resume_parsing", "multi_language"]
-    })
+        "features": ["recommendations", "resume_parsing", "multi_language"],
+        "catalog": recommendation_engine.catalog.stats(),
+        "cache": recommendation_engine.cache.stats(),
+        "ranked_cache": recommendation_engine.ranked_cache.stats(),
+        "resume_cache": resume_cache.stats(),
+        "resume_jobs": resume_jobs.stats(),
+        "startup": startup_phase.stats()
+    }, 200
+
+@app.route('/api/health', methods=['GET'])
+def health_check():
+    """
+    Health check endpoint
+    
+    503 with status "starting" until the start-up phase has finished
+    """
+    payload, status = health_status()
+    return jsonify(payload), status
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Prometheus text-format metrics
+    
+    Per-stage latency histograms (pmi_stage_seconds, plus recent
+    percentiles as pmi_stage_seconds_window), catalog size, cache hits
+    and misses, postings scored and caught exceptions.
+    """
+    if not config.METRICS_ENABLED:
+        return jsonify({
+            "error": "Metrics are disabled. Set METRICS_ENABLED=1 to enable them.",
+            "success": False
+        }), 404
+    
+    return app.response_class(
+        metrics.REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
+# Optional /api/recommend fields that ask for a page of the full ranking
+PAGE_FIELDS = ('limit', 'offset', 'cursor', 'min_score')
+
+def read_page_params(data):
+    """Validate paging fields; returns (params, error message or None)"""
+    def integer(name, default, low, high):
+        value = data.get(name, default)
+        if type(value) is not int or not low <= value <= high:
+            raise ValueError(f"'{name}' must be an integer from {low} to {high}")
+        return value
+    
+    try:
+        params = {
+            "limit": integer('limit', MAX_RECOMMENDATIONS, 1, config.MAX_PAGE_SIZE),
+            "offset": integer('offset', 0, 0, 2 ** 31),
+            "cursor": data.get('cursor'),
+            "min_score": data.get('min_score', RELEVANCE_THRESHOLD)
+        }
+        if params["cursor"] is not None and not isinstance(params["cursor"], str):
+            raise ValueError("'cursor' must be a string")
+        if type(params["min_score"]) not in (int, float) or not 0 <= params["min_score"] <= 100:
+            raise ValueError("'min_score' must be a number from 0 to 100")
+    except ValueError as e:
+        return None, str(e)
+    
+    return params, None
+
+# Recommendation fields a client may leave out with "omit"
+OMITTABLE_FIELDS = tuple(field for field in RECOMMENDATION_FIELDS if field != 'id')
+
+def read_omit(data):
+    """Validate the optional "omit" list; returns (fields, error message or None)"""
+    omit = data.get('omit', [])
+    if not isinstance(omit, list) or not all(field in OMITTABLE_FIELDS for field in omit):
+        return None, f"'omit' must be a list of fields from: {', '.join(OMITTABLE_FIELDS)}"
+    return set(omit), None
+
+def recommendations_response(data, timer):
+    """
+    (payload, status) for an /api/recommend request body
+    
+    Shared by the Flask route and the ASGI app (asgi.py); records the
+    validate and engine stages on `timer`.
+    """
+    # Validate required fields
+    error = validate_profile(data)
+    if error:
+        return {
+            "error": error
+        }, 400
+    
+    omit, error = read_omit(data)
+    if error:
+        return {
+            "error": error,
+            "success": False
+        }, 400
+    timer.stage('validate')
+    
+    if any(field in data for field in PAGE_FIELDS):
+        params, error = read_page_params(data)
+        if error:
+            return {
+                "error": error,
+                "success": False
+            }, 400
+        
+        try:
+            page = recommendation_engine.recommend_page(
+                education=data['education'],
+                skills=data['skills'],
+                sector=data['sector'],
+                location=data['location'],
+                within_km=data.get('within_km'),
+                **params
+            )
+        except CursorError as e:
+            return {
+                "error": str(e),
+                "success": False
+            }, 400
+        except CursorExpired as e:
+            return {
+                "error": str(e),
+                "success": False
+            }, 410
+        timer.stage('engine')
+        
+        return {
+            "success": True,
+            "count": len(page.items),
+            "recommendations": serialize(page.items, omit),
+            "total": page.total,
+            "offset": page.offset,
+            "limit": page.limit,
+            "next_cursor": page.next_cursor
+        }, 200
+    
+    # Get recommendations
+    recommendations = recommendation_engine.recommend(
+        education=data['education'],
+        skills=data['skills'],
+        sector=data['sector'],
+        location=data['location'],
+        within_km=data.get('within_km')
+    )
+    timer.stage('engine')
+    
+    return {
+        "success": True,
+        "count": len(recommendations),
+        "recommendations": serialize(recommendations, omit)
+    }, 200
 
 @app.route('/api/recommend', methods=['POST'])
 def get_recommendations():
@@ -45,137 +307,433 @@ def get_recommendations():
         "sector": "IT",
         "location": "Delhi"
     }
+    
+    Optional paging fields: "limit" (page size, default 5), "offset" or
+    "cursor" (the previous page's "next_cursor") and "min_score" (default
+    20). With any of them the response adds "total", "offset", "limit" and
+    "next_cursor" (null on the last page). Optional "within_km" keeps only
+    postings within that distance of "location". Optional "omit" lists
+    recommendation fields to leave out of the response, e.g.
+    ["description", "required_skills", "score_breakdown"].
     """
+    timer = metrics.timer('get_recommendations')
     try:
-        data = request.json
-        
-        # Validate required fields
-        required_fields = ['education', 'skills', 'sector', 'location']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    "error": f"Missing required field: {field}"
-                }), 400
-        
-        # Get recommendations
-        recommendations = recommendation_engine.recommend(
-            education=data['education'],
-            skills=data['skills'],
-            sector=data['sector'],
-            location=data['location']
-        )
-        
-        return jsonify({
-            "success": True,
-            "count": len(recommendations),
-            "recommendations": recommendations
-        })
+        payload, status = recommendations_response(request.json, timer)
+        response = jsonify(payload)
+        if status == 200:
+            timer.stage('serialize')
+            timer.done()
+        return response, status
     
     except Exception as e:
+        record_exception('get_recommendations')
         return jsonify({
             "error": str(e),
             "success": False
         }), 500
 
-@app.route('/api/resume/upload', methods=['POST'])
-def upload_resume():
+@app.route('/api/recommend/batch', methods=['POST'])
+def get_batch_recommendations():
     """
-    Upload and parse resume
+    Get internship recommendations for many profiles at once
     
-    Returns extracted skills and education
+    Expected JSON:
+    {
+        "profiles": [
+            {"education": "...", "skills": [...], "sector": "...", "location": "..."},
+            ...
+        ]
+    }
+    
+    Results are returned in the same order as the profiles. An invalid
+    profile gets an error entry without failing the whole batch. Optional
+    "omit" leaves fields out of every recommendation, as for /api/recommend.
     """
     try:
-        # Check if file is present
-        if 'file' not in request.files:
+        data = request.json
+        profiles = data.get('profiles') if isinstance(data, dict) else None
+        
+        if not isinstance(profiles, list):
             return jsonify({
-                "error": "No file provided",
+                "error": "Expected a 'profiles' array",
                 "success": False
             }), 400
         
-        file = request.files['file']
-        
-        if file.filename == '':
+        if len(profiles) > config.MAX_BATCH_SIZE:
             return jsonify({
-                "error": "Empty filename",
+                "error": f"Too many profiles. Maximum per batch: {config.MAX_BATCH_SIZE}",
                 "success": False
             }), 400
         
-        if not allowed_file(file.filename):
+        omit, error = read_omit(data)
+        if error:
             return jsonify({
-                "error": "Invalid file type. Allowed: PDF, DOCX, TXT",
+                "error": error,
                 "success": False
             }), 400
         
-        # Read file content
-        file_content = file.read()
+        errors = [validate_profile(profile) for profile in profiles]
+        valid = [profile for profile, error in zip(profiles, errors) if error is None]
+        recommendations = iter(recommendation_engine.recommend_batch(valid))
         
-        # Check file size
-        if len(file_content) > MAX_FILE_SIZE:
-            return jsonify({
-                "error": "File too large. Maximum size: 5MB",
-                "success": False
-            }), 400
+        results = []
+        for error in errors:
+            if error:
+                results.append({"success": False, "error": error})
+            else:
+                matches = next(recommendations)
+                results.append({
+                    "success": True,
+                    "count": len(matches),
+                    "recommendations": serialize(matches, omit)
+                })
         
+        return jsonify({
+            "success": True,
+            "count": len(results),
+            "results": results
+        })
+    
+    except Exception as e:
+        record_exception('get_batch_recommendations')
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 500
+
+def resume_file_settings():
+    """
+    What a cached file result depends on besides the bytes: the parser's
+    skills and the extraction limits (early-stopped parses are partial)
+    """
+    return resume_settings_fingerprint(
+        resume_parser.skill_fingerprint, config.PDF_MAX_PAGES, config.MAX_EXTRACTED_CHARS,
+        config.PDF_BACKEND, config.RESUME_EARLY_STOP_SKILLS
+    )
+
+def process_resume_file(filename, file_content, timer, wait_for_worker=False):
+    """
+    Extract text from an uploaded resume and parse it
+    
+    Returns (payload, status) so the upload endpoints and background jobs
+    produce identical responses. Results are cached by a hash of the file
+    bytes, so a repeated upload skips extraction and parsing entirely.
+    The payload's "processing" entry reports which extraction backend
+    produced the text and how long each step took; the same stages are
+    recorded on `timer` (a metrics.StageTimer). Background jobs pass
+    wait_for_worker=True to queue for an extraction worker rather than
+    fail with a busy error while uploads hold every worker.
+    """
+    started = time.perf_counter()
+    filename = filename.lower()
+    extension = filename.rsplit('.', 1)[-1]
+    cache_key = resume_cache_key(file_content, extension, resume_file_settings())
+    parsed_data = resume_cache.get(cache_key)
+    processing = {"backend": "cache"}
+    timer.stage('cache')
+    
+    if parsed_data is None:
         # Extract text based on file type
-        filename = file.filename.lower()
         text = None
         
         try:
             if filename.endswith('.pdf'):
-                text = extract_text_from_pdf(file_content)
+                # Pages are parsed as they are extracted, inside the worker
+                parsed_data, processing = extraction_pool.run(
+                    parse_pdf_resume, file_content, config.PDF_MAX_PAGES, config.MAX_EXTRACTED_CHARS,
+                    config.RESUME_EARLY_STOP_SKILLS or None, config.PDF_BACKEND, resume_parser.skill_database,
+                    wait_for_worker=wait_for_worker
+                )
+                timer.stage('extract', {'parse': processing['parse_ms'] / 1000})
             elif filename.endswith('.docx'):
-                text = extract_text_from_docx(file_content)
+                processing = {"backend": "python-docx"}
+                text = extraction_pool.run(
+                    extract_text_from_docx, file_content, config.MAX_EXTRACTED_CHARS,
+                    wait_for_worker=wait_for_worker
+                )
             elif filename.endswith('.txt'):
+                processing = {"backend": "text"}
                 text = file_content.decode('utf-8', errors='ignore')
             else:
-                return jsonify({
+                return {
                     "error": "Unsupported file format",
                     "success": False
-                }), 400
+                }, 400
+        except ExtractionTimeout as e:
+            timer.stage('extract')
+            record_exception('resume_extract_timeout', expected=True)
+            return {
+                "error": str(e),
+                "success": False,
+                "details": "The file is too large or complex to process. Try a shorter or simpler file."
+            }, 422
+        except ExtractionCancelled as e:
+            timer.stage('extract')
+            record_exception('resume_extract_cancelled', expected=True)
+            return {
+                "error": str(e),
+                "success": False,
+                "details": "Text extraction was cancelled"
+            }, 503
+        except ExtractionBusy as e:
+            timer.stage('extract')
+            record_exception('resume_extract_busy', expected=True)
+            return {
+                "error": str(e),
+                "success": False,
+                "details": "The server is processing many files right now"
+            }, 503
         except Exception as e:
             # Handle parsing errors specifically
+            timer.stage('extract')
+            record_exception('resume_extract', expected=True)
             error_message = str(e)
-            return jsonify({
+            return {
                 "error": error_message,
                 "success": False,
                 "details": "Failed to extract text from file"
-            }), 400
+            }, 400
         
-        # Validate extracted text
-        if not text or len(text.strip()) < 10:
-            return jsonify({
-                "error": "Could not extract meaningful text from the file",
-                "success": False,
-                "details": "The file might be empty, image-based, or corrupted"
-            }), 400
+        if parsed_data is None:
+            # Validate extracted text
+            if not text or len(text.strip()) < 10:
+                return {
+                    "error": "Could not extract meaningful text from the file",
+                    "success": False,
+                    "details": "The file might be empty, image-based, or corrupted"
+                }, 400
+            
+            processing["extract_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            parse_started = time.perf_counter()
+            timer.stage('extract')
+            
+            # Parse resume
+            try:
+                parsed_data = resume_parser.parse_text(text)
+            except Exception as e:
+                record_exception('resume_parse')
+                return {
+                    "error": f"Failed to parse resume: {str(e)}",
+                    "success": False
+                }, 500
+            
+            processing["parse_ms"] = round((time.perf_counter() - parse_started) * 1000, 2)
+            timer.stage('parse')
+        
+        resume_cache.set(cache_key, parsed_data)
+    
+    processing["total_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    
+    return {
+        "success": True,
+        "data": {
+            "skills": parsed_data['skills'],
+            "education": parsed_data['education'],
+            "email": parsed_data['email'],
+            "phone": parsed_data['phone'],
+            "confidence": parsed_data['confidence']
+        },
+        "message": f"Resume parsed successfully. Found {len(parsed_data['skills'])} skills.",
+        "processing": processing
+    }, 200
+
+# (payload, status) for uploads over MAX_FILE_SIZE
+FILE_TOO_LARGE = ({
+    "error": "File too large. Maximum size: 5MB",
+    "success": False
+}, 400)
+
+def check_resume_filename(filename):
+    """(payload, status) if an upload's filename is empty or not allowed, else None"""
+    if filename == '':
+        return ({
+            "error": "Empty filename",
+            "success": False
+        }, 400)
+    
+    if not allowed_file(filename):
+        return ({
+            "error": "Invalid file type. Allowed: PDF, DOCX, TXT",
+            "success": False
+        }, 400)
+    
+    return None
+
+def read_resume_upload():
+    """
+    Validate and read the uploaded resume from the current request
+    
+    Returns (filename, file_content, None) or (None, None, (payload, status))
+    """
+    # Check if file is present
+    if 'file' not in request.files:
+        return None, None, ({
+            "error": "No file provided",
+            "success": False
+        }, 400)
+    
+    file = request.files['file']
+    
+    error = check_resume_filename(file.filename)
+    if error:
+        return None, None, error
+    
+    # Read file content
+    file_content = file.read()
+    
+    # Check file size
+    if len(file_content) > MAX_FILE_SIZE:
+        return None, None, FILE_TOO_LARGE
+    
+    return file.filename, file_content, None
+
+# Background resume jobs for slow connections (POST /api/resume/jobs)
+def process_resume_job(filename, file_content):
+    """Background job body: process_resume_file with its own stage timings"""
+    timer = metrics.timer('resume_job')
+    result = process_resume_file(filename, file_content, timer, wait_for_worker=True)
+    timer.done()
+    return result
+
+resume_jobs = ResumeJobQueue(
+    process_resume_job,
+    max_workers=config.RESUME_JOB_WORKERS,
+    max_queued=config.RESUME_JOB_QUEUE_SIZE,
+    result_ttl=config.RESUME_JOB_TTL
+)
+
+@app.route('/api/resume/upload', methods=['POST'])
+def upload_resume():
+    """
+    Upload and parse resume
+    
+    Returns extracted skills and education
+    """
+    timer = metrics.timer('upload_resume')
+    try:
+        filename, file_content, error = read_resume_upload()
+        if error:
+            return jsonify(error[0]), error[1]
+        timer.stage('read')
+        
+        payload, status = process_resume_file(filename, file_content, timer)
+        response = jsonify(payload)
+        timer.stage('serialize')
+        timer.done()
+        return response, status
+    
+    except Exception as e:
+        record_exception('upload_resume')
+        return jsonify({
+            "error": f"Unexpected error: {str(e)}",
+            "success": False
+        }), 500
+
+@app.route('/api/resume/jobs', methods=['POST'])
+def create_resume_job():
+    """
+    Queue a resume for background parsing
+    
+    Accepts the same multipart upload as /api/resume/upload and returns
+    202 with a job id straight away. Returns 429 when the queue is full.
+    """
+    try:
+        filename, file_content, error = read_resume_upload()
+        if error:
+            return jsonify(error[0]), error[1]
         
-        # Parse resume
         try:
-            parsed_data = resume_parser.parse_text(text)
-        except Exception as e:
-            return jsonify({
-                "error": f"Failed to parse resume: {str(e)}",
-                "success": False
-            }), 500
+            job_id = resume_jobs.submit(filename, file_content)
+        except QueueFull as e:
+            response = jsonify({
+                "error": str(e),
+                "success": False,
+                "details": "Please retry in a few seconds"
+            })
+            response.headers['Retry-After'] = str(config.RESUME_JOB_RETRY_AFTER)
+            return response, 429
         
         return jsonify({
             "success": True,
-            "data": {
-                "skills": parsed_data['skills'],
-                "education": parsed_data['education'],
-                "email": parsed_data['email'],
-                "phone": parsed_data['phone'],
-                "confidence": parsed_data['confidence']
-            },
-            "message": f"Resume parsed successfully. Found {len(parsed_data['skills'])} skills."
-        })
+            "job_id": job_id,
+            "status": "queued"
+        }), 202
     
     except Exception as e:
+        record_exception('create_resume_job')
         return jsonify({
             "error": f"Unexpected error: {str(e)}",
             "success": False
         }), 500
 
+@app.route('/api/resume/jobs/<job_id>', methods=['GET'])
+def get_resume_job(job_id):
+    """
+    Poll a resume job
+    
+    While the job is queued or running: 202 with its status. Once finished,
+    the response is the payload and status code /api/resume/upload would
+    have returned, plus "job_id" and "status" ("completed" or "failed").
+    """
+    job = resume_jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            "error": "Job not found or expired",
+            "success": False
+        }), 404
+    
+    if job['result'] is None:
+        return jsonify({
+            "success": True,
+            "job_id": job_id,
+            "status": job['status']
+        }), 202
+    
+    payload, status = job['result']
+    return jsonify({**payload, "job_id": job_id, "status": job['status']}), status
+
+def parse_text_response(data):
+    """(payload, status) for an /api/resume/parse-text request body, shared with the ASGI app"""
+    if not isinstance(data, dict) or 'text' not in data:
+        return {
+            "error": "No text provided",
+            "success": False
+        }, 400
+    
+    text = data['text']
+    
+    if not isinstance(text, str):
+        return {
+            "error": "text must be a string",
+            "success": False
+        }, 400
+    
+    if len(text.strip()) < 50:
+        return {
+            "error": "Text too short. Please provide complete resume.",
+            "success": False
+        }, 400
+    
+    # Parse resume (cached by a hash of the normalized text; the
+    # normalized text is what gets parsed so the key fully determines
+    # the result)
+    text = normalize_text(text)
+    cache_key = resume_text_key(text, resume_parser.skill_fingerprint)
+    parsed_data = resume_cache.get(cache_key)
+    if parsed_data is None:
+        parsed_data = resume_parser.parse_text(text)
+        resume_cache.set(cache_key, parsed_data)
+    
+    return {
+        "success": True,
+        "data": {
+            "skills": parsed_data['skills'],
+            "education": parsed_data['education'],
+            "confidence": parsed_data['confidence']
+        },
+        "message": f"Resume parsed successfully. Found {len(parsed_data['skills'])} skills."
+    }, 200
+
 @app.route('/api/resume/parse-text', methods=['POST'])
 def parse_resume_text():
     """
@@ -186,100 +744,278 @@ def parse_resume_text():
         "text": "Resume text content..."
     }
     """
+    try:
+        payload, status = parse_text_response(request.json)
+        return jsonify(payload), status
+    
+    except Exception as e:
+        record_exception('parse_resume_text')
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 500
+
+def reference_list_response(name: str):
+    """Serve a cached pick-list with ETag / 304 Not Modified support"""
+    values, etag = reference_data.get(name)
+    
+    response = jsonify({name: values})
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = config.REFERENCE_CACHE_MAX_AGE
+    
+    # Turns the response into 304 when If-None-Match matches
+    return response.make_conditional(request)
+
+@app.route('/api/sectors', methods=['GET'])
+def get_sectors():
+    """Get available sectors"""
+    return reference_list_response('sectors')
+
+@app.route('/api/skills', methods=['GET'])
+def get_skills():
+    """Get common skills"""
+    return reference_list_response('skills')
+
+def has_admin_token():
+    """True if the admin API is enabled and the request carries its token"""
+    token = request.headers.get('X-Admin-Token', '')
+    return bool(config.ADMIN_TOKEN) and hmac.compare_digest(
+        token.encode('utf-8'), config.ADMIN_TOKEN.encode('utf-8')
+    )
+
+def admin_error():
+    """Error response unless the request carries the admin token"""
+    if not config.ADMIN_TOKEN:
+        return jsonify({
+            "error": "Admin API is disabled. Set ADMIN_TOKEN to enable it.",
+            "success": False
+        }), 403
+    
+    if not has_admin_token():
+        return jsonify({
+            "error": "Invalid admin token",
+            "success": False
+        }), 401
+    
+    return None
+
+# Endpoints the sampling profiler may run on, and their profile names
+PROFILED_ENDPOINTS = {'get_recommendations': 'recommend', 'upload_resume': 'upload_resume'}
+
+@app.before_request
+def start_profiling():
+    """
+    Sample this request's stacks if PROFILE_SAMPLE_RATE picks it, or if
+    it carries "X-Profile: 1" with the admin token
+    """
+    route = PROFILED_ENDPOINTS.get(request.endpoint)
+    if route is not None:
+        forced = request.headers.get('X-Profile') == '1' and has_admin_token()
+        g.profiled = profiling.start_request(route, forced)
+
+@app.after_request
+def mark_profiled(response):
+    if g.get('profiled'):
+        response.headers['X-Profiled'] = '1'
+    return response
+
+@app.after_request
+def compress(response):
+    """Compress large responses with the best encoding the client accepts"""
+    started = time.perf_counter()
+    encoding = compress_response(
+        response, request.accept_encodings, compression_encodings, config.COMPRESSION_MIN_BYTES,
+        gzip_level=config.COMPRESSION_GZIP_LEVEL, brotli_quality=config.COMPRESSION_BROTLI_QUALITY
+    )
+    if encoding:
+        metrics.STAGE_SECONDS.observe(time.perf_counter() - started, request.endpoint, 'compress')
+    return response
+
+@app.teardown_request
+def stop_profiling(exc):
+    if g.pop('profiled', False):
+        profiling.stop_request()
+
+@app.route('/api/admin/catalog', methods=['GET'])
+def get_catalog_status():
+    """Catalog version and size"""
+    error = admin_error()
+    if error:
+        return error
+    
+    return jsonify({"success": True, "catalog": recommendation_engine.catalog.stats()})
+
+@app.route('/api/admin/catalog/reload', methods=['POST'])
+def reload_catalog():
+    """Rebuild the catalog from the data file now"""
+    error = admin_error()
+    if error:
+        return error
+    
+    try:
+        recommendation_engine.reload()
+        return jsonify({"success": True, "catalog": recommendation_engine.catalog.stats()})
+    
+    except Exception as e:
+        record_exception('reload_catalog')
+        return jsonify({
+            "error": f"Failed to reload catalog: {str(e)}",
+            "success": False
+        }), 500
+
+@app.route('/api/admin/internships', methods=['POST'])
+def upsert_internships():
+    """
+    Add internships, or replace those whose id already exists
+    
+    Expected JSON: one internship object, or {"internships": [...]}
+    Only the affected postings are re-indexed; requests already running
+    finish on the previous catalog version.
+    """
+    error = admin_error()
+    if error:
+        return error
+    
     try:
         data = request.json
+        internships = data.get('internships', [data]) if isinstance(data, dict) else None
         
-        if 'text' not in data:
+        if not isinstance(internships, list) or not internships:
             return jsonify({
-                "error": "No text provided",
+                "error": "Expected an internship object or an 'internships' array",
                 "success": False
             }), 400
         
-        text = data['text']
+        for position, internship in enumerate(internships):
+            error = validate_internship(internship)
+            if error:
+                return jsonify({
+                    "error": f"Internship {position}: {error}",
+                    "success": False
+                }), 400
+        
+        result = recommendation_engine.catalog.upsert(internships)
+        return jsonify({"success": True, **result, "catalog": recommendation_engine.catalog.stats()})
+    
+    except ReadOnlyCatalogError as e:
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 409
+    
+    except Exception as e:
+        record_exception('upsert_internships')
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 500
+
+@app.route('/api/admin/internships/<internship_id>', methods=['PUT'])
+def update_internship(internship_id):
+    """Replace (or add) one internship; the id comes from the URL"""
+    error = admin_error()
+    if error:
+        return error
+    
+    try:
+        internship = request.json
+        if isinstance(internship, dict):
+            internship = {**internship, 'id': internship_id}
         
-        if len(text.strip()) < 50:
+        error = validate_internship(internship)
+        if error:
             return jsonify({
-                "error": "Text too short. Please provide complete resume.",
+                "error": error,
                 "success": False
             }), 400
         
-        # Parse resume
-        parsed_data = resume_parser.parse_text(text)
-        
+        result = recommendation_engine.catalog.upsert([internship])
+        return jsonify({"success": True, **result, "catalog": recommendation_engine.catalog.stats()})
+    
+    except ReadOnlyCatalogError as e:
         return jsonify({
-            "success": True,
-            "data": {
-                "skills": parsed_data['skills'],
-                "education": parsed_data['education'],
-                "confidence": parsed_data['confidence']
-            },
-            "message": f"Resume parsed successfully. Found {len(parsed_data['skills'])} skills."
-        })
+            "error": str(e),
+            "success": False
+        }), 409
     
     except Exception as e:
+        record_exception('update_internship')
         return jsonify({
             "error": str(e),
             "success": False
         }), 500
 
-@app.route('/api/sectors', methods=['GET'])
-def get_sectors():
-    """Get available sectors"""
-    # Load from extended JSON
-    import os
-    data_path = os.path.join(os.path.dirname(__file__), 'data', 'internships_extended.json')
+@app.route('/api/admin/internships/<internship_id>', methods=['DELETE'])
+def delete_internship(internship_id):
+    """Remove one internship"""
+    error = admin_error()
+    if error:
+        return error
     
     try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            sectors = data.get('sectors', [])
-    except:
-        # Fallback to hardcoded list
-        sectors = [
-            "IT & Software",
-            "Marketing & Sales",
-            "Manufacturing",
-            "Finance & Banking",
-            "Healthcare",
-            "Education",
-            "Agriculture",
-            "Retail",
-            "Hospitality",
-            "Government"
-        ]
-    
-    return jsonify({"sectors": sectors})
-
-@app.route('/api/skills', methods=['GET'])
-def get_skills():
-    """Get common skills"""
-    import os
-    data_path = os.path.join(os.path.dirname(__file__), 'data', 'internships_extended.json')
+        result = recommendation_engine.catalog.remove([internship_id])
+        if not result['removed']:
+            return jsonify({
+                "error": f"Internship not found: {internship_id}",
+                "success": False
+            }), 404
+        
+        return jsonify({"success": True, "removed": result['removed'], "catalog": recommendation_engine.catalog.stats()})
     
-    try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            skills = data.get('skills', [])
-    except:
-        # Fallback
-        skills = [
-            "Communication",
-            "MS Office",
-            "English",
-            "Hindi",
-            "Python",
-            "Java",
-            "Sales",
-            "Customer Service",
-            "Data Entry",
-            "Social Media",
-            "Accounting",
-            "Teaching",
-            "Manual Work",
-            "Driving"
-        ]
+    except ReadOnlyCatalogError as e:
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 409
     
-    return jsonify({"skills": skills})
+    except Exception as e:
+        record_exception('delete_internship')
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 500
+
+# Sample inputs for the eager warm-up
+WARM_UP_PROFILE = {
+    "education": "Bachelor's Degree",
+    "skills": ["Python", "Communication", "MS Office"],
+    "sector": "IT & Software",
+    "location": "Delhi"
+}
+WARM_UP_TEXT = """
+Bachelor of Commerce (B.Com), Delhi University. warmup@example.com, +91 9876543210
+Skills: Communication, MS Office, Excel, Tally, GST, English, Hindi, Data Entry
+"""
+
+def warm_catalog():
+    """Touch the catalog index, scorer and gazetteer, then drop the cached results"""
+    recommendation_engine.recommend(**WARM_UP_PROFILE)
+    recommendation_engine.recommend_page(**WARM_UP_PROFILE, limit=1)
+    recommendation_engine.clear_caches()
+
+def warm_parser():
+    resume_parser.parse_text(WARM_UP_TEXT)
+    reference_data.get('sectors')
+
+def warm_extraction():
+    """
+    Start the extraction workers (each runs warm_up_extraction as it
+    starts); with inline extraction warm this process instead
+    """
+    if config.EXTRACTION_WORKERS > 0:
+        extraction_pool.warm_up()
+        return None
+    return warm_up_extraction(config.PDF_BACKEND)
+
+if eager:
+    startup_phase.run([
+        ('warm_catalog', warm_catalog),
+        ('warm_parser', warm_parser),
+        ('warm_extraction', warm_extraction)
+    ], background=True)
+else:
+    startup_phase.run([])
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
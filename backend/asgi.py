@@ -0,0 +1,262 @@
+"""
+PM Internship Scheme - ASGI entry point (Starlette)
+Serves the mobile-facing routes from an event loop
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+
+Request bodies (JSON and resume uploads) are received on the event loop,
+so a slow client costs a socket and a coroutine rather than a thread.
+Scoring and text parsing run on a thread pool (ASGI_EXECUTOR_THREADS)
+once the body has arrived. Resume uploads, which wait on the PDF/DOCX
+extraction worker processes, have their own pool (ASGI_UPLOAD_THREADS,
+one thread per worker), so a burst of uploads never takes the threads
+that serve recommendations.
+
+Routes and responses are those of app.py, which this module imports for
+the engine, parser, caches and start-up phase: /api/recommend,
+/api/resume/upload, /api/resume/parse-text, /api/sectors, /api/skills,
+/api/health and /api/metrics. Resume jobs, batch and admin routes stay on
+the WSGI app. Profiling here is sampled only (no X-Profile header).
+"""
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Route
+except ImportError:
+    raise Exception("starlette not installed. Run: pip install starlette python-multipart uvicorn")
+
+from werkzeug.http import parse_accept_header, parse_etags, quote_etag
+
+import app as wsgi
+import config
+import metrics
+import profiling
+from response_encoding import compress
+
+executor = ThreadPoolExecutor(max_workers=config.ASGI_EXECUTOR_THREADS, thread_name_prefix='asgi')
+upload_executor = ThreadPoolExecutor(max_workers=config.ASGI_UPLOAD_THREADS, thread_name_prefix='asgi-upload')
+
+# Multipart framing allowed on top of MAX_FILE_SIZE before the upload is
+# rejected (from its Content-Length, or once that much has been received)
+UPLOAD_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """The request body grew past the upload limit while being received"""
+
+
+async def offload(func, *args, pool=None):
+    """Run func(*args) on `pool` (the general executor by default)"""
+    return await asyncio.get_running_loop().run_in_executor(pool or executor, functools.partial(func, *args))
+
+
+def profiled(route, func, *args):
+    """func(*args) under the sampling profiler if PROFILE_SAMPLE_RATE picks it (executor thread)"""
+    started = profiling.start_request(route)
+    try:
+        return func(*args)
+    finally:
+        if started:
+            profiling.stop_request()
+
+
+def json_response(request, payload, status=200, headers=None):
+    """
+    JSON response encoded like jsonify() and compressed like the WSGI
+    app's after_request hook
+    """
+    body = wsgi.app.json.dumps_bytes(payload) + b'\n'
+    headers = dict(headers or {})
+    encodings = wsgi.compression_encodings
+
+    if encodings and 200 <= status < 300 and len(body) >= config.COMPRESSION_MIN_BYTES:
+        headers['Vary'] = 'Accept-Encoding'
+        encoding = parse_accept_header(request.headers.get('accept-encoding')).best_match(encodings)
+        if encoding:
+            body = compress(body, encoding, config.COMPRESSION_GZIP_LEVEL, config.COMPRESSION_BROTLI_QUALITY)
+            headers['Content-Encoding'] = encoding
+            if 'ETag' in headers and not headers['ETag'].startswith('W/'):
+                headers['ETag'] = 'W/' + headers['ETag']
+
+    return Response(body, status_code=status, headers=headers, media_type='application/json')
+
+
+def error_response(request, where, e, prefix=''):
+    wsgi.record_exception(where)
+    return json_response(request, {
+        "error": f"{prefix}{str(e)}",
+        "success": False
+    }, 500)
+
+
+async def health_check(request):
+    payload, status = await offload(wsgi.health_status)
+    return json_response(request, payload, status)
+
+
+async def get_metrics(request):
+    if not config.METRICS_ENABLED:
+        return json_response(request, {
+            "error": "Metrics are disabled. Set METRICS_ENABLED=1 to enable them.",
+            "success": False
+        }, 404)
+
+    text = await offload(metrics.REGISTRY.render)
+    return Response(text, media_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+async def get_recommendations(request):
+    timer = metrics.timer('get_recommendations')
+    try:
+        data = await request.json()
+        payload, status = await offload(profiled, 'recommend', wsgi.recommendations_response, data, timer)
+        response = json_response(request, payload, status)
+        if status == 200:
+            timer.stage('serialize')
+            timer.done()
+        return response
+
+    except Exception as e:
+        return error_response(request, 'get_recommendations', e)
+
+
+async def read_resume_upload(request):
+    """The ASGI counterpart of app.read_resume_upload"""
+    limit = wsgi.MAX_FILE_SIZE + UPLOAD_OVERHEAD
+    if int(request.headers.get('content-length') or 0) > limit:
+        return None, None, wsgi.FILE_TOO_LARGE
+
+    # Chunked uploads have no Content-Length: count the body as it arrives
+    receive = request.receive
+    received = 0
+
+    async def capped_receive():
+        nonlocal received
+        message = await receive()
+        if message['type'] == 'http.request':
+            received += len(message.get('body', b''))
+            if received > limit:
+                raise UploadTooLarge()
+        return message
+
+    try:
+        return await read_resume_form(Request(request.scope, capped_receive))
+    except UploadTooLarge:
+        return None, None, wsgi.FILE_TOO_LARGE
+
+
+async def read_resume_form(request):
+    """(filename, content, error) from the multipart form of an upload"""
+    async with request.form(max_files=1) as form:
+        file = form.get('file')
+        if file is None or isinstance(file, str):
+            return None, None, ({
+                "error": "No file provided",
+                "success": False
+            }, 400)
+
+        error = wsgi.check_resume_filename(file.filename or '')
+        if error:
+            return None, None, error
+
+        file_content = await file.read(wsgi.MAX_FILE_SIZE + 1)
+        if len(file_content) > wsgi.MAX_FILE_SIZE:
+            return None, None, wsgi.FILE_TOO_LARGE
+
+        return file.filename, file_content, None
+
+
+async def upload_resume(request):
+    timer = metrics.timer('upload_resume')
+    try:
+        filename, file_content, error = await read_resume_upload(request)
+        if error:
+            return json_response(request, *error)
+        timer.stage('read')
+
+        payload, status = await offload(
+            profiled, 'upload_resume', wsgi.process_resume_file, filename, file_content, timer,
+            pool=upload_executor
+        )
+        response = json_response(request, payload, status)
+        timer.stage('serialize')
+        timer.done()
+        return response
+
+    except Exception as e:
+        return error_response(request, 'upload_resume', e, prefix='Unexpected error: ')
+
+
+async def parse_resume_text(request):
+    try:
+        data = await request.json()
+        payload, status = await offload(wsgi.parse_text_response, data)
+        return json_response(request, payload, status)
+
+    except Exception as e:
+        return error_response(request, 'parse_resume_text', e)
+
+
+async def reference_list_response(request, name):
+    """Cached pick-list with ETag / 304 Not Modified, as app.reference_list_response"""
+    values, etag = await offload(wsgi.reference_data.get, name)
+    headers = {
+        'ETag': quote_etag(etag),
+        'Cache-Control': f"public, max-age={config.REFERENCE_CACHE_MAX_AGE}"
+    }
+
+    if parse_etags(request.headers.get('if-none-match')).contains_weak(etag):
+        return Response(status_code=304, headers=headers)
+    return json_response(request, {name: values}, headers=headers)
+
+
+async def get_sectors(request):
+    return await reference_list_response(request, 'sectors')
+
+
+async def get_skills(request):
+    return await reference_list_response(request, 'skills')
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    yield
+    executor.shutdown(wait=False)
+    upload_executor.shutdown(wait=False)
+    wsgi.extraction_pool.shutdown()
+
+
+app = Starlette(
+    routes=[
+        Route('/api/health', health_check, methods=['GET']),
+        Route('/api/metrics', get_metrics, methods=['GET']),
+        Route('/api/recommend', get_recommendations, methods=['POST']),
+        Route('/api/resume/upload', upload_resume, methods=['POST']),
+        Route('/api/resume/parse-text', parse_resume_text, methods=['POST']),
+        Route('/api/sectors', get_sectors, methods=['GET']),
+        Route('/api/skills', get_skills, methods=['GET'])
+    ],
+    # Same CORS policy as flask_cors in app.py
+    middleware=[Middleware(
+        CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'],
+        expose_headers=['ETag', 'Retry-After']
+    )],
+    lifespan=lifespan
+)
+
+
+if __name__ == '__main__':
+    try:
+        import uvicorn
+    except ImportError:
+        raise Exception("uvicorn not installed. Run: pip install uvicorn")
+    uvicorn.run(app, host='0.0.0.0', port=5000)
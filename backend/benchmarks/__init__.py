@@ -0,0 +1,4 @@
+"""
+Benchmarks for the recommendation and resume paths
+Run from the backend directory, e.g. python -m benchmarks.bench_scoring
+"""
@@ -0,0 +1,252 @@
+"""
+Load test: slow clients against the WSGI and ASGI servers
+
+Starts each server in a child process, then opens --slow connections
+that upload a resume at mobile speed (the body trickled over
+--slow-seconds) while --probes clients send /api/recommend back to back.
+Reports how many slow uploads completed, probe latency and throughput
+while they were in flight, and the server's peak threads and memory.
+
+Servers:
+    wsgi       app.app.run(), as app.py starts it (a thread per connection)
+    wsgi-pool  the Flask app on a fixed pool of --wsgi-threads threads,
+               like gunicorn --threads or waitress
+    asgi       uvicorn asgi:app (needs starlette, python-multipart, uvicorn)
+
+Usage (from backend/):
+    python -m benchmarks.bench_asgi
+    python -m benchmarks.bench_asgi --slow 2000 --slow-seconds 20 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks.bench_suite import percentile
+from benchmarks.synthetic import generate_profiles, generate_resume_text
+
+SERVERS = ('wsgi', 'wsgi-pool', 'asgi')
+
+# Child processes serving the app on 127.0.0.1:PORT
+WSGI = '''
+import logging, sys
+import app
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
+app.app.run(host='127.0.0.1', port=int(sys.argv[1]))
+'''
+
+WSGI_POOL = '''
+import logging, sys
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import BaseWSGIServer
+import app
+logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+class PooledWSGIServer(BaseWSGIServer):
+    request_queue_size = 4096
+
+    def __init__(self, *args, threads, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = ThreadPoolExecutor(max_workers=threads)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+PooledWSGIServer('127.0.0.1', int(sys.argv[1]), app.app, threads=int(sys.argv[2])).serve_forever()
+'''
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(name: str, port: int, threads: int) -> subprocess.Popen:
+    if name == 'wsgi':
+        command = [sys.executable, '-c', WSGI, str(port)]
+    elif name == 'wsgi-pool':
+        command = [sys.executable, '-c', WSGI_POOL, str(port), str(threads)]
+    else:
+        command = [sys.executable, '-m', 'uvicorn', 'asgi:app', '--host', '127.0.0.1', '--port', str(port),
+                   '--log-level', 'warning', '--backlog', '4096']
+
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, STARTUP_MODE='eager', PROFILE_SAMPLE_RATE='0')
+    server = subprocess.Popen(command, cwd=backend, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"{name} server exited with {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except (OSError, urllib.error.HTTPError):
+            pass
+        time.sleep(0.1)
+    server.kill()
+    raise RuntimeError(f"{name} server did not become healthy")
+
+
+def process_stats(pid: int) -> dict:
+    """Current thread count and resident memory (MB) of a process (Linux)"""
+    stats = {}
+    with open(f"/proc/{pid}/status", 'r', encoding='utf-8') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key == 'Threads':
+                stats['threads'] = int(value)
+            elif key == 'VmRSS':
+                stats['rss_mb'] = int(value.split()[0]) / 1024
+    return stats
+
+
+async def http_request(port: int, path: str, body: bytes, content_type: str,
+                       chunks: int = 1, seconds: float = 0.0, timeout: float = 30.0) -> int:
+    """POST body (sent in `chunks` pieces spread over `seconds`); returns the status code"""
+    async def send():
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            writer.write(
+                f"POST {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('ascii')
+            )
+            size = -(-len(body) // chunks)
+            for start in range(0, len(body), size):
+                writer.write(body[start:start + size])
+                await writer.drain()
+                if seconds:
+                    await asyncio.sleep(seconds / chunks)
+            status_line = await reader.readline()
+            await reader.read()
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
+
+    return await asyncio.wait_for(send(), timeout)
+
+
+def multipart(filename: str, content: bytes):
+    boundary = 'loadtestboundary'
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+        f"Content-Type: application/octet-stream\r\n\r\n".encode('ascii') + content
+        + f"\r\n--{boundary}--\r\n".encode('ascii')
+    )
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+async def load(args, port: int, pid: int) -> dict:
+    resumes = [multipart('resume.txt', generate_resume_text(seed).encode('utf-8')) for seed in range(50)]
+    profiles = [json.dumps(profile).encode('utf-8') for profile in generate_profiles(200)]
+    outcomes = {"slow_ok": 0, "slow_failed": 0, "probe_failed": 0}
+    probe_latencies = []
+    peak = {"threads": 0, "rss_mb": 0.0}
+    running = True
+
+    async def slow_client(index: int):
+        # Connections open over --ramp seconds, as clients arrive
+        await asyncio.sleep(args.ramp * index / args.slow)
+        body, content_type = resumes[index % len(resumes)]
+        try:
+            status = await http_request(port, '/api/resume/upload', body, content_type,
+                                        chunks=args.chunks, seconds=args.slow_seconds,
+                                        timeout=args.slow_seconds + args.timeout)
+            outcomes["slow_ok" if status == 200 else "slow_failed"] += 1
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            outcomes["slow_failed"] += 1
+
+    async def probe(index: int):
+        count = index
+        while running:
+            started = time.perf_counter()
+            try:
+                status = await http_request(port, '/api/recommend', profiles[count % len(profiles)],
+                                            'application/json', timeout=args.timeout)
+                if status == 200:
+                    probe_latencies.append(time.perf_counter() - started)
+                else:
+                    outcomes["probe_failed"] += 1
+            except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+                outcomes["probe_failed"] += 1
+            count += args.probes
+
+    async def monitor():
+        while running:
+            for key, value in process_stats(pid).items():
+                peak[key] = max(peak[key], value)
+            await asyncio.sleep(0.25)
+
+    started = time.perf_counter()
+    tasks = [asyncio.ensure_future(probe(i)) for i in range(args.probes)] + [asyncio.ensure_future(monitor())]
+    await asyncio.gather(*(slow_client(i) for i in range(args.slow)))
+    elapsed = time.perf_counter() - started
+    running = False
+    await asyncio.gather(*tasks)
+
+    ordered = sorted(probe_latencies) or [float('nan')]
+    return {
+        **outcomes,
+        "probe_ok": len(probe_latencies),
+        "probe_per_s": round(len(probe_latencies) / elapsed, 1),
+        "probe_p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+        "probe_p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+        "elapsed_s": round(elapsed, 2),
+        "peak_threads": peak["threads"],
+        "peak_rss_mb": round(peak["rss_mb"], 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--servers', nargs='+', choices=SERVERS, default=list(SERVERS))
+    parser.add_argument('--slow', type=int, default=1000, help="concurrent slow uploads")
+    parser.add_argument('--slow-seconds', type=float, default=10.0, help="time each upload body takes to send")
+    parser.add_argument('--chunks', type=int, default=10, help="pieces each upload body is sent in")
+    parser.add_argument('--ramp', type=float, default=2.0, help="seconds over which slow clients connect")
+    parser.add_argument('--probes', type=int, default=4, help="concurrent /api/recommend clients")
+    parser.add_argument('--timeout', type=float, default=10.0, help="per request, after the body is sent")
+    parser.add_argument('--wsgi-threads', type=int, default=8, help="pool size of the wsgi-pool server")
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    columns = ('slow_ok', 'slow_failed', 'probe_ok', 'probe_failed', 'probe_per_s', 'probe_p50_ms',
+               'probe_p99_ms', 'peak_threads', 'peak_rss_mb')
+    print(f"{args.slow} slow uploads over {args.slow_seconds:g}s, {args.probes} recommend probes")
+    print(f"{'server':<10} " + ' '.join(f"{column:>13}" for column in columns))
+
+    results = {}
+    for name in args.servers:
+        port = free_port()
+        server = start_server(name, port, args.wsgi_threads)
+        try:
+            results[name] = asyncio.run(load(args, port, server.pid))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        print(f"{name:<10} " + ' '.join(f"{results[name][column]:>13}" for column in columns))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Response encoding benchmark: JSON encoders, compression and compact mode
+
+Builds /api/recommend, paged (limit 50) and /api/recommend/batch
+payloads from a synthetic catalog and times each JSON encoder and each
+compression encoding on them, full and with "omit" (compact mode),
+reporting latency and bytes. The same requests are then timed end to
+end through Flask's test client, with the engine's caches warm so the
+difference is the encoding.
+
+Usage (from backend/):
+    python -m benchmarks.bench_encoding
+    python -m benchmarks.bench_encoding --size 10000 --batch 100 1000 --output encoding.json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from flask import Flask
+
+from benchmarks.bench_suite import measure, summarize, uncached_engine
+from benchmarks.synthetic import generate_catalog, generate_profiles, write_catalog
+from recommendation_engine import RecommendationEngine
+from records import serialize
+from response_encoding import FastJSONProvider, available_encodings, compress, load_orjson
+
+# Omitted in compact mode
+COMPACT_OMIT = ['description', 'required_skills', 'score_breakdown']
+
+
+def build_payloads(engine, profiles, batch_sizes, omit):
+    """Response bodies as the routes build them, keyed by payload name"""
+    recommendations = engine.recommend(**profiles[0])
+    page = engine.recommend_page(**profiles[0], limit=50, min_score=0)
+    payloads = {
+        "recommend": {
+            "success": True, "count": len(recommendations), "recommendations": serialize(recommendations, omit)
+        },
+        "page": {
+            "success": True, "count": len(page.items), "recommendations": serialize(page.items, omit),
+            "total": page.total, "offset": page.offset, "limit": page.limit, "next_cursor": page.next_cursor
+        }
+    }
+    for size in batch_sizes:
+        results = [
+            {"success": True, "count": len(matches), "recommendations": serialize(matches, omit)}
+            for matches in engine.recommend_batch(profiles[:size])
+        ]
+        payloads[f"batch_{size}"] = {"success": True, "count": len(results), "results": results}
+    return payloads
+
+
+def bench_codecs(args, engine, profiles, encoders, encodings):
+    print("Encoding and compression (per response)")
+    app = Flask(__name__)
+    providers = {name: FastJSONProvider(app, name) for name in encoders}
+    results = []
+    for compact in (False, True):
+        payloads = build_payloads(engine, profiles, args.batch, COMPACT_OMIT if compact else ())
+        for name, payload in payloads.items():
+            repeats = [payload] * args.repeats
+            for encoder, provider in providers.items():
+                latencies = measure(provider.dumps_bytes, repeats)
+                result = summarize("encode", {"payload": name, "compact": compact, "encoder": encoder}, latencies)
+                results.append(dict(result, bytes=len(provider.dumps_bytes(payload))))
+
+            body = providers[encoders[-1]].dumps_bytes(payload)
+            for encoding in encodings:
+                level = {'gzip': args.gzip_level, 'br': args.brotli_quality}[encoding]
+                latencies = measure(lambda data: compress(data, encoding, args.gzip_level, args.brotli_quality),
+                                    [body] * args.repeats)
+                size = len(compress(body, encoding, args.gzip_level, args.brotli_quality))
+                result = summarize("compress", {"payload": name, "compact": compact, "encoding": encoding,
+                                                "level": level}, latencies)
+                results.append(dict(result, bytes=size, ratio=round(size / len(body), 3)))
+            print(f"    {name} compact={compact}: {len(body)} bytes JSON")
+    return results
+
+
+def bench_http(args, path, profiles, encoders, encodings):
+    """/api/recommend and /api/recommend/batch through Flask's test client"""
+    print("End to end (Flask test client)")
+    import config
+    config.STARTUP_MODE = 'lazy'
+    import app as app_module
+
+    app_module.recommendation_engine = RecommendationEngine(data_path=path, scoring_backend='numpy')
+    client = app_module.app.test_client()
+    routes = {
+        'recommend': ('/api/recommend', profiles[:args.repeats]),
+        'batch': ('/api/recommend/batch', [{"profiles": profiles[:args.batch[0]]}] * max(1, args.repeats // 10))
+    }
+
+    results = []
+    try:
+        for encoder in encoders:
+            app_module.app.json = FastJSONProvider(app_module.app, encoder)
+            for accept in ('identity',) + encodings:
+                for compact in (False, True):
+                    for route, (url, bodies) in routes.items():
+                        sizes = []
+
+                        def post(body):
+                            if compact:
+                                body = dict(body, omit=COMPACT_OMIT)
+                            response = client.post(url, json=body, headers={'Accept-Encoding': accept})
+                            if response.status_code != 200:
+                                raise RuntimeError(f"{url} returned {response.status_code}")
+                            sizes.append(len(response.data))
+
+                        # The untimed first pass fills the recommendation caches
+                        latencies = measure(post, bodies, warmup=len(bodies))
+                        result = summarize(f"http_{route}", {"encoder": encoder, "accept": accept,
+                                                             "compact": compact}, latencies)
+                        results.append(dict(result, bytes=sizes[-1]))
+                        print(f"    {sizes[-1]} bytes sent")
+    finally:
+        app_module.extraction_pool.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10000, help="synthetic catalog size")
+    parser.add_argument('--batch', type=int, nargs='+', default=[100, 1000], help="profiles per batch payload")
+    parser.add_argument('--repeats', type=int, default=50, help="timed calls per case")
+    parser.add_argument('--gzip-level', type=int, default=4)
+    parser.add_argument('--brotli-quality', type=int, default=4)
+    parser.add_argument('--skip-http', action='store_true')
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    encoders = ['stdlib'] + (['orjson'] if load_orjson('auto') else [])
+    encodings = available_encodings(('br', 'gzip'))
+    print(f"Encoders: {', '.join(encoders)}  compression: {', '.join(encodings)}")
+
+    profiles = generate_profiles(max(args.batch + [args.repeats]))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_catalog(os.path.join(tmp, "catalog.json"), generate_catalog(args.size))
+        engine = uncached_engine(path, 'numpy')
+        results = bench_codecs(args, engine, profiles, encoders, encodings)
+        if not args.skip_http:
+            results += bench_http(args, path, profiles, encoders, encodings)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
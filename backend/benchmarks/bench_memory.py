@@ -0,0 +1,73 @@
+"""
+Memory benchmark: catalog postings and per-request allocations
+
+Compares the JSON dict shape with the slotted records the catalog
+keeps in memory (bytes per posting), and measures the peak memory one
+uncached recommend() call allocates (and its latency) with the
+pure-Python scorer.
+
+Usage (from backend/):
+    python -m benchmarks.bench_memory --sizes 1000 10000 100000
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import generate_catalog, generate_profiles, write_catalog
+from recommendation_engine import RecommendationEngine
+from records import Internship
+
+
+def traced(function):
+    """(result, bytes still allocated, peak bytes) for one call"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.queries)
+    print(f"{'postings':>10} {'dict B/post':>12} {'record B/post':>14} {'saved':>7} {'request peak KiB':>17} {'request ms':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = write_catalog(os.path.join(tmp, f"catalog_{size}.json"), generate_catalog(size))
+
+            def load_dicts():
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)['internships']
+
+            dicts, dict_bytes, _ = traced(load_dicts)
+            records, record_bytes, _ = traced(lambda: [Internship.from_dict(d) for d in load_dicts()])
+            del dicts, records
+
+            engine = RecommendationEngine(data_path=path, scoring_backend='python')
+            engine.cache.max_entries = 0
+
+            start = time.perf_counter()
+            for profile in profiles:
+                engine.recommend(**profile)
+            latency = (time.perf_counter() - start) * 1000 / len(profiles)
+            peaks = [traced(lambda: engine.recommend(**profile))[2] for profile in profiles]
+
+            print(f"{size:>10} {dict_bytes / size:>12.0f} {record_bytes / size:>14.0f}"
+                  f" {1 - record_bytes / dict_bytes:>7.0%} {sum(peaks) / len(peaks) / 1024:>17.1f} {latency:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
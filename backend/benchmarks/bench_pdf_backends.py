@@ -0,0 +1,90 @@
+"""
+PDF extraction benchmark: pdfium vs pdfplumber vs auto (pdfium + fallback)
+
+Extracts and parses every resume in the corpus with each backend, reports
+per-document latency, and checks that the parsed skills / education /
+contact details agree with the pdfplumber result.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pdf_backends --resumes 200 --pages 3
+    python -m benchmarks.bench_pdf_backends --corpus /path/to/sample/pdfs
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.synthetic import generate_resume_pdf, generate_resume_text
+from resume_parser import PDF_BACKENDS, parse_pdf_resume
+
+
+def load_corpus(args) -> list:
+    if args.corpus:
+        corpus = []
+        for name in sorted(os.listdir(args.corpus)):
+            if name.lower().endswith('.pdf'):
+                with open(os.path.join(args.corpus, name), 'rb') as f:
+                    corpus.append((name, f.read()))
+        return corpus
+
+    return [
+        (f"synthetic-{seed}.pdf", generate_resume_pdf(generate_resume_text(seed, args.pages)))
+        for seed in range(args.resumes)
+    ]
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=200, help="synthetic resumes to generate")
+    parser.add_argument('--pages', type=int, default=3, help="experience sections per synthetic resume")
+    parser.add_argument('--corpus', help="directory of real PDF resumes (replaces the synthetic corpus)")
+    parser.add_argument('--max-pages', type=int, default=10)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args)
+    print(f"{len(corpus)} PDFs, {sum(len(content) for _, content in corpus) / 1024:.0f} KiB total")
+
+    reference = {}
+    for backend in ('pdfplumber',) + tuple(b for b in PDF_BACKENDS if b != 'pdfplumber'):
+        latencies = []
+        pages = fallback_pages = failures = disagreements = 0
+        for name, content in corpus:
+            start = time.perf_counter()
+            try:
+                parsed, stats = parse_pdf_resume(content, args.max_pages, None, None, backend)
+            except Exception as e:
+                failures += 1
+                reference.setdefault(name, str(e))
+                continue
+            latencies.append(time.perf_counter() - start)
+            pages += stats['pages']
+            fallback_pages += stats['fallback_pages']
+
+            if backend == 'pdfplumber':
+                reference[name] = parsed
+            elif reference.get(name) != parsed:
+                disagreements += 1
+
+        if not latencies:
+            print(f"  {backend:<11} every document failed")
+            continue
+        total = sum(latencies)
+        print(
+            f"  {backend:<11} mean {statistics.mean(latencies) * 1000:7.2f} ms"
+            f"  p50 {percentile(latencies, 0.50) * 1000:7.2f} ms"
+            f"  p95 {percentile(latencies, 0.95) * 1000:7.2f} ms"
+            f"  {pages / total:8.0f} pages/s"
+            f"  fallback pages {fallback_pages}"
+            f"  failures {failures}"
+            + (f"  differs from pdfplumber {disagreements}" if backend != 'pdfplumber' else "")
+        )
+
+
+if __name__ == '__main__':
+    main()
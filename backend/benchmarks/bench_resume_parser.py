@@ -0,0 +1,99 @@
+"""
+Resume parser microbenchmark: skill standardization and education detection
+
+Compares the module-level precompiled tables in resume_parser with the
+previous per-call approach (rebuilt dict / per-pattern re.search), which
+is kept here as the baseline.
+
+Usage (from backend/):
+    python -m benchmarks.bench_resume_parser --resumes 10000
+"""
+
+import argparse
+import re
+import time
+
+from benchmarks.synthetic import generate_resume_text
+from resume_parser import ResumeParser, SKILL_MAPPING
+
+
+def legacy_standardize(skills: set) -> set:
+    """Baseline: scan every mapping entry for each found skill"""
+    skill_mapping = {key.title(): value for key, value in SKILL_MAPPING.items()}
+    standardized = set()
+    for skill in skills:
+        for key, value in skill_mapping.items():
+            if skill.lower() == key.lower():
+                standardized.add(value)
+                break
+    return standardized
+
+
+def legacy_education(text: str) -> str:
+    """Baseline: one re.search per pattern, highest level first"""
+    education_patterns = {
+        "Master's Degree": [
+            r'master', r'mba', r'mca', r'msc', r'm\.tech', r'm\.sc',
+            r'post graduate', r'pg'
+        ],
+        "Bachelor's Degree": [
+            r'bachelor', r'btech', r'b\.tech', r'be', r'b\.e', r'bca',
+            r'bcom', r'bsc', r'ba', r'graduate', r'graduation'
+        ],
+        "Diploma": [
+            r'diploma', r'polytechnic', r'iti'
+        ],
+        "12th Pass": [
+            r'12th', r'12 th', r'xii', r'higher secondary', r'intermediate',
+            r'\+2', r'hsc'
+        ],
+        "10th Pass": [
+            r'10th', r'10 th', r'x\b', r'matriculation', r'secondary',
+            r'ssc'
+        ]
+    }
+    text_lower = text.lower()
+    for education, patterns in education_patterns.items():
+        for pattern in patterns:
+            if re.search(pattern, text_lower):
+                return education
+    return "12th Pass"
+
+
+def timed(label: str, func, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:>9.1f} ms  ({elapsed * 1e6 / len(items):.1f} us/resume)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=10000)
+    parser.add_argument('--pages', type=int, default=1)
+    args = parser.parse_args()
+
+    resume_parser = ResumeParser()
+    texts = [generate_resume_text(seed, args.pages) for seed in range(args.resumes)]
+    found = [{s.title() for s in resume_parser.skill_matcher.find_all(t.lower())} for t in texts]
+
+    # Both implementations must agree before timing them
+    assert all(legacy_education(t) == resume_parser._extract_education(t) for t in texts[:500])
+    assert all(legacy_standardize(f) == resume_parser._standardize_skills(f) for f in found[:500])
+
+    print(f"{args.resumes} resumes, {args.pages} page(s) each")
+    print("Skill standardization")
+    old = timed("legacy mapping scan", legacy_standardize, found)
+    new = timed("precompiled lookup", resume_parser._standardize_skills, found)
+    print(f"  speedup {old / new:.1f}x")
+
+    print("Education detection")
+    old = timed("legacy per-pattern search", legacy_education, texts)
+    new = timed("combined regex", resume_parser._extract_education, texts)
+    print(f"  speedup {old / new:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Scoring backend benchmark: pure-Python loop vs NumPy columns
+
+Usage (from backend/):
+    python -m benchmarks.bench_scoring --sizes 30 1000 10000 50000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_suite import uncached_engine
+from benchmarks.synthetic import generate_catalog, generate_profiles, write_catalog
+from recommendation_engine import RecommendationEngine
+
+
+def time_backend(engine: RecommendationEngine, profiles) -> float:
+    """Average milliseconds per recommend() call (pass an engine without caches)"""
+    start = time.perf_counter()
+    for profile in profiles:
+        engine.recommend(**profile)
+    return (time.perf_counter() - start) * 1000 / len(profiles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[30, 1000, 10000, 50000])
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.queries)
+    print(f"{'postings':>10} {'python ms':>12} {'numpy ms':>12} {'speedup':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = write_catalog(os.path.join(tmp, f"catalog_{size}.json"), generate_catalog(size))
+            timings = {}
+            for backend in ('python', 'numpy'):
+                # Caches off: repeated profiles would otherwise time cache hits
+                engine = uncached_engine(path, backend)
+                engine.recommend(**profiles[0])  # warm up
+                timings[backend] = time_backend(engine, profiles)
+
+            print(f"{size:>10} {timings['python']:>12.3f} {timings['numpy']:>12.3f} "
+                  f"{timings['python'] / timings['numpy']:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Start-up benchmark: eager vs lazy STARTUP_MODE
+
+Starts a fresh interpreter per run and measures importing the app, the
+time until /api/health reports healthy, and the first /api/recommend and
+PDF / DOCX uploads after that (where lazy mode pays for its deferred
+work), along with the phase timings the app reports.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --modes eager --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Runs in the child interpreter; prints one JSON line
+CHILD = r'''
+import io, json, os, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+client = app.app.test_client()
+while client.get('/api/health').status_code != 200:
+    time.sleep(0.005)
+ready = time.perf_counter()
+
+def timed(func):
+    begin = time.perf_counter()
+    response = func()
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return (time.perf_counter() - begin) * 1000
+
+def upload(kind):
+    with open(os.path.join('data', 'warmup_resume.' + kind), 'rb') as f:
+        content = f.read() + b'\0'
+    return client.post('/api/resume/upload', data={'file': (io.BytesIO(content), 'resume.' + kind)},
+                       content_type='multipart/form-data')
+
+result = {
+    "import_ms": (imported - started) * 1000,
+    "ready_ms": (ready - started) * 1000,
+    "first_recommend_ms": timed(lambda: client.post('/api/recommend', json=app.WARM_UP_PROFILE)),
+    "first_pdf_upload_ms": timed(lambda: upload('pdf')),
+    "first_docx_upload_ms": timed(lambda: upload('docx')),
+    "phases_ms": app.startup_phase.stats()["phases_ms"]
+}
+app.extraction_pool.shutdown()
+print(json.dumps(result))
+'''
+
+MEASURES = ('import_ms', 'ready_ms', 'first_recommend_ms', 'first_pdf_upload_ms', 'first_docx_upload_ms')
+
+
+def run_child(mode: str) -> dict:
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, STARTUP_MODE=mode, PROFILE_SAMPLE_RATE='0')
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD], cwd=backend, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=['eager', 'lazy'])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--output', help="write every run as JSON")
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} " + ' '.join(f"{name[:-3]:>20}" for name in MEASURES) + "   (median ms)")
+    results = {}
+    for mode in args.modes:
+        runs = results[mode] = [run_child(mode) for _ in range(args.runs)]
+        print(f"{mode:<6} " + ' '.join(f"{statistics.median(r[name] for r in runs):>20.1f}" for name in MEASURES))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
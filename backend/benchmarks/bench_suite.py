@@ -0,0 +1,239 @@
+"""
+Benchmark suite: recommend, resume parsing, extraction and the HTTP API
+
+Times RecommendationEngine.recommend over synthetic catalogs (30 to
+100k+ postings, each scoring backend), ResumeParser.parse_text, the PDF
+and DOCX extractors over synthetic resume corpora, and the same work end
+to end through Flask's test client. Every case reports p50 / p95 / p99
+latency and throughput. Caches are disabled so each call does the full
+work.
+
+--output writes the results as JSON so runs can be tracked across
+releases; --baseline prints the p50 change against an earlier file.
+
+Usage (from backend/):
+    python -m benchmarks.bench_suite --output bench.json
+    python -m benchmarks.bench_suite --sizes 30 1000 10000 100000 --baseline bench.json
+    python -m benchmarks.bench_suite --only recommend parse
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import (
+    generate_catalog, generate_profiles, generate_resume_docx, generate_resume_pdf,
+    generate_resume_text, write_catalog
+)
+from recommendation_engine import SCORING_BACKENDS, RecommendationEngine
+from resume_parser import PDF_BACKENDS, ResumeParser, extract_text_from_docx, extract_text_from_pdf
+
+GROUPS = ('recommend', 'parse', 'extract', 'http')
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(func: Callable, items: list, warmup: int = 1) -> List[float]:
+    """Seconds per call of func(item), after `warmup` untimed calls"""
+    for item in items[:warmup]:
+        func(item)
+
+    latencies = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(name: str, params: Dict, latencies: List[float]) -> Dict:
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    result = {
+        "name": name,
+        "params": params,
+        "count": len(ordered),
+        "mean_ms": round(total * 1000 / len(ordered), 3),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "throughput_per_s": round(len(ordered) / total, 1) if total else None
+    }
+    print(
+        f"  {name:<22} {' '.join(f'{k}={v}' for k, v in params.items()):<32}"
+        f" p50 {result['p50_ms']:>9.3f} ms  p95 {result['p95_ms']:>9.3f} ms"
+        f"  p99 {result['p99_ms']:>9.3f} ms  {result['throughput_per_s']:>10} /s"
+    )
+    return result
+
+
+def uncached_engine(path: str, backend: str) -> RecommendationEngine:
+    engine = RecommendationEngine(data_path=path, scoring_backend=backend)
+    engine.cache.max_entries = 0
+    engine.ranked_cache.max_entries = 0
+    return engine
+
+
+def bench_recommend(args, catalogs: Dict[int, str]) -> List[Dict]:
+    print("RecommendationEngine.recommend")
+    profiles = generate_profiles(args.queries)
+    results = []
+    for size, path in catalogs.items():
+        for backend in SCORING_BACKENDS:
+            engine = uncached_engine(path, backend)
+            latencies = measure(lambda profile: engine.recommend(**profile), profiles)
+            results.append(summarize("recommend", {"postings": size, "backend": backend}, latencies))
+    return results
+
+
+def bench_parse(args, corpus: Dict[str, list]) -> List[Dict]:
+    print("ResumeParser.parse_text")
+    parser = ResumeParser()
+    return [summarize("parse_text", {"pages": args.pages}, measure(parser.parse_text, corpus['txt']))]
+
+
+def bench_extract(args, corpus: Dict[str, list]) -> List[Dict]:
+    print("Text extraction")
+    results = []
+    for backend in PDF_BACKENDS:
+        latencies = measure(lambda content: extract_text_from_pdf(content, backend=backend), corpus['pdf'])
+        results.append(summarize("extract_pdf", {"pages": args.pages, "backend": backend}, latencies))
+    latencies = measure(extract_text_from_docx, corpus['docx'])
+    results.append(summarize("extract_docx", {"pages": args.pages}, latencies))
+    return results
+
+
+def bench_http(args, catalogs: Dict[int, str], corpus: Dict[str, list]) -> List[Dict]:
+    """The same work through Flask's test client, serialization and routing included"""
+    print("End to end (Flask test client)")
+    import config
+    config.STARTUP_MODE = 'lazy'
+    import app as app_module
+    from resume_cache import ResumeCache
+
+    app_module.resume_cache = ResumeCache(max_entries=0)
+    client = app_module.app.test_client()
+    profiles = generate_profiles(args.queries)
+
+    def post(path: str, **kwargs):
+        response = client.post(path, **kwargs)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+
+    results = []
+    try:
+        for size, path in catalogs.items():
+            app_module.recommendation_engine = uncached_engine(path, args.http_backend)
+            latencies = measure(lambda profile: post('/api/recommend', json=profile), profiles)
+            results.append(summarize(
+                "http_recommend", {"postings": size, "backend": args.http_backend}, latencies
+            ))
+
+        latencies = measure(lambda text: post('/api/resume/parse-text', json={"text": text}), corpus['txt'])
+        results.append(summarize("http_parse_text", {"pages": args.pages}, latencies))
+
+        for kind in ('txt', 'docx', 'pdf'):
+            def upload(content, kind=kind):
+                if kind == 'txt':
+                    content = content.encode('utf-8')
+                post('/api/resume/upload', data={'file': (io.BytesIO(content), f"resume.{kind}")},
+                     content_type='multipart/form-data')
+
+            latencies = measure(upload, corpus[kind])
+            results.append(summarize("http_upload", {"pages": args.pages, "format": kind}, latencies))
+    finally:
+        app_module.extraction_pool.shutdown()
+    return results
+
+
+def environment() -> Dict:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count()
+    }
+
+
+def case_key(result: Dict) -> str:
+    return result["name"] + " " + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results: List[Dict], baseline_path: str):
+    """Print the p50 change of each case present in both runs"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {case_key(result): result for result in json.load(f)["results"]}
+
+    print(f"p50 against {baseline_path}")
+    for result in results:
+        old = baseline.get(case_key(result))
+        if old and old["p50_ms"]:
+            change = result["p50_ms"] / old["p50_ms"] - 1
+            print(f"  {case_key(result):<60} {old['p50_ms']:>9.3f} -> {result['p50_ms']:>9.3f} ms  {change:+.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[30, 1000, 10000, 100000],
+                        help="synthetic catalog sizes")
+    parser.add_argument('--queries', type=int, default=200, help="profiles per recommend case")
+    parser.add_argument('--resumes', type=int, default=100, help="resumes per corpus")
+    parser.add_argument('--pages', type=int, default=2, help="experience sections per resume")
+    parser.add_argument('--http-sizes', type=int, nargs='+', default=[30, 10000],
+                        help="catalog sizes for the end-to-end recommend case")
+    parser.add_argument('--http-backend', choices=SCORING_BACKENDS, default='numpy')
+    parser.add_argument('--only', nargs='+', choices=GROUPS, default=list(GROUPS))
+    parser.add_argument('--output', help="write results as JSON")
+    parser.add_argument('--baseline', help="earlier --output file to compare against")
+    args = parser.parse_args()
+
+    texts = [generate_resume_text(seed, args.pages) for seed in range(args.resumes)]
+    corpus = {
+        'txt': texts,
+        'pdf': [generate_resume_pdf(text) for text in texts],
+        'docx': [generate_resume_docx(text) for text in texts]
+    }
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogs = {}
+        for size in sorted(set(args.sizes) | set(args.http_sizes)):
+            catalogs[size] = write_catalog(os.path.join(tmp, f"catalog_{size}.json"), generate_catalog(size))
+
+        if 'recommend' in args.only:
+            results += bench_recommend(args, {size: catalogs[size] for size in args.sizes})
+        if 'parse' in args.only:
+            results += bench_parse(args, corpus)
+        if 'extract' in args.only:
+            results += bench_extract(args, corpus)
+        if 'http' in args.only:
+            results += bench_http(args, {size: catalogs[size] for size in args.http_sizes}, corpus)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"environment": environment(), "args": vars(args), "results": results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
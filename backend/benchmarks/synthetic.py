@@ -0,0 +1,207 @@
+"""
+Synthetic data generators for benchmarks
+Scales the bundled catalog to any size with realistic value distributions
+"""
+
+import io
+import json
+import os
+import random
+import zipfile
+from typing import List, Dict
+from xml.sax.saxutils import escape
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'internships.json')
+
+EDUCATION_CHOICES = ['10th Pass', '12th Pass', 'Diploma', "Bachelor's Degree", "Master's Degree"]
+
+
+def load_reference_data() -> Dict:
+    """Load the bundled catalog used as a template"""
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def generate_catalog(size: int, seed: int = 42) -> List[Dict]:
+    """Generate `size` internships modelled on data/internships.json"""
+    rnd = random.Random(seed)
+    data = load_reference_data()
+    templates = data['internships']
+    locations = sorted({i['location'] for i in templates}) + ['Remote', 'Anywhere in India']
+
+    catalog = []
+    for n in range(size):
+        template = rnd.choice(templates)
+        catalog.append({
+            'id': f"SYN{n:06d}",
+            'title': template['title'],
+            'company': template['company'],
+            'sector': rnd.choice(data['sectors']),
+            'location': rnd.choice(locations),
+            'duration': template['duration'],
+            'stipend': template['stipend'],
+            'education_required': rnd.choice(EDUCATION_CHOICES),
+            'required_skills': rnd.sample(data['skills'], rnd.randint(1, 5)),
+            'description': template['description']
+        })
+    return catalog
+
+
+def generate_profiles(count: int, seed: int = 7) -> List[Dict]:
+    """Generate applicant profiles drawn from the app's pick-lists"""
+    rnd = random.Random(seed)
+    data = load_reference_data()
+    locations = sorted({i['location'] for i in data['internships']})
+
+    return [
+        {
+            'education': rnd.choice(EDUCATION_CHOICES),
+            'skills': rnd.sample(data['skills'], rnd.randint(1, 6)),
+            'sector': rnd.choice(data['sectors']),
+            'location': rnd.choice(locations)
+        }
+        for _ in range(count)
+    ]
+
+
+def write_catalog(path: str, catalog: List[Dict]) -> str:
+    """Write a catalog in the internships.json format"""
+    data = load_reference_data()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'internships': catalog,
+            'sectors': data['sectors'],
+            'skills': data['skills']
+        }, f)
+    return path
+
+
+RESUME_EDUCATION = [
+    "Master of Business Administration (MBA)", "Bachelor of Technology (B.Tech) in Computer Science",
+    "B.Com, Delhi University", "Diploma in Mechanical Engineering, Government Polytechnic",
+    "Higher Secondary (12th), State Board", "Matriculation (10th), CBSE"
+]
+
+RESUME_SKILLS = [
+    "Python", "Java", "JavaScript", "HTML", "CSS", "MS Office", "Excel", "Tally", "GST",
+    "Communication", "Public Speaking", "Team Management", "Problem Solving", "Data Entry",
+    "Customer Service", "Sales", "Social Media", "Photoshop", "AutoCAD", "Welding", "Driving",
+    "English", "Hindi", "Tamil", "Telugu", "Marathi", "Teaching", "Nursing", "First Aid"
+]
+
+
+def generate_resume_text(seed: int = 0, pages: int = 1) -> str:
+    """Generate a plain-text resume; longer CVs repeat experience sections"""
+    rnd = random.Random(seed)
+    name = rnd.choice(["Asha Verma", "Ravi Kumar", "Meena Iyer", "Arjun Singh", "Fatima Khan"])
+    lines = [
+        name.upper(),
+        f"{name.split()[0].lower()}{seed}@example.com | +91 98{rnd.randint(10000000, 99999999)}",
+        "",
+        "EDUCATION",
+        rnd.choice(RESUME_EDUCATION),
+        "",
+        "SKILLS",
+        ", ".join(rnd.sample(RESUME_SKILLS, rnd.randint(3, 10))),
+    ]
+    for page in range(pages):
+        lines += [
+            "",
+            "EXPERIENCE",
+            f"Intern at Company {rnd.randint(1, 500)} ({2015 + page % 8}-{2016 + page % 8})",
+            "- Worked with the team on " + ", ".join(rnd.sample(RESUME_SKILLS, 3)),
+            "- Prepared weekly reports and handled customer queries",
+            "- Coordinated with vendors and maintained records in registers",
+        ] * 4
+    return "\n".join(lines)
+
+
+def _pdf_string(line: str) -> bytes:
+    escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return b"(" + escaped.encode('latin-1', errors='replace') + b")"
+
+
+def generate_resume_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """
+    Render resume text as a minimal text-based PDF (Helvetica, A4)
+
+    Written by hand so benchmarks need no PDF authoring library.
+    """
+    lines = text.split("\n")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = []
+    font_id = 1
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    pages_id = 2 + 2 * len(pages)
+    page_ids = []
+    for page_lines in pages:
+        ops = [b"BT /F1 11 Tf 14 TL 50 790 Td"]
+        ops += [_pdf_string(line) + b" Tj T*" for line in page_lines]
+        ops.append(b"ET")
+        stream = b"\n".join(ops)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] /Contents %d 0 R"
+            b" /Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, len(objects), font_id)
+        )
+        page_ids.append(len(objects))
+    objects.append(
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids))
+    )
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref)
+    return bytes(out)
+
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml"'
+    ' ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml"'
+    ' Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+
+
+def generate_resume_docx(text: str) -> bytes:
+    """
+    Render resume text as a minimal DOCX, one paragraph per line
+
+    Written by hand (like the PDF) so benchmarks need no DOCX authoring library.
+    """
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+        for line in text.split("\n")
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('[Content_Types].xml', DOCX_CONTENT_TYPES)
+        docx.writestr('_rels/.rels', DOCX_RELS)
+        docx.writestr('word/document.xml', document)
+    return out.getvalue()
@@ -0,0 +1,144 @@
+"""
+Offline bulk matching for candidate lists
+Streams profiles from JSONL or CSV and writes recommendations as JSONL
+
+Usage:
+    python bulk_match.py candidates.jsonl -o results.jsonl
+    python bulk_match.py candidates.csv -o results.jsonl --workers 4
+
+CSV files need education, skills, sector and location columns; skills
+are separated by ';' (see --skills-separator). Each output line holds the
+input line number and either the recommendations or an error.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+
+from recommendation_engine import RecommendationEngine, validate_profile
+from records import serialize
+
+# One engine per process, so every chunk shares the same catalog index
+_engine = None
+
+
+def _init_worker(data_path: str, scoring_backend: str):
+    """Load the catalog and its indexes once per process"""
+    global _engine
+    _engine = RecommendationEngine(data_path=data_path, scoring_backend=scoring_backend)
+
+
+def match_chunk(chunk: List[Tuple[int, Dict, str]]) -> List[Dict]:
+    """Score a chunk of (line number, profile, read error) entries"""
+    errors = [read_error or validate_profile(profile) for _, profile, read_error in chunk]
+    valid = [profile for (_, profile, _), error in zip(chunk, errors) if error is None]
+    recommendations = iter(_engine.recommend_batch(valid))
+
+    results = []
+    for (line, _, _), error in zip(chunk, errors):
+        if error:
+            results.append({"line": line, "success": False, "error": error})
+        else:
+            matches = next(recommendations)
+            results.append({
+                "line": line,
+                "success": True,
+                "count": len(matches),
+                "recommendations": serialize(matches)
+            })
+    return results
+
+
+def read_profiles(path: str, skills_separator: str) -> Iterator[Tuple[int, Dict, str]]:
+    """Yield (line number, profile, read error) entries from a JSONL or CSV file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            # Header is line 1, so data rows start at line 2
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                if 'skills' in row:
+                    row['skills'] = [s.strip() for s in (row['skills'] or '').split(skills_separator) if s.strip()]
+                yield line, row, None
+            return
+
+        for line, text in enumerate(f, start=1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text), None
+            except json.JSONDecodeError as e:
+                yield line, None, f"Invalid JSON: {e}"
+
+
+def chunked(items: Iterator, size: int) -> Iterator[List]:
+    """Group an iterator into lists of at most `size` items"""
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(args) -> int:
+    """Match every profile and write results in input order"""
+    chunks = chunked(read_profiles(args.input, args.skills_separator), args.chunk_size)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    written = 0
+
+    def write(results: List[Dict]):
+        nonlocal written
+        for result in results:
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        written += len(results)
+
+    try:
+        if args.workers <= 1:
+            _init_worker(args.data, args.backend)
+            for chunk in chunks:
+                write(match_chunk(chunk))
+            return written
+
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.data, args.backend)
+        ) as executor:
+            # Keep a bounded window of chunks in flight so large inputs
+            # stream through instead of being read into memory at once
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(match_chunk, chunk))
+                if len(pending) >= args.workers * 2:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+        return written
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk internship matching for candidate lists")
+    parser.add_argument('input', help="Profiles as .jsonl or .csv")
+    parser.add_argument('-o', '--output', help="Output .jsonl file (default: stdout)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help=f"Worker processes (this host has {os.cpu_count()} CPUs)")
+    parser.add_argument('--chunk-size', type=int, default=500, help="Profiles scored per batch")
+    parser.add_argument('--backend', choices=['python', 'numpy'], default=None,
+                        help="Scoring backend (default: SCORING_BACKEND)")
+    parser.add_argument('--data', default=None, help="Catalog JSON (default: data/internships.json)")
+    parser.add_argument('--skills-separator', default=';', help="Skills separator in CSV files")
+    args = parser.parse_args()
+
+    written = run(args)
+    print(f"Matched {written} profiles", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+"""
+Catalog DB - SQLite storage backend for the internship catalog
+Candidate pre-filtering runs as one indexed SQL query; scoring stays in Python
+
+Import the JSON catalog once (from backend/):
+    python catalog_db.py data/internships.json data/internships.db
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+from typing import Callable, Dict, List, Optional
+
+from catalog_index import EDUCATION_LEVELS, education_level_score, normalize
+from geo import location_score, within
+from records import Internship
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS internships (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    sector TEXT NOT NULL,
+    sector_norm TEXT NOT NULL,
+    location TEXT NOT NULL,
+    location_norm TEXT NOT NULL,
+    duration TEXT NOT NULL,
+    stipend TEXT NOT NULL,
+    education_required TEXT NOT NULL,
+    education_level INTEGER NOT NULL,
+    required_skills TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_internships_sector ON internships (sector_norm);
+CREATE INDEX IF NOT EXISTS idx_internships_location ON internships (location_norm);
+CREATE INDEX IF NOT EXISTS idx_internships_education ON internships (education_level);
+
+CREATE TABLE IF NOT EXISTS internship_skills (
+    skill TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (skill, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_internship_skills_position ON internship_skills (position);
+
+-- Distinct normalized locations, so location matching scans this
+-- small table and the postings are then fetched through the index
+CREATE TABLE IF NOT EXISTS locations (
+    location_norm TEXT PRIMARY KEY
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+COLUMNS = (
+    'id', 'title', 'company', 'sector', 'location', 'duration',
+    'stipend', 'education_required', 'required_skills', 'description'
+)
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _insert(conn: sqlite3.Connection, position: int, internship: Dict):
+    location_norm = normalize(internship['location'])
+    conn.execute(
+        "INSERT OR REPLACE INTO internships VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            position, internship['id'], internship['title'], internship['company'],
+            internship['sector'], normalize(internship['sector']),
+            internship['location'], location_norm,
+            internship['duration'], internship['stipend'],
+            internship['education_required'], EDUCATION_LEVELS.get(internship['education_required'], 0),
+            json.dumps(internship['required_skills'], ensure_ascii=False), internship['description']
+        )
+    )
+    conn.execute("DELETE FROM internship_skills WHERE position = ?", (position,))
+    conn.executemany(
+        "INSERT INTO internship_skills (skill, position) VALUES (?, ?)",
+        [(skill, position) for skill in {normalize(s) for s in internship['required_skills']}]
+    )
+    conn.execute("INSERT OR IGNORE INTO locations VALUES (?)", (location_norm,))
+
+
+def _bump_version(conn: sqlite3.Connection):
+    conn.execute(
+        "INSERT INTO catalog_meta VALUES ('version', 1) "
+        "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+    )
+
+
+def import_catalog(json_path: str, db_path: str) -> int:
+    """Replace the database contents with the catalog in a JSON file"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        internships = json.load(f)['internships']
+
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM internships")
+            conn.execute("DELETE FROM internship_skills")
+            conn.execute("DELETE FROM locations")
+            for position, internship in enumerate(internships):
+                _insert(conn, position, internship)
+            _bump_version(conn)
+    finally:
+        conn.close()
+
+    return len(internships)
+
+
+class SqliteCatalogIndex:
+    """
+    SQL counterpart of CatalogIndex.candidates for one request
+
+    Fetched rows are kept in `rows` (position -> Internship) so the
+    scoring stage reads them without another query.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.rows: Dict[int, Internship] = {}
+
+    def candidates(self, education: str, skills: List[str], sector: str, location: str,
+                   weights: Dict[str, float], threshold: float, within_km: float = None) -> List[int]:
+        """
+        Positions that can score above the threshold, as CatalogIndex
+        computes them, fetched in one query in catalog order
+        """
+        skill_keys = sorted({normalize(s) for s in skills})
+        user_loc = normalize(location)
+        locations = [key for (key,) in self.conn.execute("SELECT location_norm FROM locations")]
+
+        if within_km is not None:
+            in_range = [key for key in locations if within(user_loc, key, within_km)]
+            return self._fetch(
+                [f"SELECT position FROM internships WHERE location_norm IN ({', '.join('?' * len(in_range))})"],
+                in_range
+            ) if in_range else []
+
+        # Locations with a score, matched here (memoized) instead of in SQL
+        matched = [key for key in locations if location_score(user_loc, key) > 0]
+
+        # Education buckets whose best case (remote bonus + education) can pass
+        remote_bonus = 50.0 * weights['location_match']
+        user_level = EDUCATION_LEVELS.get(education, 0)
+        levels = sorted({level for level in EDUCATION_LEVELS.values()} | {0})
+        levels = [
+            level for level in levels
+            if remote_bonus + education_level_score(user_level, level) * weights['education_match'] > threshold
+        ]
+
+        branches = ["SELECT position FROM internships WHERE sector_norm = ?"]
+        params: list = [normalize(sector)]
+        if matched:
+            branches.append(
+                f"SELECT position FROM internships WHERE location_norm IN ({', '.join('?' * len(matched))})"
+            )
+            params += matched
+        if skill_keys:
+            branches.append(
+                f"SELECT position FROM internship_skills WHERE skill IN ({', '.join('?' * len(skill_keys))})"
+            )
+            params += skill_keys
+        if levels:
+            branches.append(
+                f"SELECT position FROM internships WHERE education_level IN ({', '.join('?' * len(levels))})"
+            )
+            params += levels
+
+        return self._fetch(branches, params)
+
+    def _fetch(self, branches: List[str], params: list) -> List[int]:
+        """Load the rows of the union of `branches`, in catalog order"""
+        query = (
+            f"SELECT position, {', '.join(COLUMNS)} FROM internships"
+            f" WHERE position IN ({' UNION '.join(branches)}) ORDER BY position"
+        )
+
+        positions = []
+        for row in self.conn.execute(query, params):
+            internship = dict(zip(COLUMNS, row[1:]))
+            internship['required_skills'] = json.loads(internship['required_skills'])
+            self.rows[row[0]] = Internship.from_dict(internship)
+            positions.append(row[0])
+        return positions
+
+
+class SqliteSnapshot:
+    """
+    Per-request view with the same attributes the engine reads from CatalogSnapshot
+
+    Holds the read transaction its version was read in, so every query
+    of the request sees that version even while another process writes.
+    close() ends the transaction; rows already fetched stay usable.
+    """
+
+    vectorized = None
+
+    def __init__(self, conn: sqlite3.Connection, version: int, owns_transaction: bool = False):
+        self.version = version
+        self.index = SqliteCatalogIndex(conn)
+        self.internships = self.index.rows
+        self._conn = conn
+        self._owns_transaction = owns_transaction
+
+    def close(self):
+        if self._owns_transaction:
+            self._owns_transaction = False
+            if self._conn.in_transaction:
+                self._conn.rollback()
+
+
+class SqliteCatalogStore:
+    """
+    Catalog kept in SQLite instead of process memory
+
+    Drop-in for CatalogStore: every worker shares the database file,
+    postings are only loaded for the candidates of a request, and a
+    version counter in the database keys the recommendation cache. Edits
+    from any process bump the version, so no reload is needed.
+    """
+
+    def __init__(self, db_path: str, json_path: str = None):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._listeners: List[Callable] = []
+
+        # First start: one-shot import from the JSON catalog
+        if json_path and not os.path.exists(db_path):
+            import_catalog(json_path, db_path)
+        self.json_path = json_path
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.db_path)
+        return conn
+
+    def add_listener(self, listener: Callable):
+        self._listeners.append(listener)
+
+    @property
+    def snapshot(self) -> SqliteSnapshot:
+        snapshot = self.current()
+        snapshot.close()
+        return snapshot
+
+    def current(self) -> SqliteSnapshot:
+        """
+        Snapshot of the catalog as of now; close() it when the request ends
+
+        The version is read inside a new read transaction that the snapshot
+        keeps open. A snapshot taken while this thread already has one open
+        shares that transaction and leaves it to the outer snapshot.
+        """
+        conn = self._conn()
+        owns_transaction = not conn.in_transaction
+        if owns_transaction:
+            # Deferred: the SELECT below fixes the database state it sees
+            conn.execute("BEGIN")
+        row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()
+        return SqliteSnapshot(conn, row[0] if row else 0, owns_transaction)
+
+    def reload(self) -> SqliteSnapshot:
+        """Re-import the JSON catalog into the database"""
+        if self.json_path:
+            import_catalog(self.json_path, self.db_path)
+        return self._publish()
+
+    def upsert(self, internships: List[Dict]) -> Dict:
+        """Add postings, or replace those whose id already exists"""
+        added = updated = 0
+        conn = self._conn()
+        with conn:
+            (next_position,) = conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM internships").fetchone()
+            for internship in internships:
+                row = conn.execute("SELECT position FROM internships WHERE id = ?", (internship['id'],)).fetchone()
+                if row is None:
+                    position, next_position = next_position, next_position + 1
+                    added += 1
+                else:
+                    position = row[0]
+                    updated += 1
+                _insert(conn, position, internship)
+            _bump_version(conn)
+
+        self._publish()
+        return {"added": added, "updated": updated}
+
+    def remove(self, ids: List[str]) -> Dict:
+        """Remove postings by id"""
+        conn = self._conn()
+        missing = []
+        removed = 0
+        with conn:
+            for internship_id in ids:
+                row = conn.execute("SELECT position FROM internships WHERE id = ?", (internship_id,)).fetchone()
+                if row is None:
+                    missing.append(internship_id)
+                    continue
+                conn.execute("DELETE FROM internships WHERE position = ?", row)
+                conn.execute("DELETE FROM internship_skills WHERE position = ?", row)
+                removed += 1
+            if removed:
+                _bump_version(conn)
+
+        if removed:
+            self._publish()
+        return {"removed": removed, "missing": missing}
+
+    def get(self, internship_id: str) -> Optional[Internship]:
+        row = self._conn().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM internships WHERE id = ?", (internship_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        internship = dict(zip(COLUMNS, row))
+        internship['required_skills'] = json.loads(internship['required_skills'])
+        return Internship.from_dict(internship)
+
+    def stats(self) -> Dict:
+        with closing(self.current()) as snapshot:
+            (count,) = self._conn().execute("SELECT COUNT(*) FROM internships").fetchone()
+        return {"version": snapshot.version, "internships": count, "storage": "sqlite"}
+
+    def _publish(self) -> SqliteSnapshot:
+        snapshot = self.snapshot
+        for listener in self._listeners:
+            listener(snapshot)
+        return snapshot
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Usage: python catalog_db.py <internships.json> <catalog.db>", file=sys.stderr)
+        sys.exit(2)
+    count = import_catalog(sys.argv[1], sys.argv[2])
+    print(f"Imported {count} internships into {sys.argv[2]}", file=sys.stderr)
@@ -0,0 +1,170 @@
+"""
+Catalog Index - Posting lists for fast candidate retrieval
+Built when the internship catalog is loaded, patched on incremental updates
+"""
+
+from bisect import bisect_left, insort
+from typing import List, Dict, Optional, Set, TYPE_CHECKING
+
+from geo import location_score, places_within
+
+if TYPE_CHECKING:
+    from records import Internship
+
+# Education hierarchy shared by scoring and indexing
+EDUCATION_LEVELS = {
+    '10th Pass': 1,
+    '12th Pass': 2,
+    'Diploma': 3,
+    "Bachelor's Degree": 4,
+    "Master's Degree": 5
+}
+
+
+def normalize(value: str) -> str:
+    """Normalize a catalog or query value for matching"""
+    return value.lower().strip()
+
+
+def education_level_score(user_level: int, required_level: int) -> float:
+    """Education score (0-100) for two education levels"""
+    # User meets or exceeds requirement
+    if user_level >= required_level:
+        return 100.0
+
+    # Close match (1 level below)
+    if user_level == required_level - 1:
+        return 50.0
+
+    return 0.0
+
+
+class CatalogIndex:
+    """
+    Posting lists keyed by normalized skill, sector, location, gazetteer
+    place and education level. Each posting list holds catalog positions
+    in ascending order, so candidates keep the catalog's original order.
+    Removed postings are None in the catalog list and are not indexed.
+    """
+
+    def __init__(self, internships: List[Optional['Internship']]):
+        self.internships = internships
+
+        self.skill_index: Dict[str, List[int]] = {}
+        self.sector_index: Dict[str, List[int]] = {}
+        self.location_index: Dict[str, List[int]] = {}
+        self.place_index: Dict[int, List[int]] = {}
+        self.education_index: Dict[int, List[int]] = {}
+
+        for position, internship in enumerate(internships):
+            if internship is None:
+                continue
+
+            # A posting listing the same skill twice is indexed once
+            for skill in internship.skill_keys:
+                self.skill_index.setdefault(skill, []).append(position)
+
+            self.sector_index.setdefault(internship.sector_key, []).append(position)
+            self.location_index.setdefault(internship.location_key, []).append(position)
+            if internship.place is not None:
+                self.place_index.setdefault(internship.place.id, []).append(position)
+            self.education_index.setdefault(internship.education_level, []).append(position)
+
+    @staticmethod
+    def _index_keys(internship: 'Internship') -> List[tuple]:
+        """(index name, key) pairs a posting is listed under"""
+        keys = [('skill_index', skill) for skill in internship.skill_keys]
+        keys.append(('sector_index', internship.sector_key))
+        keys.append(('location_index', internship.location_key))
+        if internship.place is not None:
+            keys.append(('place_index', internship.place.id))
+        keys.append(('education_index', internship.education_level))
+        return keys
+
+    def updated(self, internships: List[Optional['Internship']],
+                changes: Dict[int, Optional['Internship']]) -> 'CatalogIndex':
+        """
+        Index for a new catalog list that differs only at `changes`
+
+        `changes` maps each changed position to the posting that used to
+        be there (None for a new position). Only the posting lists of
+        those postings are copied and patched; the rest are shared, so
+        this index stays valid for readers of the old catalog.
+        """
+        index = CatalogIndex.__new__(CatalogIndex)
+        index.internships = internships
+        for name in ('skill_index', 'sector_index', 'location_index', 'place_index', 'education_index'):
+            setattr(index, name, dict(getattr(self, name)))
+
+        copied: Set[tuple] = set()
+
+        def postings(name, key):
+            table = getattr(index, name)
+            if (name, key) not in copied:
+                copied.add((name, key))
+                table[key] = list(table.get(key, ()))
+            return table[key]
+
+        for position, old in changes.items():
+            if old is not None:
+                for name, key in self._index_keys(old):
+                    posting_list = postings(name, key)
+                    at = bisect_left(posting_list, position)
+                    if at < len(posting_list) and posting_list[at] == position:
+                        del posting_list[at]
+                    if not posting_list:
+                        del getattr(index, name)[key]
+                        copied.discard((name, key))
+
+            new = internships[position]
+            if new is not None:
+                for name, key in self._index_keys(new):
+                    insort(postings(name, key), position)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self.internships)
+
+    def candidates(self, education: str, skills: List[str], sector: str, location: str,
+                   weights: Dict[str, float], threshold: float, within_km: float = None) -> List[int]:
+        """
+        Catalog positions that can score above the threshold
+
+        A posting is a candidate if it shares a skill, the sector or a
+        location score with the query. Postings sharing none of these
+        can only earn the remote bonus and the education score, so their
+        education bucket is included only if that upper bound can still
+        pass the threshold. With `within_km` the candidates are just the
+        postings at gazetteer places in range, found through the grid.
+        """
+        if within_km is not None:
+            in_range: Set[int] = set()
+            for place in places_within(normalize(location), within_km):
+                in_range.update(self.place_index.get(place.id, ()))
+            return sorted(in_range)
+
+        positions: Set[int] = set()
+
+        for skill in skills:
+            positions.update(self.skill_index.get(normalize(skill), ()))
+
+        positions.update(self.sector_index.get(normalize(sector), ()))
+
+        # Memoized per (user, posting) location pair
+        user_loc = normalize(location)
+        for intern_loc, postings in self.location_index.items():
+            if location_score(user_loc, intern_loc) > 0:
+                positions.update(postings)
+
+        remote_bonus = 50.0 * weights['location_match']
+        user_level = EDUCATION_LEVELS.get(education, 0)
+        for level, postings in self.education_index.items():
+            best_score = (
+                remote_bonus +
+                education_level_score(user_level, level) * weights['education_match']
+            )
+            if best_score > threshold:
+                positions.update(postings)
+
+        return sorted(positions)
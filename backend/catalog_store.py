@@ -0,0 +1,264 @@
+"""
+Catalog Store - Versioned internship catalog with hot reload
+Serves immutable snapshots; file changes and admin edits publish new ones
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from catalog_index import CatalogIndex
+from records import INTERNSHIP_FIELDS, Internship, from_dicts
+
+logger = logging.getLogger(__name__)
+
+# Rebuild from scratch once this share of positions are removed postings
+COMPACT_RATIO = 0.25
+
+
+class ReadOnlyCatalogError(Exception):
+    """The configured catalog storage cannot be edited in place"""
+
+
+def validate_internship(internship) -> Optional[str]:
+    """Return an error message if a posting cannot be added to the catalog"""
+    if not isinstance(internship, dict):
+        return "Internship must be a JSON object"
+
+    for field in INTERNSHIP_FIELDS:
+        if field not in internship:
+            return f"Missing required field: {field}"
+
+    for field in INTERNSHIP_FIELDS:
+        if field != 'required_skills' and not isinstance(internship[field], str):
+            return f"{field} must be a string"
+
+    skills = internship['required_skills']
+    if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+        return "required_skills must be a list of strings"
+
+    return None
+
+
+class CatalogSnapshot:
+    """
+    One consistent version of the catalog
+
+    Never modified after it is published: a request that takes a snapshot
+    can keep using its postings, index and scorer while newer versions
+    are swapped in. Removed postings stay as None until the next rebuild
+    so positions (and tie order) of the others never shift.
+    """
+
+    def __init__(self, internships: List[Optional[Internship]], index: CatalogIndex, vectorized, version: int,
+                 size: int = None):
+        self.internships = internships
+        self.index = index
+        self.vectorized = vectorized
+        self.version = version
+        self.size = size if size is not None else sum(1 for internship in internships if internship is not None)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self):
+        """Nothing to release for a snapshot in memory (see SqliteSnapshot.close)"""
+
+
+class CatalogStore:
+    """
+    Holds the current CatalogSnapshot for a catalog file
+
+    current() re-reads the file when its modification time changes (checked
+    at most every `reload_interval` seconds; 0 disables hot reload). The
+    rebuild happens on one thread while others keep serving the previous
+    snapshot. upsert() / remove() patch only the affected postings, and
+    with `persist` write the catalog back so other workers reload it.
+    Listeners are called with each newly published snapshot.
+    """
+
+    def __init__(self, data_path: str, scorer_factory: Callable = None,
+                 reload_interval: float = 2.0, persist: bool = True):
+        self.data_path = data_path
+        self.scorer_factory = scorer_factory
+        self.reload_interval = reload_interval
+        self.persist = persist
+
+        self._listeners: List[Callable] = []
+        self._write_lock = threading.Lock()
+        self._checked = time.monotonic()
+        self._mtime = self._file_mtime()
+
+        internships = self._read_file()
+        self.snapshot = self._build(internships, version=1)
+        self._positions = self._id_positions(internships)
+
+    def add_listener(self, listener: Callable):
+        self._listeners.append(listener)
+
+    def current(self) -> CatalogSnapshot:
+        """Latest snapshot, reloading first if the catalog file changed"""
+        if self.reload_interval > 0 and time.monotonic() - self._checked >= self.reload_interval:
+            self._checked = time.monotonic()
+            if self._file_mtime() != self._mtime and self._write_lock.acquire(blocking=False):
+                try:
+                    if self._file_mtime() != self._mtime:
+                        self._reload_locked()
+                except (OSError, ValueError, KeyError) as e:
+                    # Half-written or invalid file: keep serving the last good catalog
+                    logger.warning("Catalog reload from %s failed: %s", self.data_path, e)
+                finally:
+                    self._write_lock.release()
+
+        return self.snapshot
+
+    def reload(self) -> CatalogSnapshot:
+        """Rebuild the catalog from the file now"""
+        with self._write_lock:
+            self._reload_locked()
+        return self.snapshot
+
+    def upsert(self, internships: List[Dict]) -> Dict:
+        """
+        Add postings (validated dicts), or replace those whose id already exists
+
+        Returns counts of added and updated postings.
+        """
+        added = updated = 0
+        with self._write_lock:
+            catalog = list(self.snapshot.internships)
+            changes: Dict[int, Optional[Internship]] = {}
+            positions = dict(self._positions)
+
+            for internship in map(Internship.from_dict, internships):
+                position = positions.get(internship.id)
+                if position is None:
+                    position = len(catalog)
+                    catalog.append(internship)
+                    positions[internship.id] = position
+                    changes[position] = None
+                    added += 1
+                else:
+                    changes.setdefault(position, catalog[position])
+                    catalog[position] = internship
+                    updated += 1
+
+            self._apply(catalog, changes, positions)
+
+        return {"added": added, "updated": updated}
+
+    def remove(self, ids: List[str]) -> Dict:
+        """Remove postings by id; returns how many were removed and which ids were unknown"""
+        with self._write_lock:
+            catalog = list(self.snapshot.internships)
+            changes: Dict[int, Optional[Internship]] = {}
+            positions = dict(self._positions)
+            missing = []
+
+            for internship_id in ids:
+                position = positions.pop(internship_id, None)
+                if position is None:
+                    missing.append(internship_id)
+                    continue
+                changes[position] = catalog[position]
+                catalog[position] = None
+
+            if changes:
+                self._apply(catalog, changes, positions)
+
+        return {"removed": len(changes), "missing": missing}
+
+    def get(self, internship_id: str) -> Optional[Internship]:
+        position = self._positions.get(internship_id)
+        return self.snapshot.internships[position] if position is not None else None
+
+    def stats(self) -> Dict:
+        snapshot = self.snapshot
+        return {
+            "version": snapshot.version,
+            "internships": snapshot.size,
+            "removed_slots": len(snapshot.internships) - snapshot.size
+        }
+
+    def _apply(self, catalog: List[Optional[Internship]], changes: Dict[int, Optional[Internship]],
+               positions: Dict):
+        """Publish a patched catalog (caller holds the write lock)"""
+        old = self.snapshot
+        removed = len(catalog) - len(positions)
+
+        if removed > COMPACT_RATIO * len(catalog):
+            live = [internship for internship in catalog if internship is not None]
+            snapshot = self._build(live, old.version + 1)
+            positions = self._id_positions(live)
+        else:
+            index = old.index.updated(catalog, changes)
+            vectorized = old.vectorized.updated(catalog, changes) if old.vectorized is not None else None
+            snapshot = CatalogSnapshot(catalog, index, vectorized, old.version + 1)
+
+        if self.persist:
+            self._write_file(snapshot.internships)
+
+        self._positions = positions
+        self._publish(snapshot)
+
+    def _reload_locked(self):
+        mtime = self._file_mtime()
+        internships = self._read_file()
+        snapshot = self._build(internships, self.snapshot.version + 1)
+
+        self._positions = self._id_positions(internships)
+        self._mtime = mtime
+        self._publish(snapshot)
+        logger.info("Catalog reloaded from %s: %d internships", self.data_path, snapshot.size)
+
+    def _publish(self, snapshot: CatalogSnapshot):
+        # Single reference assignment: readers see the old or the new snapshot
+        self.snapshot = snapshot
+        for listener in self._listeners:
+            listener(snapshot)
+
+    def _build(self, internships: List[Optional[Internship]], version: int) -> CatalogSnapshot:
+        vectorized = self.scorer_factory(internships) if self.scorer_factory else None
+        return CatalogSnapshot(internships, CatalogIndex(internships), vectorized, version)
+
+    @staticmethod
+    def _id_positions(internships: List[Optional[Internship]]) -> Dict:
+        return {
+            internship.id: position
+            for position, internship in enumerate(internships) if internship is not None
+        }
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.data_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_file(self) -> List[Internship]:
+        """Load internship data from JSON"""
+        with open(self.data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            return from_dicts(data['internships'])
+
+    def _write_file(self, internships: List[Optional[Internship]]):
+        """Write the catalog back atomically, keeping the file's other keys"""
+        with open(self.data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['internships'] = [internship.to_dict() for internship in internships if internship is not None]
+
+        directory = os.path.dirname(os.path.abspath(self.data_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            os.replace(temp_path, self.data_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        # Our own write is already applied; don't reload it
+        self._mtime = self._file_mtime()
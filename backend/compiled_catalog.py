@@ -0,0 +1,358 @@
+"""
+Compiled Catalog - Binary, memory-mapped internship catalog
+Compiled once per host from internships.json; workers map it read-only
+
+Layout: 8-byte magic, 8-byte manifest length, a JSON manifest, then
+64-byte aligned sections described by the manifest:
+    string_offsets / string_data - interned UTF-8 string table
+    fields          - (postings x FIELDS) string ids of the display fields
+    skill_offsets / skill_strings - each posting's required_skills as listed
+    skill_keys, sector_keys, location_keys - string ids of normalized keys
+    skill_counts, sector_ids, location_ids, education_levels, remote
+                    - fixed-width scoring columns
+    skill_bits      - (postings x words) uint64 skill membership bitsets
+
+Compile by hand (from backend/):
+    python compiled_catalog.py data/internships.json data/internships.bin
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from catalog_index import EDUCATION_LEVELS, normalize
+from catalog_store import CatalogSnapshot, ReadOnlyCatalogError
+from records import Internship
+from vectorized_scoring import VectorizedScorer
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'PMICAT01'
+ALIGNMENT = 64
+
+# Display fields stored as string ids, in column order
+FIELDS = (
+    'id', 'title', 'company', 'sector', 'location', 'duration',
+    'stipend', 'education_required', 'description'
+)
+
+
+class _StringTable:
+    """Interns strings; each distinct string is stored once"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.ids)
+        return string_id
+
+    def arrays(self):
+        encoded = [value.encode('utf-8') for value in self.ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+
+def compile_catalog(internships: List[Dict], path: str, source_mtime: int = None):
+    """Write `internships` as a compiled catalog (atomically replaces `path`)"""
+    strings = _StringTable()
+    size = len(internships)
+
+    skill_keys: Dict[str, int] = {}
+    sector_keys: Dict[str, int] = {}
+    location_keys: Dict[str, int] = {}
+
+    fields = np.zeros((size, len(FIELDS)), dtype=np.int32)
+    skill_offsets = np.zeros(size + 1, dtype=np.uint32)
+    skill_strings: List[int] = []
+    skill_counts = np.zeros(size, dtype=np.float64)
+    sector_ids = np.zeros(size, dtype=np.int32)
+    location_ids = np.zeros(size, dtype=np.int32)
+    education_levels = np.zeros(size, dtype=np.int8)
+    remote = np.zeros(size, dtype=bool)
+    skill_rows = []
+
+    for position, internship in enumerate(internships):
+        fields[position] = [strings.add(internship[field]) for field in FIELDS]
+
+        skill_strings.extend(strings.add(skill) for skill in internship['required_skills'])
+        skill_offsets[position + 1] = len(skill_strings)
+        skills = [normalize(s) for s in internship['required_skills']]
+        skill_counts[position] = len(skills)
+        skill_rows.append({skill_keys.setdefault(s, len(skill_keys)) for s in skills})
+
+        sector_ids[position] = sector_keys.setdefault(normalize(internship['sector']), len(sector_keys))
+        location = normalize(internship['location'])
+        location_ids[position] = location_keys.setdefault(location, len(location_keys))
+        remote[position] = 'remote' in location or 'anywhere' in location
+        education_levels[position] = EDUCATION_LEVELS.get(internship['education_required'], 0)
+
+    words = max(1, (len(skill_keys) + 63) // 64)
+    skill_bits = np.zeros((size, words), dtype=np.uint64)
+    for position, columns in enumerate(skill_rows):
+        for column in columns:
+            skill_bits[position, column >> 6] |= np.uint64(1) << np.uint64(column & 63)
+
+    key_sections = {
+        'skill_keys': np.array([strings.add(key) for key in skill_keys], dtype=np.int32),
+        'sector_keys': np.array([strings.add(key) for key in sector_keys], dtype=np.int32),
+        'location_keys': np.array([strings.add(key) for key in location_keys], dtype=np.int32),
+    }
+    string_offsets, string_data = strings.arrays()
+    sections = {
+        'string_offsets': string_offsets,
+        'string_data': string_data,
+        'fields': fields,
+        'skill_offsets': skill_offsets,
+        'skill_strings': np.array(skill_strings, dtype=np.int32),
+        **key_sections,
+        'skill_counts': skill_counts,
+        'sector_ids': sector_ids,
+        'location_ids': location_ids,
+        'education_levels': education_levels,
+        'remote': remote,
+        'skill_bits': skill_bits,
+    }
+
+    manifest = {"postings": size, "source_mtime": source_mtime, "sections": {}}
+    offset = 0
+    for name, array in sections.items():
+        manifest["sections"][name] = {
+            "offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)
+        }
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    encoded = json.dumps(manifest).encode('utf-8')
+    header = len(MAGIC) + 8 + len(encoded)
+    data_start = -(-header // ALIGNMENT) * ALIGNMENT
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC + struct.pack('<Q', len(encoded)) + encoded)
+            f.write(b'\0' * (data_start - header))
+            for name, array in sections.items():
+                f.seek(data_start + manifest["sections"][name]["offset"])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class CompiledCatalog:
+    """Read-only view of a compiled catalog file; arrays point into the mapping"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a compiled catalog")
+        (length,) = struct.unpack_from('<Q', self._map, len(MAGIC))
+        header = len(MAGIC) + 8 + length
+        self.manifest = json.loads(self._map[len(MAGIC) + 8:header])
+        data_start = -(-header // ALIGNMENT) * ALIGNMENT
+
+        for name, section in self.manifest["sections"].items():
+            dtype = np.dtype(section["dtype"])
+            count = int(np.prod(section["shape"], dtype=np.int64))
+            array = np.frombuffer(self._map, dtype=dtype, count=count, offset=data_start + section["offset"])
+            setattr(self, name, array.reshape(section["shape"]))
+
+        self.size = self.manifest["postings"]
+        self._string_data = memoryview(self._map)[data_start + self.manifest["sections"]["string_data"]["offset"]:]
+
+    def string(self, string_id: int) -> str:
+        start, end = int(self.string_offsets[string_id]), int(self.string_offsets[string_id + 1])
+        return bytes(self._string_data[start:end]).decode('utf-8')
+
+    def strings(self, string_ids) -> List[str]:
+        return [self.string(string_id) for string_id in string_ids]
+
+    def internship(self, position: int) -> Internship:
+        """Decode one posting"""
+        internship = dict(zip(FIELDS, self.strings(self.fields[position].tolist())))
+        start, end = int(self.skill_offsets[position]), int(self.skill_offsets[position + 1])
+        internship['required_skills'] = self.strings(self.skill_strings[start:end].tolist())
+        return Internship.from_dict(internship)
+
+
+class CompiledInternships:
+    """Sequence of postings decoded on access"""
+
+    def __init__(self, catalog: CompiledCatalog):
+        self.catalog = catalog
+
+    def __len__(self) -> int:
+        return self.catalog.size
+
+    def __getitem__(self, position: int) -> Internship:
+        if not 0 <= position < self.catalog.size:
+            raise IndexError(position)
+        return self.catalog.internship(position)
+
+
+class CompiledIndex:
+    """Every posting is a candidate; vectorized scoring does the pruning (and within_km)"""
+
+    def __init__(self, size: int):
+        self.positions = np.arange(size)
+
+    def candidates(self, education: str, skills: List[str], sector: str, location: str,
+                   weights: Dict[str, float], threshold: float, within_km: float = None) -> np.ndarray:
+        return self.positions
+
+
+class CompiledScorer(VectorizedScorer):
+    """VectorizedScorer whose columns are views into a compiled catalog"""
+
+    def __init__(self, catalog: CompiledCatalog, weights: Dict[str, float]):
+        self.weights = weights
+        self.catalog = catalog
+
+        # Small per-process lookups (distinct keys only)
+        self.skill_lookup = {key: column for column, key in enumerate(catalog.strings(catalog.skill_keys.tolist()))}
+        self.sector_lookup = {key: sector for sector, key in enumerate(catalog.strings(catalog.sector_keys.tolist()))}
+        self.location_keys = catalog.strings(catalog.location_keys.tolist())
+        self.location_lookup = {key: location for location, key in enumerate(self.location_keys)}
+
+        self.skill_counts = catalog.skill_counts
+        self.sector_ids = catalog.sector_ids
+        self.location_ids = catalog.location_ids
+        self.education_levels = catalog.education_levels
+        self.remote = catalog.remote
+        self.active = np.ones(catalog.size, dtype=bool)
+        self.skill_bits = catalog.skill_bits
+
+    def _skill_columns(self, positions: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """Unpack the requested skill bits for the given postings"""
+        words = self.skill_bits[np.ix_(positions, columns >> 6)]
+        return (words >> (columns & 63).astype(np.uint64)) & np.uint64(1)
+
+    def updated(self, internships, positions):
+        raise ReadOnlyCatalogError("The compiled catalog is read-only")
+
+
+class CompiledCatalogStore:
+    """
+    Catalog served from a compiled file shared by all workers on a host
+
+    The file is (re)compiled from the JSON catalog when missing or older
+    than it, and remapped when another worker replaces it. Edits go to
+    the JSON catalog; the admin update API is not available.
+    """
+
+    def __init__(self, json_path: str, compiled_path: str, weights: Dict[str, float],
+                 reload_interval: float = 2.0):
+        self.json_path = json_path
+        self.compiled_path = compiled_path
+        self.weights = weights
+        self.reload_interval = reload_interval
+
+        self._listeners: List[Callable] = []
+        self._lock = threading.Lock()
+        self._checked = time.monotonic()
+
+        self.snapshot = self._load(version=1)
+
+    def add_listener(self, listener: Callable):
+        self._listeners.append(listener)
+
+    def current(self) -> CatalogSnapshot:
+        """Latest snapshot, recompiling / remapping first if a file changed"""
+        if self.reload_interval > 0 and time.monotonic() - self._checked >= self.reload_interval:
+            self._checked = time.monotonic()
+            if self._changed() and self._lock.acquire(blocking=False):
+                try:
+                    if self._changed():
+                        self._publish(self._load(self.snapshot.version + 1))
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning("Compiled catalog reload failed: %s", e)
+                finally:
+                    self._lock.release()
+
+        return self.snapshot
+
+    def reload(self) -> CatalogSnapshot:
+        with self._lock:
+            self._publish(self._load(self.snapshot.version + 1, force=True))
+        return self.snapshot
+
+    def upsert(self, internships: List[Dict]) -> Dict:
+        raise ReadOnlyCatalogError("The compiled catalog is read-only. Edit the JSON catalog instead.")
+
+    def remove(self, ids: List[str]) -> Dict:
+        raise ReadOnlyCatalogError("The compiled catalog is read-only. Edit the JSON catalog instead.")
+
+    def stats(self) -> Dict:
+        return {"version": self.snapshot.version, "internships": self.snapshot.size, "storage": "compiled"}
+
+    def _changed(self) -> bool:
+        return self._stat(self.compiled_path) != self._mapped_stat or self._stale()
+
+    def _stale(self) -> bool:
+        source = self._stat(self.json_path)
+        return source is not None and source[0] != self._source_mtime
+
+    @staticmethod
+    def _stat(path: str):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_ino
+
+    def _load(self, version: int, force: bool = False) -> CatalogSnapshot:
+        source = self._stat(self.json_path)
+        catalog = None
+        if not force and os.path.exists(self.compiled_path):
+            catalog = CompiledCatalog(self.compiled_path)
+            if source is not None and catalog.manifest.get("source_mtime") != source[0]:
+                catalog = None
+
+        if catalog is None:
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                internships = json.load(f)['internships']
+            compile_catalog(internships, self.compiled_path, source[0] if source else None)
+            catalog = CompiledCatalog(self.compiled_path)
+
+        self._mapped_stat = self._stat(self.compiled_path)
+        self._source_mtime = catalog.manifest.get("source_mtime")
+
+        return CatalogSnapshot(
+            CompiledInternships(catalog),
+            CompiledIndex(catalog.size),
+            CompiledScorer(catalog, self.weights),
+            version,
+            size=catalog.size
+        )
+
+    def _publish(self, snapshot: CatalogSnapshot):
+        self.snapshot = snapshot
+        for listener in self._listeners:
+            listener(snapshot)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Usage: python compiled_catalog.py <internships.json> <internships.bin>", file=sys.stderr)
+        sys.exit(2)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        catalog = json.load(f)['internships']
+    compile_catalog(catalog, sys.argv[2], os.stat(sys.argv[1]).st_mtime_ns)
+    print(f"Compiled {len(catalog)} internships into {sys.argv[2]}", file=sys.stderr)
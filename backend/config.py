@@ -0,0 +1,121 @@
+"""
+Runtime configuration
+Values come from environment variables with safe defaults
+"""
+
+import os
+
+# Scoring backend for recommendations: "python" (default) or "numpy"
+SCORING_BACKEND = os.environ.get('SCORING_BACKEND', 'python').lower()
+
+# Maximum number of profiles accepted by /api/recommend/batch
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', '5000'))
+
+# Recommendation query cache (RECOMMEND_CACHE_SIZE=0 disables it)
+RECOMMEND_CACHE_SIZE = int(os.environ.get('RECOMMEND_CACHE_SIZE', '4096'))
+RECOMMEND_CACHE_TTL = float(os.environ.get('RECOMMEND_CACHE_TTL', '300'))
+RECOMMEND_CACHE_MAX_BYTES = int(os.environ.get('RECOMMEND_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+
+# Paged recommendations: largest page, and the cache of full rankings
+# that later pages are served from
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', '50'))
+RANKED_CACHE_SIZE = int(os.environ.get('RANKED_CACHE_SIZE', '256'))
+RANKED_CACHE_MAX_BYTES = int(os.environ.get('RANKED_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+
+# Cache-Control max-age (seconds) for /api/sectors and /api/skills
+REFERENCE_CACHE_MAX_AGE = int(os.environ.get('REFERENCE_CACHE_MAX_AGE', '300'))
+
+# Document text extraction in worker processes (EXTRACTION_WORKERS=0 runs inline).
+# EXTRACTION_TIMEOUT limits a running job; an upload that waits longer than
+# EXTRACTION_QUEUE_TIMEOUT for a free worker gets 503 instead
+EXTRACTION_WORKERS = int(os.environ.get('EXTRACTION_WORKERS', str(min(4, os.cpu_count() or 1))))
+EXTRACTION_TIMEOUT = float(os.environ.get('EXTRACTION_TIMEOUT', '10'))
+EXTRACTION_QUEUE_TIMEOUT = float(os.environ.get('EXTRACTION_QUEUE_TIMEOUT', '30'))
+PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', '10'))
+MAX_EXTRACTED_CHARS = int(os.environ.get('MAX_EXTRACTED_CHARS', '100000'))
+
+# Parsed resume cache keyed by content hash (RESUME_CACHE_PATH enables a SQLite tier)
+RESUME_CACHE_SIZE = int(os.environ.get('RESUME_CACHE_SIZE', '1024'))
+RESUME_CACHE_PATH = os.environ.get('RESUME_CACHE_PATH', '')
+RESUME_CACHE_DISK_ENTRIES = int(os.environ.get('RESUME_CACHE_DISK_ENTRIES', '50000'))
+
+# Background resume jobs: worker threads, queue depth limit (429 beyond it),
+# how long finished results stay pollable, and the Retry-After hint. Job
+# threads share the extraction pool's EXTRACTION_WORKERS slots with uploads
+# and wait for a free one, so more job threads than that only queue
+RESUME_JOB_WORKERS = int(os.environ.get('RESUME_JOB_WORKERS', str(max(1, EXTRACTION_WORKERS))))
+RESUME_JOB_QUEUE_SIZE = int(os.environ.get('RESUME_JOB_QUEUE_SIZE', '32'))
+RESUME_JOB_TTL = float(os.environ.get('RESUME_JOB_TTL', '600'))
+RESUME_JOB_RETRY_AFTER = int(os.environ.get('RESUME_JOB_RETRY_AFTER', '5'))
+
+# Stop reading PDF pages once a master's degree, contact details and this
+# many skills have been found (0 always reads up to PDF_MAX_PAGES). Skills
+# on the skipped pages are then missing from the result
+RESUME_EARLY_STOP_SKILLS = int(os.environ.get('RESUME_EARLY_STOP_SKILLS', '10'))
+
+# PDF text extraction backend: "auto" (pdfium with pdfplumber fallback),
+# "pdfium" or "pdfplumber"
+PDF_BACKEND = os.environ.get('PDF_BACKEND', 'auto').lower()
+
+# Catalog hot reload: seconds between checks of the catalog file's mtime
+# (0 disables); admin edits are written back to the file unless disabled
+CATALOG_RELOAD_INTERVAL = float(os.environ.get('CATALOG_RELOAD_INTERVAL', '2'))
+CATALOG_PERSIST_UPDATES = os.environ.get('CATALOG_PERSIST_UPDATES', '1') not in ('0', 'false', 'no')
+
+# Token required in the X-Admin-Token header for /api/admin/* (unset disables them)
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+# Catalog storage: "json" (in memory), "sqlite" (CATALOG_DB_PATH, default
+# next to the JSON file; imported from it on first start) or "compiled"
+# (memory-mapped binary, needs SCORING_BACKEND=numpy)
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'json').lower()
+CATALOG_DB_PATH = os.environ.get('CATALOG_DB_PATH', '')
+
+# Compiled catalog for STORAGE_BACKEND=compiled (default next to the JSON
+# file; rebuilt from it when missing or out of date)
+CATALOG_BIN_PATH = os.environ.get('CATALOG_BIN_PATH', '')
+
+# Location scoring: "geo" (gazetteer places, distance decay; unknown
+# places fall back to text) or "text" (exact / substring match only).
+# The score halves every LOCATION_HALF_DISTANCE_KM and is 0 past LOCATION_MAX_KM
+LOCATION_SCORING = os.environ.get('LOCATION_SCORING', 'geo').lower()
+LOCATION_HALF_DISTANCE_KM = float(os.environ.get('LOCATION_HALF_DISTANCE_KM', '50'))
+LOCATION_MAX_KM = float(os.environ.get('LOCATION_MAX_KM', '200'))
+
+# Stage latency histograms and counters on /api/metrics; recent
+# percentiles are estimated over the last METRICS_WINDOW_SECONDS
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') not in ('0', 'false', 'no')
+METRICS_WINDOW_SECONDS = float(os.environ.get('METRICS_WINDOW_SECONDS', '60'))
+
+# Sampling profiler for /api/recommend and /api/resume/upload: the share
+# of requests profiled (0 = only requests sent with "X-Profile: 1" and the
+# admin token), sample interval, and caps on profiled requests per minute,
+# concurrent profiled requests and disk used by PROFILE_DIR
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(os.path.dirname(__file__), 'profiles'))
+PROFILE_INTERVAL_MS = float(os.environ.get('PROFILE_INTERVAL_MS', '5'))
+PROFILE_MAX_PER_MINUTE = int(os.environ.get('PROFILE_MAX_PER_MINUTE', '60'))
+PROFILE_MAX_CONCURRENT = int(os.environ.get('PROFILE_MAX_CONCURRENT', '2'))
+PROFILE_MAX_BYTES = int(os.environ.get('PROFILE_MAX_BYTES', str(64 * 1024 * 1024)))
+
+# Start-up: "eager" builds the catalog and parser at import and warms
+# indexes, PDF/DOCX libraries and extraction workers before /api/health
+# reports healthy; "lazy" builds everything on first use (CLI tools, scripts)
+STARTUP_MODE = os.environ.get('STARTUP_MODE', 'eager').lower()
+
+# Response encoding: JSON_ENCODER "auto" (orjson when installed), "orjson"
+# or "stdlib". Responses of at least COMPRESSION_MIN_BYTES are compressed
+# with the first of COMPRESSION_ENCODINGS ("br", "gzip"; empty disables)
+# the client accepts; br needs the brotli package
+JSON_ENCODER = os.environ.get('JSON_ENCODER', 'auto').lower()
+COMPRESSION_ENCODINGS = [e.strip() for e in os.environ.get('COMPRESSION_ENCODINGS', 'br,gzip').lower().split(',') if e.strip()]
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', '1024'))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', '4'))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', '4'))
+
+# ASGI server (asgi.py): threads that run scoring and text parsing off the
+# event loop, and separate threads for resume uploads. An upload thread mostly
+# waits on an extraction worker, so there is one per worker; uploads beyond
+# that queue without holding up the other routes
+ASGI_EXECUTOR_THREADS = int(os.environ.get('ASGI_EXECUTOR_THREADS', '4'))
+ASGI_UPLOAD_THREADS = int(os.environ.get('ASGI_UPLOAD_THREADS', str(max(1, EXTRACTION_WORKERS))))
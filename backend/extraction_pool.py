@@ -0,0 +1,130 @@
+"""
+Extraction Pool - Runs PDF/DOCX text extraction in worker processes
+Keeps web workers responsive when a document is slow or hostile
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+
+class ExtractionError(Exception):
+    """Base class for jobs the pool could not complete"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """The job ran past its wall-clock limit and was killed"""
+
+
+class ExtractionCancelled(ExtractionError):
+    """The job was cancelled before it produced a result"""
+
+
+class ExtractionBusy(ExtractionError):
+    """Every worker stayed busy for longer than the queue timeout"""
+
+
+class ExtractionPool:
+    """
+    Bounded process pool with a per-job wall-clock timeout
+
+    At most max_workers jobs are handed to the processes at once, so a
+    job's timeout starts when a worker picks it up, not while it waits
+    behind other jobs. A job that finds no free worker within
+    `queue_timeout` seconds fails with ExtractionBusy instead.
+
+    A job that overruns its timeout cannot be interrupted inside a worker,
+    so the pool's processes are terminated and a fresh pool is started
+    for the next job. Jobs that were running on the old pool fail with
+    ExtractionCancelled. With max_workers=0 jobs run inline (no timeout),
+    which suits CLI tools and local debugging. `initializer(*initargs)`
+    runs in every worker process as it starts, including replacements.
+    """
+
+    def __init__(self, max_workers: int, timeout: float, initializer: Callable = None, initargs: tuple = (),
+                 queue_timeout: float = 30.0):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.initializer = initializer
+        self.initargs = initargs
+        self.queue_timeout = queue_timeout
+
+        self._executor = None
+        self._lock = threading.Lock()
+        # One slot per worker process, held from submit until the job's future is done
+        self._slots = threading.BoundedSemaphore(max(max_workers, 1))
+
+    def run(self, func: Callable, *args, timeout: float = None, wait_for_worker: bool = False) -> Any:
+        """
+        Run func(*args) in a worker process and return its result
+
+        With wait_for_worker=True (background jobs) the call waits for a
+        free worker however long it takes instead of raising ExtractionBusy.
+        """
+        if self.max_workers <= 0:
+            return func(*args)
+
+        if not self._slots.acquire(timeout=None if wait_for_worker else self.queue_timeout):
+            raise ExtractionBusy("All file processors are busy. Please retry in a few seconds.")
+
+        executor = self._get_executor()
+        try:
+            future = executor.submit(func, *args)
+        except (BrokenProcessPool, RuntimeError):
+            self._slots.release()
+            raise ExtractionCancelled("Extraction was cancelled because the worker pool restarted. Please retry.")
+        # Released once the worker is free again (or its pool was torn down)
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except FutureTimeoutError:
+            if not future.cancel():
+                # Still running: the only way to stop it is to kill the workers
+                self._recycle(executor)
+            raise ExtractionTimeout(
+                f"Processing the file took longer than {timeout or self.timeout:g} seconds and was stopped"
+            )
+        except BrokenProcessPool:
+            raise ExtractionCancelled("Extraction was cancelled because the worker pool restarted. Please retry.")
+
+    def warm_up(self, timeout: float = None):
+        """
+        Start every worker process now (running the initializer) instead
+        of on the first jobs
+        """
+        if self.max_workers <= 0:
+            return
+
+        # Jobs submitted while no worker is idle each start a new process
+        executor = self._get_executor()
+        futures = [executor.submit(os.getpid) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result(timeout=timeout)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=self.initializer, initargs=self.initargs
+                )
+            return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """Terminate a pool with a stuck job and let the next job start a new one"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+        # ProcessPoolExecutor has no public way to kill a running task
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,229 @@
+"""
+Geo - Offline gazetteer and distance-based location scoring
+Resolves city / state names and aliases to places with coordinates
+
+Location score for two resolved places:
+    same place                      100
+    city inside the other (state)    70
+    two cities d km apart           100 * 0.5 ** (d / LOCATION_HALF_DISTANCE_KM),
+                                    0 beyond LOCATION_MAX_KM
+Anything the gazetteer does not know (e.g. "Remote") falls back to the
+original text rules: exact 100, substring 70.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import config
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.json')
+
+# Grid cell size for the spatial index (degrees; ~111 km of latitude)
+GRID_DEGREES = 1.0
+
+EARTH_RADIUS_KM = 6371.0
+
+LOCATION_SCORING_MODES = ('geo', 'text')
+
+
+def place_key(text: str) -> str:
+    """Normalize a place name or alias for lookup"""
+    return ' '.join(re.sub(r'[^a-z0-9&]+', ' ', text.lower()).split())
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle (haversine) distance"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2 +
+        math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class Place:
+    """A gazetteer city or state"""
+
+    __slots__ = ('id', 'name', 'kind', 'state', 'lat', 'lon')
+
+    def __init__(self, place_id: int, name: str, kind: str, state: str, lat: float, lon: float):
+        self.id = place_id
+        self.name = name
+        self.kind = kind
+        self.state = state
+        self.lat = lat
+        self.lon = lon
+
+    def contains(self, other: 'Place') -> bool:
+        """A state contains its cities"""
+        return self.kind == 'state' and other.kind == 'city' and other.state == self.name
+
+    def distance_to(self, other: 'Place') -> float:
+        return distance_km(self.lat, self.lon, other.lat, other.lon)
+
+
+class Gazetteer:
+    """
+    Indian cities and states with aliases, plus a grid index of cities
+
+    Names resolve case-insensitively; when a name is both a city and a
+    state / union territory (Delhi, Chandigarh, Puducherry) the city wins.
+    """
+
+    def __init__(self, path: str = GAZETTEER_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.places: List[Place] = []
+        self.names: Dict[str, Place] = {}
+        self.states: Dict[str, Place] = {}
+        self.cities_by_state: Dict[str, List[Place]] = {}
+        self.grid: Dict[Tuple[int, int], List[Place]] = {}
+
+        for kind, entries in (('state', data['states']), ('city', data['cities'])):
+            for entry in entries:
+                state = entry['name'] if kind == 'state' else entry['state']
+                place = Place(len(self.places), entry['name'], kind, state, entry['lat'], entry['lon'])
+                self.places.append(place)
+
+                # Cities are added after states, so a shared name maps to the city
+                for name in [entry['name']] + entry.get('aliases', []):
+                    self.names[place_key(name)] = place
+
+                if kind == 'state':
+                    self.states[place.name] = place
+                else:
+                    self.cities_by_state.setdefault(state, []).append(place)
+                    self.grid.setdefault(self._cell(place.lat, place.lon), []).append(place)
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / GRID_DEGREES)), int(math.floor(lon / GRID_DEGREES))
+
+    def resolve(self, text: str) -> Optional[Place]:
+        """
+        Place for a free-text location, or None
+
+        Tries the whole text, then each comma / slash / dash separated
+        part ("Pune, Maharashtra"), preferring a city over a state.
+        """
+        place = self.names.get(place_key(text))
+        if place is not None:
+            return place
+
+        found = [self.names.get(place_key(part)) for part in re.split(r'[,/|()]| - ', text)]
+        found = [place for place in found if place is not None]
+        for place in found:
+            if place.kind == 'city':
+                return place
+        return found[0] if found else None
+
+    def cities_within(self, place: Place, km: float) -> List[Place]:
+        """Cities within `km` of a city, from the grid cells the radius overlaps"""
+        lat_span = km / 111.0
+        lon_span = km / max(111.0 * math.cos(math.radians(place.lat)), 1e-6)
+        low = self._cell(place.lat - lat_span, place.lon - lon_span)
+        high = self._cell(place.lat + lat_span, place.lon + lon_span)
+
+        cities = []
+        for lat_cell in range(low[0], high[0] + 1):
+            for lon_cell in range(low[1], high[1] + 1):
+                for city in self.grid.get((lat_cell, lon_cell), ()):
+                    if place.distance_to(city) <= km:
+                        cities.append(city)
+        return cities
+
+    def nearby(self, place: Place, km: float) -> List[Place]:
+        """Places within `km` of a place: a state covers its own cities"""
+        if place.kind == 'state':
+            return [place] + self.cities_by_state.get(place.name, [])
+        return self.cities_within(place, km)
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """The bundled gazetteer, loaded on first use"""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer()
+    return _gazetteer
+
+
+@lru_cache(maxsize=65536)
+def resolve(location: str) -> Optional[Place]:
+    """Memoized Gazetteer.resolve for normalized location strings"""
+    return get_gazetteer().resolve(location)
+
+
+def text_location_score(user_loc: str, intern_loc: str) -> float:
+    """Original rules on normalized strings: exact 100, substring 70"""
+    if user_loc == intern_loc:
+        return 100.0
+
+    # Partial match (city in state or vice versa)
+    if user_loc in intern_loc or intern_loc in user_loc:
+        return 70.0
+
+    return 0.0
+
+
+@lru_cache(maxsize=65536)
+def _geo_location_score(user_loc: str, intern_loc: str) -> float:
+    user_place, intern_place = resolve(user_loc), resolve(intern_loc)
+    if user_place is None or intern_place is None:
+        return text_location_score(user_loc, intern_loc)
+
+    if user_place is intern_place:
+        return 100.0
+
+    if user_place.contains(intern_place) or intern_place.contains(user_place):
+        return 70.0
+
+    if user_place.kind == 'city' and intern_place.kind == 'city':
+        distance = user_place.distance_to(intern_place)
+        if distance <= config.LOCATION_MAX_KM:
+            return 100.0 * 0.5 ** (distance / config.LOCATION_HALF_DISTANCE_KM)
+
+    return 0.0
+
+
+def location_score(user_loc: str, intern_loc: str) -> float:
+    """
+    Location score (0-100) for two normalized locations, before the
+    remote bonus (which callers apply when this is 0)
+    """
+    if config.LOCATION_SCORING == 'text':
+        return text_location_score(user_loc, intern_loc)
+    return _geo_location_score(user_loc, intern_loc)
+
+
+@lru_cache(maxsize=65536)
+def within(user_loc: str, intern_loc: str, km: float) -> bool:
+    """True if a posting's location is within `km` of the user's (both resolved)"""
+    user_place, intern_place = resolve(user_loc), resolve(intern_loc)
+    if user_place is None or intern_place is None:
+        return False
+
+    if user_place is intern_place or user_place.contains(intern_place):
+        return True
+    if user_place.kind == 'city' and intern_place.kind == 'city':
+        return user_place.distance_to(intern_place) <= km
+    return False
+
+
+def places_within(user_loc: str, km: float) -> List[Place]:
+    """Gazetteer places that within() accepts for a user location"""
+    user_place = resolve(user_loc)
+    if user_place is None:
+        return []
+    return get_gazetteer().nearby(user_place, km)
@@ -0,0 +1,272 @@
+"""
+Metrics - Lightweight counters and latency histograms
+Rendered in the Prometheus text format on /api/metrics
+
+Histograms keep cumulative buckets (what Prometheus scrapes) plus the
+same buckets over a rolling window, from which recent p50 / p95 / p99
+are estimated. Recording is a bisect and a few additions under a lock.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import config
+
+# Upper bounds (seconds) of the latency buckets
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Rolling window: this many slots, each covering window / slots seconds
+WINDOW_SLOTS = 6
+
+WINDOW_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(names: Sequence[str], values: Sequence, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label combination"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1):
+        if not config.METRICS_ENABLED:
+            return
+        with self._lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def value(self, *label_values) -> float:
+        return self.values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self.values.items())
+        lines += [f"{self.name}{_label_text(self.label_names, labels)} {_number(value)}" for labels, value in items]
+        return lines
+
+
+class _Series:
+    """Bucket counts for one label combination, lifetime and per window slot"""
+
+    __slots__ = ('counts', 'sum', 'count', 'slot_ids', 'slot_counts')
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.slot_ids = [-1] * WINDOW_SLOTS
+        self.slot_counts = [[0] * (buckets + 1) for _ in range(WINDOW_SLOTS)]
+
+
+class Histogram:
+    """Latency distribution per label combination"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.series: Dict[Tuple, _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, *label_values):
+        if not config.METRICS_ENABLED:
+            return
+        bucket = bisect_left(self.buckets, seconds)
+        slot_id = int(time.monotonic() * WINDOW_SLOTS // config.METRICS_WINDOW_SECONDS)
+        slot = slot_id % WINDOW_SLOTS
+
+        with self._lock:
+            series = self.series.get(label_values)
+            if series is None:
+                series = self.series[label_values] = _Series(len(self.buckets))
+            series.counts[bucket] += 1
+            series.sum += seconds
+            series.count += 1
+            if series.slot_ids[slot] != slot_id:
+                series.slot_ids[slot] = slot_id
+                series.slot_counts[slot] = [0] * (len(self.buckets) + 1)
+            series.slot_counts[slot][bucket] += 1
+
+    def window_counts(self, *label_values) -> List[int]:
+        """Bucket counts (not cumulative) over the rolling window"""
+        oldest = int(time.monotonic() * WINDOW_SLOTS // config.METRICS_WINDOW_SECONDS) - WINDOW_SLOTS + 1
+        counts = [0] * (len(self.buckets) + 1)
+        with self._lock:
+            series = self.series.get(label_values)
+            if series is None:
+                return counts
+            for slot_id, slot_counts in zip(series.slot_ids, series.slot_counts):
+                if slot_id >= oldest:
+                    counts = [a + b for a, b in zip(counts, slot_counts)]
+        return counts
+
+    def quantile(self, fraction: float, counts: List[int]) -> float:
+        """Estimate from bucket counts, interpolating inside the bucket"""
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = fraction * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                low = self.buckets[index - 1] if index else 0.0
+                return low + (self.buckets[index] - low) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(
+                (labels, list(series.counts), series.sum, series.count)
+                for labels, series in self.series.items()
+            )
+
+        for labels, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_label_text(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_label_text(self.label_names, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_label_text(self.label_names, labels)} {count}")
+
+        window = f"{self.name}_window"
+        lines += [
+            f"# HELP {window} {self.help} (estimated over the last {config.METRICS_WINDOW_SECONDS:g}s)",
+            f"# TYPE {window} gauge"
+        ]
+        for labels, *_ in items:
+            counts = self.window_counts(*labels)
+            for fraction in WINDOW_QUANTILES:
+                quantile = f'quantile="{fraction:g}"'
+                lines.append(
+                    f"{window}{_label_text(self.label_names, labels, quantile)}"
+                    f" {_number(self.quantile(fraction, counts))}"
+                )
+        return lines
+
+
+class Collected:
+    """Values read from a callback at scrape time (sizes, existing stats)"""
+
+    def __init__(self, name: str, help_text: str, kind: str, callback: Callable,
+                 labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.kind = kind
+        self.label_names = tuple(labels)
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        values = self.callback()
+        if not isinstance(values, dict):
+            values = {(): values}
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines += [
+            f"{self.name}{_label_text(self.label_names, labels)} {_number(value)}"
+            for labels, value in sorted(values.items())
+        ]
+        return lines
+
+
+class StageTimer:
+    """
+    Times consecutive stages of one request into a histogram
+
+    stage(name) records the time since the previous stage (or the start);
+    done() records the whole request as stage "total".
+    """
+
+    __slots__ = ('histogram', 'route', 'started', 'last')
+
+    def __init__(self, histogram: Histogram, route: str):
+        self.histogram = histogram
+        self.route = route
+        self.started = self.last = time.perf_counter()
+
+    def stage(self, name: str, nested: Dict[str, float] = None):
+        """
+        End stage `name`; `nested` gives sub-stages timed elsewhere (e.g.
+        in a worker process), in seconds, which are recorded under their
+        own names and taken out of this stage
+        """
+        now = time.perf_counter()
+        elapsed = now - self.last
+        for nested_name, seconds in (nested or {}).items():
+            self.histogram.observe(seconds, self.route, nested_name)
+            elapsed -= seconds
+        self.histogram.observe(max(elapsed, 0.0), self.route, name)
+        self.last = now
+
+    def done(self):
+        self.histogram.observe(time.perf_counter() - self.started, self.route, 'total')
+
+
+class Registry:
+    """Metrics in registration order"""
+
+    def __init__(self):
+        self.metrics = []
+        self._names = set()
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._names:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._names.add(metric.name)
+            self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self.metrics):
+            lines += metric.render()
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+# Shared by the API routes and the recommendation engine
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'pmi_stage_seconds', 'Time spent in each stage of a request', ('route', 'stage')
+))
+EXCEPTIONS = REGISTRY.register(Counter(
+    'pmi_exceptions_total', 'Errors caught and turned into an error response', ('where',)
+))
+CANDIDATES_SCORED = REGISTRY.register(Counter(
+    'pmi_candidates_scored_total', 'Catalog postings scored by the recommendation engine'
+))
+
+
+def timer(route: str) -> StageTimer:
+    return StageTimer(STAGE_SECONDS, route)
@@ -0,0 +1,218 @@
+"""
+Profiling - Opt-in stack sampling of live requests
+Writes collapsed stacks (flamegraph.pl / speedscope input) to a local directory
+
+A profiled request registers its thread; one background thread samples
+the stacks of registered threads every PROFILE_INTERVAL_MS and counts
+them per route. Counts are merged into one file per route and hour,
+e.g. profiles/upload_resume-20240101-13.collapsed:
+
+    backend/app.py:upload_resume:489;backend/app.py:process_resume_file:310;... 12
+
+Unprofiled requests pay one dictionary lookup. Overhead is capped by
+the sampling rate, a per-minute budget and a concurrency limit, and
+disk use by deleting the oldest files beyond PROFILE_MAX_BYTES.
+"""
+
+import atexit
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+import config
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per sample, innermost first
+MAX_STACK_DEPTH = 128
+
+# Seconds between writes of the aggregated stacks
+FLUSH_INTERVAL = 10.0
+
+PROFILED_REQUESTS = metrics.REGISTRY.register(metrics.Counter(
+    'pmi_profiled_requests_total', 'Requests run under the sampling profiler', ('route', 'reason')
+))
+PROFILE_SAMPLES = metrics.REGISTRY.register(metrics.Counter(
+    'pmi_profile_samples_total', 'Stack samples taken by the sampling profiler', ('route',)
+))
+
+
+def collapse(frame, depth: int = MAX_STACK_DEPTH) -> str:
+    """One stack as root-first "dir/file:function:line" frames joined by ';'"""
+    names = []
+    while frame is not None and len(names) < depth:
+        code = frame.f_code
+        directory, filename = os.path.split(code.co_filename)
+        names.append(f"{os.path.basename(directory)}/{filename}:{code.co_name}:{code.co_firstlineno}")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler:
+    """
+    Samples registered request threads and aggregates their stacks
+
+    begin() / end() are called on the request thread; sampling and
+    writing happen on the sampler thread, started on first use.
+    """
+
+    def __init__(self, directory: str, interval: float, max_bytes: int,
+                 max_per_minute: int, max_concurrent: int):
+        self.directory = directory
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self.max_per_minute = max_per_minute
+        self.max_concurrent = max_concurrent
+
+        self.active: Dict[int, str] = {}
+        self.stacks: Dict[Tuple[str, str], Counter] = {}
+        self.dirty = set()
+        self._started_minute = (0, 0)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._flushed = time.monotonic()
+
+    def begin(self, route: str, forced: bool = False) -> bool:
+        """
+        Start profiling the calling thread's request if the budget allows
+
+        Returns whether it was started; end() must then be called.
+        """
+        minute = int(time.monotonic() // 60)
+        with self._lock:
+            started_minute, started = self._started_minute
+            if started_minute != minute:
+                started = 0
+            if len(self.active) >= self.max_concurrent or (not forced and started >= self.max_per_minute):
+                return False
+            # Admin requests are not counted against the sampled budget
+            self._started_minute = (minute, started + (not forced))
+            self.active[threading.get_ident()] = route
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._thread.start()
+
+        PROFILED_REQUESTS.inc(route, 'admin' if forced else 'sampled')
+        self._wake.set()
+        return True
+
+    def end(self):
+        with self._lock:
+            self.active.pop(threading.get_ident(), None)
+
+    def _run(self):
+        while True:
+            if not self.active:
+                self._flush_if_due(force=True)
+                self._wake.wait(FLUSH_INTERVAL)
+                self._wake.clear()
+                continue
+
+            self._sample()
+            self._flush_if_due()
+            time.sleep(self.interval)
+
+    def _sample(self):
+        frames = sys._current_frames()
+        hour = time.strftime('%Y%m%d-%H')
+        with self._lock:
+            for thread_id, route in self.active.items():
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                key = (route, hour)
+                self.stacks.setdefault(key, Counter())[collapse(frame)] += 1
+                self.dirty.add(key)
+                PROFILE_SAMPLES.inc(route)
+
+    def _flush_if_due(self, force: bool = False):
+        if not self.dirty or (not force and time.monotonic() - self._flushed < FLUSH_INTERVAL):
+            return
+        self._flushed = time.monotonic()
+        try:
+            self.flush()
+        except OSError as e:
+            logger.warning("Writing profiles to %s failed: %s", self.directory, e)
+
+    def flush(self):
+        """Write the stacks gathered since the last flush, then prune old files"""
+        hour = time.strftime('%Y%m%d-%H')
+        with self._lock:
+            dirty, self.dirty = self.dirty, set()
+            snapshots = {key: Counter(self.stacks[key]) for key in dirty}
+            # Earlier hours are complete once written
+            for key in [key for key in self.stacks if key[1] != hour]:
+                del self.stacks[key]
+
+        os.makedirs(self.directory, exist_ok=True)
+        for (route, key_hour), stacks in snapshots.items():
+            path = os.path.join(self.directory, f"{route}-{key_hour}.collapsed")
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+        self.prune()
+
+    def prune(self):
+        """Delete the oldest profile files until the directory fits max_bytes"""
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.collapsed'):
+                stat = os.stat(os.path.join(self.directory, name))
+                files.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.unlink(os.path.join(self.directory, name))
+            total -= size
+            logger.info("Deleted profile %s to stay under %d bytes", name, self.max_bytes)
+
+
+_sampler: Optional[StackSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler() -> StackSampler:
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                _sampler = StackSampler(
+                    config.PROFILE_DIR,
+                    interval=config.PROFILE_INTERVAL_MS / 1000,
+                    max_bytes=config.PROFILE_MAX_BYTES,
+                    max_per_minute=config.PROFILE_MAX_PER_MINUTE,
+                    max_concurrent=config.PROFILE_MAX_CONCURRENT
+                )
+                atexit.register(_sampler._flush_if_due, force=True)
+    return _sampler
+
+
+def start_request(route: str, forced: bool = False) -> bool:
+    """
+    Profile this request if forced (admin header) or picked by
+    PROFILE_SAMPLE_RATE; returns whether stop_request() is needed
+    """
+    if not forced and (config.PROFILE_SAMPLE_RATE <= 0 or random.random() >= config.PROFILE_SAMPLE_RATE):
+        return False
+    return get_sampler().begin(route, forced)
+
+
+def stop_request():
+    get_sampler().end()
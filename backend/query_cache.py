@@ -0,0 +1,120 @@
+"""
+Query Cache - In-process LRU cache with TTL and a memory bound
+Used in front of recommendation and parsing hot paths
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+def _encode(value: Any):
+    """JSON fallback for records (anything with to_dict) and other objects"""
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if to_dict is not None else str(value)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory cost of a cached value (its JSON size in bytes)"""
+    return len(json.dumps(value, ensure_ascii=False, default=_encode))
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache
+
+    Entries expire after `ttl` seconds and the least recently used
+    entries are evicted once either `max_entries` or `max_bytes` would be
+    exceeded. A `max_entries` of 0 disables caching.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if self.ttl and expires_at < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: Optional[int] = None):
+        """Store a value, evicting least recently used entries as needed"""
+        if not self.enabled:
+            return
+
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            while self._entries and (
+                len(self._entries) >= self.max_entries or self._bytes + size > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+            self._entries[key] = (value, size, time.monotonic() + self.ttl)
+            self._bytes += size
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Counters and current usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
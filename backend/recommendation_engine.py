@@ -3,13 +3,123 @@ Explainable AI Recommendation Engine
 Uses transparent scoring - NO black-box models
 """
 
+import base64
+import hashlib
+import heapq
 import json
-from typing import List, Dict
+from contextlib import closing
+from operator import itemgetter
+from typing import List, Dict, Iterator, Tuple, Optional
 import os
 
+import config
+import metrics
+from catalog_index import EDUCATION_LEVELS, education_level_score, normalize
+from catalog_store import CatalogSnapshot, CatalogStore
+from geo import LOCATION_SCORING_MODES, location_score as geo_location_score, resolve as resolve_location, within as location_within
+from query_cache import QueryCache
+from records import SECTORS, Internship, Recommendation, RecommendationPage
+
+# Basic relevance threshold and result size
+RELEVANCE_THRESHOLD = 20
+MAX_RECOMMENDATIONS = 5
+
+SCORING_BACKENDS = ('python', 'numpy')
+
+# Where the catalog lives: parsed JSON in memory, a SQLite database, or a
+# compiled binary file memory-mapped by every worker
+STORAGE_BACKENDS = ('json', 'sqlite', 'compiled')
+
+# Fields every applicant profile must provide
+PROFILE_FIELDS = ('education', 'skills', 'sector', 'location')
+
+# Upper bound on (profiles x postings) cells scored per NumPy batch
+BATCH_CELLS = 2_000_000
+
+# Approximate memory per row of a cached ranking (score tuple + floats)
+RANKED_ROW_BYTES = 200
+
+
+class CursorError(ValueError):
+    """A page cursor that is malformed or belongs to another query"""
+
+
+class CursorExpired(Exception):
+    """The catalog changed since a page cursor was issued"""
+
+
+def validate_profile(profile) -> Optional[str]:
+    """Return an error message if a profile cannot be scored"""
+    if not isinstance(profile, dict):
+        return "Profile must be a JSON object"
+    
+    for field in PROFILE_FIELDS:
+        if field not in profile:
+            return f"Missing required field: {field}"
+    
+    # Every field is normalized for the cache key and scoring
+    for field in ('education', 'sector', 'location'):
+        if not isinstance(profile[field], str):
+            return f"{field} must be a string"
+    skills = profile['skills']
+    if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+        return "skills must be a list of strings"
+    
+    # Optional "within_km": only postings within that distance
+    within_km = profile.get('within_km')
+    if within_km is not None:
+        if type(within_km) not in (int, float) or within_km <= 0:
+            return "within_km must be a positive number"
+        if config.LOCATION_SCORING != 'geo':
+            return "within_km needs LOCATION_SCORING=geo"
+        if resolve_location(normalize(profile['location'])) is None:
+            return f"Unknown location for within_km: {profile['location']}"
+    
+    return None
+
+
+def profile_key(education: str, skills: List[str], sector: str, location: str, within_km: float = None) -> Tuple:
+    """
+    Canonical form of a profile
+    
+    Profiles with the same key always get the same recommendations:
+    matching is case-insensitive and ignores skill order, but repeated
+    skills still count and education levels are matched exactly.
+    """
+    key = (
+        education,
+        tuple(sorted(normalize(s) for s in skills)),
+        normalize(sector),
+        normalize(location)
+    )
+    return key if within_km is None else key + (float(within_km),)
+
+def query_fingerprint(key: Tuple, min_score: float) -> str:
+    """Short hash binding a cursor to one profile key and min_score"""
+    return hashlib.sha256(repr((key, float(min_score))).encode('utf-8')).hexdigest()[:16]
+
+
+def encode_cursor(version: int, fingerprint: str, offset: int) -> str:
+    """Opaque page cursor: catalog version, query fingerprint, next offset"""
+    payload = json.dumps([version, fingerprint, offset], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str, int]:
+    """Inverse of encode_cursor; raises CursorError if it cannot be read"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        version, fingerprint, offset = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError, AttributeError, UnicodeError):
+        raise CursorError("Invalid cursor")
+    
+    if not isinstance(version, int) or not isinstance(fingerprint, str) or not isinstance(offset, int) or offset < 0:
+        raise CursorError("Invalid cursor")
+    return version, fingerprint, offset
+
 class RecommendationEngine:
-    def __init__(self):
-        self.internships = self._load_internships()
+    def __init__(self, data_path: str = None, scoring_backend: str = None, storage_backend: str = None):
+        self.data_path = data_path or os.path.join(os.path.dirname(__file__), 'data', 'internships.json')
         
         # Scoring weights (transparent and explainable)
         self.weights = {
@@ -18,92 +128,383 @@ class RecommendationEngine:
             'location_match': 0.20,   # 20% - Medium importance
             'education_match': 0.10   # 10% - Low importance
         }
+        
+        # Scoring backend: per-internship Python helpers or NumPy columns
+        self.scoring_backend = (scoring_backend or config.SCORING_BACKEND).lower()
+        if self.scoring_backend not in SCORING_BACKENDS:
+            raise ValueError(f"Unknown scoring backend: {self.scoring_backend}")
+        
+        self.storage_backend = (storage_backend or config.STORAGE_BACKEND).lower()
+        if self.storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {self.storage_backend}")
+        
+        if config.LOCATION_SCORING not in LOCATION_SCORING_MODES:
+            raise ValueError(f"Unknown location scoring mode: {config.LOCATION_SCORING}")
+        
+        if self.storage_backend == 'sqlite':
+            if self.scoring_backend == 'numpy':
+                raise ValueError("The numpy scoring backend needs the json storage backend")
+            
+            # Pre-filtering runs in SQL; only candidate rows are loaded
+            from catalog_db import SqliteCatalogStore
+            self.catalog = SqliteCatalogStore(
+                config.CATALOG_DB_PATH or os.path.splitext(self.data_path)[0] + '.db',
+                json_path=self.data_path
+            )
+        elif self.storage_backend == 'compiled':
+            if self.scoring_backend != 'numpy':
+                raise ValueError("The compiled storage backend needs the numpy scoring backend")
+            
+            # Scoring reads the mapped columns directly; one copy per host
+            try:
+                from compiled_catalog import CompiledCatalogStore
+            except ImportError:
+                raise Exception("numpy not installed. Run: pip install numpy")
+            self.catalog = CompiledCatalogStore(
+                self.data_path,
+                config.CATALOG_BIN_PATH or os.path.splitext(self.data_path)[0] + '.bin',
+                self.weights,
+                reload_interval=config.CATALOG_RELOAD_INTERVAL
+            )
+        else:
+            # Catalog snapshots (postings, posting lists, NumPy columns);
+            # hot-reloaded when the file changes, patched by admin updates
+            self.catalog = CatalogStore(
+                self.data_path,
+                scorer_factory=self._load_vectorized_scorer if self.scoring_backend == 'numpy' else None,
+                reload_interval=config.CATALOG_RELOAD_INTERVAL,
+                persist=config.CATALOG_PERSIST_UPDATES
+            )
+        
+        # Results keyed on (catalog version, canonical profile); a catalog
+        # change bumps the version and clears the cache
+        self.cache = QueryCache(
+            max_entries=config.RECOMMEND_CACHE_SIZE,
+            ttl=config.RECOMMEND_CACHE_TTL,
+            max_bytes=config.RECOMMEND_CACHE_MAX_BYTES
+        )
+        
+        # Full rankings for paged requests, keyed on (catalog version,
+        # canonical profile, min_score); pages are slices of them
+        self.ranked_cache = QueryCache(
+            max_entries=config.RANKED_CACHE_SIZE,
+            ttl=config.RECOMMEND_CACHE_TTL,
+            max_bytes=config.RANKED_CACHE_MAX_BYTES
+        )
+        self.catalog.add_listener(lambda snapshot: self.clear_caches())
     
-    def _load_internships(self) -> List[Dict]:
-        """Load internship data from JSON"""
-        data_path = os.path.join(os.path.dirname(__file__), 'data', 'internships.json')
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['internships']
+    @property
+    def internships(self) -> List[Optional[Internship]]:
+        """Postings of the current snapshot (with SQLite: only rows loaded so far)"""
+        return self.catalog.snapshot.internships
     
-    def _calculate_skill_match(self, user_skills: List[str], internship_skills: List[str]) -> float:
-        """Calculate skill matching score (0-100)"""
-        if not user_skills or not internship_skills:
-            return 0.0
+    @property
+    def catalog_version(self) -> int:
+        return self.catalog.snapshot.version
+    
+    def reload(self):
+        """Reload the catalog from disk and invalidate cached results"""
+        self.catalog.reload()
+    
+    def clear_caches(self):
+        self.cache.clear()
+        self.ranked_cache.clear()
+    
+    def _load_vectorized_scorer(self, internships: List[Optional[Internship]]):
+        """Compile the catalog into NumPy columns (NumPy backend only)"""
+        try:
+            from vectorized_scoring import VectorizedScorer
+        except ImportError:
+            raise Exception("numpy not installed. Run: pip install numpy")
         
-        # Convert to lowercase for case-insensitive matching
-        user_skills_lower = [s.lower().strip() for s in user_skills]
-        internship_skills_lower = [s.lower().strip() for s in internship_skills]
+        return VectorizedScorer(internships, self.weights)
+    
+    def _calculate_skill_match(self, user_skills: List[str], internship: Internship) -> float:
+        """Calculate skill matching score (0-100) from normalized user skills"""
+        if not user_skills or not internship.skill_count:
+            return 0.0
         
-        # Count matches
-        matches = sum(1 for skill in user_skills_lower if skill in internship_skills_lower)
+        # Count matches (case-insensitive: both sides are normalized)
+        matches = sum(1 for skill in user_skills if skill in internship.skill_keys)
         
-        # Calculate percentage
-        score = (matches / len(internship_skills_lower)) * 100
+        # Calculate percentage of the skills as listed
+        score = (matches / internship.skill_count) * 100
         return min(score, 100)  # Cap at 100
     
-    def _calculate_sector_match(self, user_sector: str, internship_sector: str) -> float:
+    def _calculate_sector_match(self, user_sector_code: int, internship: Internship) -> float:
         """Calculate sector matching score (0 or 100)"""
-        if user_sector.lower().strip() == internship_sector.lower().strip():
+        if user_sector_code == internship.sector_code:
             return 100.0
         return 0.0
     
-    def _calculate_location_match(self, user_location: str, internship_location: str) -> float:
-        """Calculate location matching score with partial matching"""
-        user_loc = user_location.lower().strip()
-        intern_loc = internship_location.lower().strip()
-        
-        # Exact match
-        if user_loc == intern_loc:
-            return 100.0
-        
-        # Partial match (city in state or vice versa)
-        if user_loc in intern_loc or intern_loc in user_loc:
-            return 70.0
+    def _calculate_location_match(self, user_loc: str, internship: Internship) -> float:
+        """Calculate location matching score (same place, city in state, distance decay)"""
+        score = geo_location_score(user_loc, internship.location_key)
         
         # Remote work bonus
-        if 'remote' in intern_loc or 'anywhere' in intern_loc:
+        if score == 0.0 and internship.remote:
             return 50.0
         
-        return 0.0
+        return score
     
-    def _calculate_education_match(self, user_education: str, required_education: str) -> float:
+    def _calculate_education_match(self, user_level: int, internship: Internship) -> float:
         """Calculate education matching score"""
-        education_levels = {
-            '10th Pass': 1,
-            '12th Pass': 2,
-            'Diploma': 3,
-            "Bachelor's Degree": 4,
-            "Master's Degree": 5
-        }
+        return education_level_score(user_level, internship.education_level)
+    
+    def recommend(self, education: str, skills: List[str], sector: str, location: str,
+                  within_km: float = None) -> List[Recommendation]:
+        """
+        Generate TOP 3-5 internship recommendations
         
-        user_level = education_levels.get(user_education, 0)
-        required_level = education_levels.get(required_education, 0)
+        Returns list of internships with scores and explanations (use
+        records.serialize for the response shape). With `within_km` only
+        postings that close to the user's location are considered.
+        Results may come from the query cache and must not be modified.
+        """
+        timer = metrics.timer('recommend')
         
-        # User meets or exceeds requirement
-        if user_level >= required_level:
-            return 100.0
+        # One snapshot for the whole request, even if the catalog changes
+        # (closing it ends the SQLite backend's read transaction)
+        with closing(self.catalog.current()) as snapshot:
+            cache_key = None
+            if self.cache.enabled:
+                cache_key = (snapshot.version, profile_key(education, skills, sector, location, within_km))
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    timer.stage('cache')
+                    timer.done()
+                    return cached
+            timer.stage('cache')
+            
+            # Only score postings that share a signal with the query or can
+            # still pass the relevance threshold; candidates keep catalog order
+            candidates = snapshot.index.candidates(
+                education, skills, sector, location, self.weights, RELEVANCE_THRESHOLD, within_km
+            )
+            timer.stage('candidates')
+            
+            top = self._select_top(
+                snapshot, candidates, education, skills, sector, location, MAX_RECOMMENDATIONS, within_km
+            )
+            timer.stage('score')
+            
+            # Build result dicts and explanations only for the survivors
+            results = [self._build_result(snapshot, *scores) for scores in top]
+            
+            if cache_key is not None:
+                self.cache.set(cache_key, results)
+            timer.stage('build')
+            timer.done()
+            
+            return results
+    
+    def recommend_page(self, education: str, skills: List[str], sector: str, location: str,
+                       limit: int = MAX_RECOMMENDATIONS, offset: int = 0,
+                       min_score: float = RELEVANCE_THRESHOLD, cursor: str = None,
+                       within_km: float = None) -> RecommendationPage:
+        """
+        One page of the full ranking for a profile
         
-        # Close match (1 level below)
-        if user_level == required_level - 1:
-            return 50.0
+        Every posting scoring above `min_score` is ranked in the order
+        recommend() uses, once per catalog version, profile and min_score;
+        that ranking is cached, so deeper pages are slices of it instead
+        of a fresh scoring pass. A `cursor` from the previous page
+        replaces `offset`; it raises CursorExpired once the catalog has
+        changed, since positions in the old ranking no longer apply.
+        """
+        timer = metrics.timer('recommend_page')
+        key = profile_key(education, skills, sector, location, within_km)
+        fingerprint = query_fingerprint(key, min_score)
+        with closing(self.catalog.current()) as snapshot:
+            if cursor is not None:
+                version, cursor_fingerprint, offset = decode_cursor(cursor)
+                if cursor_fingerprint != fingerprint:
+                    raise CursorError("Cursor does not belong to this query")
+                if version != snapshot.version:
+                    raise CursorExpired("The catalog has changed. Request the first page again.")
+            
+            cache_key = (snapshot.version, key, float(min_score))
+            cached = self.ranked_cache.get(cache_key)
+            timer.stage('cache')
+            if cached is None:
+                candidates = snapshot.index.candidates(
+                    education, skills, sector, location, self.weights, min_score, within_km
+                )
+                timer.stage('candidates')
+                ranked = self._rank(
+                    self._score_candidates(
+                        snapshot, candidates, education, skills, sector, location, None, min_score, within_km
+                    ),
+                    None, min_score
+                )
+                # The snapshot is kept with its ranking: with SQLite it holds
+                # the fetched rows the results are built from
+                cached = (snapshot, ranked)
+                self.ranked_cache.set(cache_key, cached, size=RANKED_ROW_BYTES * max(len(ranked), 1))
+                timer.stage('score')
+            
+            snapshot, ranked = cached
+            items = [self._build_result(snapshot, *scores) for scores in ranked[offset:offset + limit]]
+            end = offset + len(items)
+            next_cursor = encode_cursor(snapshot.version, fingerprint, end) if end < len(ranked) else None
+            timer.stage('build')
+            timer.done()
+            
+            return RecommendationPage(items, len(ranked), offset, limit, next_cursor)
+    
+    def recommend_batch(self, profiles: List[Dict]) -> List[List[Recommendation]]:
+        """
+        Recommendations for many profiles, in the same order
         
-        return 0.0
+        Identical profiles are scored once and cached profiles are not
+        scored at all. With the NumPy backend the remaining profiles are
+        scored together against the whole catalog in chunks, instead of
+        one recommend() call per profile.
+        """
+        timer = metrics.timer('recommend_batch')
+        with closing(self.catalog.current()) as snapshot:
+            version = snapshot.version
+            unique: Dict[Tuple, Dict] = {}
+            keys = []
+            for profile in profiles:
+                key = profile_key(
+                    profile['education'], profile['skills'], profile['sector'], profile['location'],
+                    profile.get('within_km')
+                )
+                keys.append(key)
+                unique.setdefault(key, profile)
+            
+            results: Dict[Tuple, List[Recommendation]] = {}
+            if self.cache.enabled:
+                for key in unique:
+                    cached = self.cache.get((version, key))
+                    if cached is not None:
+                        results[key] = cached
+                unique = {key: profile for key, profile in unique.items() if key not in results}
+            timer.stage('cache')
+            
+            if snapshot.vectorized is not None:
+                tops = self._select_top_batch(snapshot, list(unique.values()), MAX_RECOMMENDATIONS)
+            else:
+                tops = []
+                for profile in unique.values():
+                    candidates = snapshot.index.candidates(
+                        profile['education'], profile['skills'], profile['sector'], profile['location'],
+                        self.weights, RELEVANCE_THRESHOLD, profile.get('within_km')
+                    )
+                    tops.append(self._select_top(
+                        snapshot, candidates, profile['education'], profile['skills'], profile['sector'],
+                        profile['location'], MAX_RECOMMENDATIONS, profile.get('within_km')
+                    ))
+            timer.stage('score')
+            
+            for key, top in zip(unique, tops):
+                results[key] = [self._build_result(snapshot, *scores) for scores in top]
+                self.cache.set((version, key), results[key])
+            timer.stage('build')
+            timer.done()
+            
+            return [results[key] for key in keys]
+    
+    def _select_top(self, snapshot: CatalogSnapshot, candidates: List[int], education: str,
+                    skills: List[str], sector: str, location: str, limit: int,
+                    within_km: float = None) -> List[Tuple]:
+        """Pick the best `limit` scored candidates above the relevance threshold"""
+        return self._rank(
+            self._score_candidates(
+                snapshot, candidates, education, skills, sector, location, limit, within_km=within_km
+            ),
+            limit
+        )
+    
+    def _select_top_batch(self, snapshot: CatalogSnapshot, profiles: List[Dict], limit: int) -> List[List[Tuple]]:
+        """Score profiles together with the NumPy backend and rank each row"""
+        import numpy as np
+        
+        positions = np.arange(len(snapshot.internships))
+        chunk_size = max(1, BATCH_CELLS // max(len(positions), 1))
+        
+        tops = []
+        for start in range(0, len(profiles), chunk_size):
+            chunk = profiles[start:start + chunk_size]
+            metrics.CANDIDATES_SCORED.inc(amount=len(chunk) * len(positions))
+            scores = snapshot.vectorized.score_many(chunk, positions)
+            for row in range(len(scores['total'])):
+                row_scores = {key: values[row] for key, values in scores.items()}
+                tops.append(self._rank(self._vectorized_rows(positions, row_scores, limit), limit))
+        
+        return tops
     
-    def recommend(self, education: str, skills: List[str], sector: str, location: str) -> List[Dict]:
+    def _rank(self, scored: Iterator[Tuple], limit: Optional[int],
+              min_score: float = RELEVANCE_THRESHOLD) -> List[Tuple]:
         """
-        Generate TOP 3-5 internship recommendations
+        Bounded-heap top-k over scored rows above the relevance threshold
+        
+        Ranks on the rounded total score, like the response. heapq.nlargest
+        keeps a bounded heap and is equivalent to a stable descending sort,
+        so ties keep catalog order. A `limit` of None ranks every row with
+        that same sort.
+        """
+        ranked = ((round(scores[-1], 2), scores) for scores in scored)
+        relevant = (item for item in ranked if item[0] > min_score)
+        
+        if limit is None:
+            return [scores for _, scores in sorted(relevant, key=itemgetter(0), reverse=True)]
+        return [scores for _, scores in heapq.nlargest(limit, relevant, key=itemgetter(0))]
+    
+    def _build_result(self, snapshot: CatalogSnapshot, position: int, skill_score: float, sector_score: float,
+                      location_score: float, education_score: float, total_score: float) -> Recommendation:
+        """Prepare the result record for one scored internship"""
+        return Recommendation(
+            snapshot.internships[position],
+            round(total_score, 2),
+            round(skill_score, 2),
+            round(sector_score, 2),
+            round(location_score, 2),
+            round(education_score, 2),
+            self._generate_explanation(skill_score, sector_score, location_score, education_score)
+        )
+    
+    def _score_candidates(self, snapshot: CatalogSnapshot, candidates: List[int], education: str,
+                          skills: List[str], sector: str, location: str, limit: Optional[int],
+                          min_score: float = RELEVANCE_THRESHOLD, within_km: float = None) -> Iterator[Tuple]:
+        """
+        Score candidate postings with the configured backend
         
-        Returns list of internships with scores and explanations
+        Yields numeric (position, skill, sector, location, education, total)
+        scores only, skipping postings farther than `within_km`. The NumPy
+        backend drops postings below `min_score` or that cannot make the
+        top `limit` before leaving array space.
         """
-        scored_internships = []
+        metrics.CANDIDATES_SCORED.inc(amount=len(candidates))
+        if snapshot.vectorized is not None:
+            import numpy as np
+            
+            positions = np.asarray(candidates, dtype=np.intp)
+            scores = snapshot.vectorized.score(education, skills, sector, location, positions, within_km)
+            yield from self._vectorized_rows(positions, scores, limit, min_score)
+            return
+        
+        # Normalize the query once; postings carry their normalized forms
+        user_skills = [normalize(s) for s in skills]
+        user_sector = SECTORS.find(normalize(sector))
+        user_loc = normalize(location)
+        user_level = EDUCATION_LEVELS.get(education, 0)
+        location_scores: Dict[int, float] = {}
         
-        for internship in self.internships:
-            # Calculate individual scores
-            skill_score = self._calculate_skill_match(skills, internship['required_skills'])
-            sector_score = self._calculate_sector_match(sector, internship['sector'])
-            location_score = self._calculate_location_match(location, internship['location'])
-            education_score = self._calculate_education_match(education, internship['education_required'])
+        for position in candidates:
+            internship = snapshot.internships[position]
+            if within_km is not None and not location_within(user_loc, internship.location_key, within_km):
+                continue
+            
+            # Calculate individual scores (location once per distinct location)
+            skill_score = self._calculate_skill_match(user_skills, internship)
+            sector_score = self._calculate_sector_match(user_sector, internship)
+            location_score = location_scores.get(internship.location_code)
+            if location_score is None:
+                location_score = self._calculate_location_match(user_loc, internship)
+                location_scores[internship.location_code] = location_score
+            education_score = self._calculate_education_match(user_level, internship)
             
             # Calculate weighted total score
             total_score = (
@@ -113,41 +514,37 @@ class RecommendationEngine:
                 education_score * self.weights['education_match']
             )
             
-            # Prepare result
-            result = {
-                'id': internship['id'],
-                'title': internship['title'],
-                'company': internship['company'],
-                'sector': internship['sector'],
-                'location': internship['location'],
-                'duration': internship['duration'],
-                'stipend': internship['stipend'],
-                'required_skills': internship['required_skills'],
-                'description': internship['description'],
-                'total_score': round(total_score, 2),
-                'score_breakdown': {
-                    'skill_match': round(skill_score, 2),
-                    'sector_match': round(sector_score, 2),
-                    'location_match': round(location_score, 2),
-                    'education_match': round(education_score, 2)
-                },
-                'explanation': self._generate_explanation(
-                    skill_score, sector_score, location_score, education_score
-                )
-            }
-            
-            scored_internships.append(result)
-        
-        # Sort by total score (descending)
-        scored_internships.sort(key=lambda x: x['total_score'], reverse=True)
+            yield position, skill_score, sector_score, location_score, education_score, total_score
+    
+    def _vectorized_rows(self, positions, scores: Dict, limit: Optional[int],
+                         min_score: float = RELEVANCE_THRESHOLD) -> Iterator[Tuple]:
+        """
+        Turn one profile's NumPy scores into score tuples
         
-        # Return TOP 3-5 recommendations
-        top_recommendations = scored_internships[:5]
+        Drops postings that cannot make the top `limit` (None keeps all
+        above `min_score`) before leaving array space.
+        """
+        import numpy as np
         
-        # Filter: only return if score > 20 (basic relevance threshold)
-        filtered = [r for r in top_recommendations if r['total_score'] > 20]
+        total = scores['total']
+        # _rank compares rounded totals with min_score; keep every total
+        # that can round above it and let _rank decide
+        keep = np.flatnonzero(total > min_score - 0.01)
+        if limit is not None and len(keep) > limit:
+            # Anything that can round to the k-th best total stays in,
+            # so ties on the rounded score are still resolved in Python
+            kth = np.partition(total[keep], len(keep) - limit)[len(keep) - limit]
+            keep = keep[total[keep] >= kth - 0.01]
         
-        return filtered[:5]  # Maximum 5 recommendations
+        return zip(
+            positions[keep].tolist(),
+            # Same cap as _calculate_skill_match (keeps int 100 on overflow)
+            [min(score, 100) for score in scores['skill_raw'][keep].tolist()],
+            scores['sector_match'][keep].tolist(),
+            scores['location_match'][keep].tolist(),
+            scores['education_match'][keep].tolist(),
+            total[keep].tolist()
+        )
     
     def _generate_explanation(self, skill_score: float, sector_score: float, 
                              location_score: float, education_score: float) -> str:
@@ -0,0 +1,228 @@
+"""
+Records - Compact in-memory types for catalog postings and scored results
+Converted from / to the JSON dict shape only at the edges (file, API)
+"""
+
+import gc
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from catalog_index import EDUCATION_LEVELS, normalize
+from geo import resolve
+
+# Fields every posting must provide
+INTERNSHIP_FIELDS = (
+    'id', 'title', 'company', 'sector', 'location', 'duration',
+    'stipend', 'education_required', 'required_skills', 'description'
+)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class InternTable:
+    """
+    Small integer codes for normalized values (sectors, locations)
+
+    Append-only, so a code never changes meaning and records from any
+    catalog version can be compared by code.
+    """
+
+    __slots__ = ('codes', 'values', '_raw_codes', '_lock')
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+        self._raw_codes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def code_of(self, raw: str) -> int:
+        """Code for a raw catalog value (normalized on first sight)"""
+        code = self._raw_codes.get(raw)
+        if code is None:
+            code = self._raw_codes[raw] = self.code(normalize(raw))
+        return code
+
+    def code(self, value: str) -> int:
+        """Code for a value, adding it if new"""
+        code = self.codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self.codes.get(value)
+                if code is None:
+                    code = len(self.values)
+                    self.values.append(sys.intern(value))
+                    self.codes[self.values[code]] = code
+        return code
+
+    def find(self, value: str) -> int:
+        """Code for a value, or -1 if no posting uses it"""
+        return self.codes.get(value, -1)
+
+    def value(self, code: int) -> str:
+        return self.values[code]
+
+
+SECTORS = InternTable()
+LOCATIONS = InternTable()
+
+# Raw skill -> interned normalized skill
+_SKILL_KEYS: Dict[str, str] = {}
+
+
+def _skill_key(skill: str) -> str:
+    key = _SKILL_KEYS.get(skill)
+    if key is None:
+        key = _SKILL_KEYS[skill] = sys.intern(normalize(skill))
+    return key
+
+
+class Internship:
+    """
+    One catalog posting
+
+    Keeps the original fields (categorical strings interned, skills as a
+    tuple) plus the normalized forms scoring and indexing need, computed
+    once at load: sector / location codes, the gazetteer place the
+    location resolves to (aliases included), education level, remote
+    flag and the lower-cased skill set. Unknown keys are kept in `extra`
+    so writing the catalog back loses nothing.
+    """
+
+    __slots__ = INTERNSHIP_FIELDS + (
+        'sector_code', 'location_code', 'place', 'education_level', 'remote',
+        'skill_keys', 'skill_count', 'extra'
+    )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Internship':
+        internship = cls.__new__(cls)
+        internship.id = data['id']
+        internship.title = _intern(data['title'])
+        internship.company = _intern(data['company'])
+        internship.sector = _intern(data['sector'])
+        internship.location = _intern(data['location'])
+        internship.duration = _intern(data['duration'])
+        internship.stipend = _intern(data['stipend'])
+        internship.education_required = _intern(data['education_required'])
+        internship.required_skills = skills = tuple([_intern(skill) for skill in data['required_skills']])
+        internship.description = data['description']
+
+        internship.sector_code = SECTORS.code_of(internship.sector)
+        internship.location_code = LOCATIONS.code_of(internship.location)
+        location = LOCATIONS.values[internship.location_code]
+        internship.place = resolve(location)
+        internship.remote = 'remote' in location or 'anywhere' in location
+        internship.education_level = EDUCATION_LEVELS.get(internship.education_required, 0)
+        internship.skill_keys = frozenset([_skill_key(skill) for skill in skills])
+        internship.skill_count = len(skills)
+
+        internship.extra = None
+        if len(data) > len(INTERNSHIP_FIELDS):
+            internship.extra = {key: value for key, value in data.items() if key not in INTERNSHIP_FIELDS}
+        return internship
+
+    @property
+    def sector_key(self) -> str:
+        return SECTORS.value(self.sector_code)
+
+    @property
+    def location_key(self) -> str:
+        return LOCATIONS.value(self.location_code)
+
+    def to_dict(self) -> Dict:
+        data = {field: getattr(self, field) for field in INTERNSHIP_FIELDS}
+        data['required_skills'] = list(self.required_skills)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def from_dicts(internships: Iterable[Dict]) -> List[Internship]:
+    """
+    Records for a whole catalog
+
+    Collection is paused while building: records hold no reference
+    cycles, and on large catalogs the collector's repeated scans of the
+    growing list otherwise cost more than building the records.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return [Internship.from_dict(internship) for internship in internships]
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# Top-level fields of a serialized recommendation
+RECOMMENDATION_FIELDS = (
+    'id', 'title', 'company', 'sector', 'location', 'duration', 'stipend',
+    'required_skills', 'description', 'total_score', 'score_breakdown', 'explanation'
+)
+
+
+class Recommendation:
+    """One scored posting in a result list (scores already rounded)"""
+
+    __slots__ = (
+        'internship', 'total_score', 'skill_match', 'sector_match',
+        'location_match', 'education_match', 'explanation'
+    )
+
+    def __init__(self, internship: Internship, total_score: float, skill_match: float, sector_match: float,
+                 location_match: float, education_match: float, explanation: str):
+        self.internship = internship
+        self.total_score = total_score
+        self.skill_match = skill_match
+        self.sector_match = sector_match
+        self.location_match = location_match
+        self.education_match = education_match
+        self.explanation = explanation
+
+    def to_dict(self, omit: Iterable[str] = ()) -> Dict:
+        """The /api/recommend response shape, without the fields in `omit`"""
+        internship = self.internship
+        data = {
+            'id': internship.id,
+            'title': internship.title,
+            'company': internship.company,
+            'sector': internship.sector,
+            'location': internship.location,
+            'duration': internship.duration,
+            'stipend': internship.stipend,
+            'required_skills': list(internship.required_skills),
+            'description': internship.description,
+            'total_score': self.total_score,
+            'score_breakdown': {
+                'skill_match': self.skill_match,
+                'sector_match': self.sector_match,
+                'location_match': self.location_match,
+                'education_match': self.education_match
+            },
+            'explanation': self.explanation
+        }
+        for field in omit:
+            del data[field]
+        return data
+
+
+class RecommendationPage:
+    """One page of a ranked result list"""
+
+    __slots__ = ('items', 'total', 'offset', 'limit', 'next_cursor')
+
+    def __init__(self, items: List[Recommendation], total: int, offset: int, limit: int,
+                 next_cursor: Optional[str]):
+        self.items = items
+        self.total = total
+        self.offset = offset
+        self.limit = limit
+        self.next_cursor = next_cursor
+
+
+def serialize(recommendations: Optional[List[Recommendation]], omit: Iterable[str] = ()) -> List[Dict]:
+    """Response dicts for a result list, without the fields in `omit`"""
+    return [recommendation.to_dict(omit) for recommendation in recommendations or ()]
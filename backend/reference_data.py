@@ -0,0 +1,97 @@
+"""
+Reference Data - Sector and skill pick-lists for the mobile app
+Served from memory, reloaded when the catalog file changes on disk
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Tuple
+
+# Used when the catalog file is missing or has no list of that name
+FALLBACK_LISTS = {
+    "sectors": [
+        "IT & Software",
+        "Marketing & Sales",
+        "Manufacturing",
+        "Finance & Banking",
+        "Healthcare",
+        "Education",
+        "Agriculture",
+        "Retail",
+        "Hospitality",
+        "Government"
+    ],
+    "skills": [
+        "Communication",
+        "MS Office",
+        "English",
+        "Hindi",
+        "Python",
+        "Java",
+        "Sales",
+        "Customer Service",
+        "Data Entry",
+        "Social Media",
+        "Accounting",
+        "Teaching",
+        "Manual Work",
+        "Driving"
+    ]
+}
+
+
+def compute_etag(payload) -> str:
+    """Stable content hash used as the HTTP entity tag"""
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class ReferenceData:
+    """
+    Pick-lists ('sectors', 'skills') read from the catalog JSON
+
+    The file is parsed once; each lookup only stats it and re-reads it
+    when its modification time changes.
+    """
+
+    def __init__(self, data_path: str):
+        self.data_path = data_path
+        self._lists: Dict[str, Tuple[List[str], str]] = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Tuple[List[str], str]:
+        """Return (values, etag) for a named list"""
+        self._refresh()
+        return self._lists[name]
+
+    def _refresh(self):
+        try:
+            mtime = os.stat(self.data_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if self._lists and mtime == self._mtime:
+            return
+
+        with self._lock:
+            if self._lists and mtime == self._mtime:
+                return
+
+            data = {}
+            if mtime is not None:
+                try:
+                    with open(self.data_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    data = {}
+
+            lists = {}
+            for name, fallback in FALLBACK_LISTS.items():
+                values = data.get(name) or fallback
+                lists[name] = (values, compute_etag(values))
+
+            self._lists = lists
+            self._mtime = mtime
@@ -0,0 +1,109 @@
+"""
+Resume Cache - Parsed resume results keyed by content hash
+In-memory LRU in front of an optional SQLite file shared across restarts
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from query_cache import QueryCache
+
+
+def fingerprint(*settings) -> str:
+    """
+    Short hash of the settings a parse result depends on besides its input
+    (skill database, extraction limits), for the `settings` part of a key
+    """
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def file_key(file_content: bytes, extension: str, settings: str = '') -> str:
+    """Cache key for an uploaded file (same bytes as another type parse differently)"""
+    return f"file:{extension.lower()}:{settings}:{hashlib.sha256(file_content).hexdigest()}"
+
+
+def normalize_text(text: str) -> str:
+    """Unify line endings and drop surrounding whitespace"""
+    return text.replace('\r\n', '\n').replace('\r', '\n').strip()
+
+
+def text_key(text: str, settings: str = '') -> str:
+    """Cache key for pasted resume text; pass it through normalize_text first"""
+    return f"text:{settings}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+class ResumeCache:
+    """
+    Two-tier cache for ResumeParser.parse_text output
+
+    Memory holds up to `max_entries` results (LRU). When `sqlite_path` is
+    set, results are also written to a local SQLite file holding at most
+    `max_disk_entries` rows; least recently used rows are evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024, sqlite_path: str = None, max_disk_entries: int = 50000):
+        self.memory = QueryCache(max_entries=max_entries, ttl=0)
+        self.max_disk_entries = max_disk_entries
+
+        self.disk_hits = 0
+        self._db = None
+        self._db_lock = threading.Lock()
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_resumes ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_parsed_resumes_accessed ON parsed_resumes (accessed)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached parse result, or None"""
+        value = self.memory.get(key)
+        if value is not None or self._db is None:
+            return value
+
+        with self._db_lock:
+            row = self._db.execute("SELECT value FROM parsed_resumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE parsed_resumes SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+        value = json.loads(row[0])
+        self.disk_hits += 1
+        self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Dict):
+        """Store a parse result in memory and, if enabled, on disk"""
+        self.memory.set(key, value)
+        if self._db is None:
+            return
+
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO parsed_resumes (key, value, accessed) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time())
+            )
+            (count,) = self._db.execute("SELECT COUNT(*) FROM parsed_resumes").fetchone()
+            if count > self.max_disk_entries:
+                self._db.execute(
+                    "DELETE FROM parsed_resumes WHERE key IN ("
+                    " SELECT key FROM parsed_resumes ORDER BY accessed LIMIT ?)",
+                    (count - self.max_disk_entries,)
+                )
+            self._db.commit()
+
+    def stats(self) -> Dict:
+        stats = self.memory.stats()
+        stats["disk_hits"] = self.disk_hits
+        stats["disk_enabled"] = self._db is not None
+        return stats
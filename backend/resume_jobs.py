@@ -0,0 +1,121 @@
+"""
+Resume Jobs - Background resume processing with polling
+Bounded in-process queue drained by a fixed pool of worker threads
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFull(Exception):
+    """The job queue is at its depth limit"""
+
+
+class ResumeJobQueue:
+    """
+    Runs process(*args) -> (payload, status) jobs on worker threads
+
+    At most `max_queued` jobs wait for a worker; submit() raises QueueFull
+    beyond that instead of letting a burst pile up. Finished jobs are kept
+    for `result_ttl` seconds so clients can poll for them.
+    """
+
+    def __init__(self, process: Callable[..., Tuple[Dict, int]], max_workers: int = 2,
+                 max_queued: int = 32, result_ttl: float = 600):
+        self.process = process
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def submit(self, *args) -> str:
+        """Queue a job and return its id"""
+        self._start_workers()
+        self._expire()
+
+        job_id = uuid.uuid4().hex
+        job = {"status": "queued", "created": time.time(), "finished": None, "result": None}
+        with self._lock:
+            self._jobs[job_id] = job
+        try:
+            self._queue.put_nowait((job_id, args))
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job_id]
+            raise QueueFull(f"Too many resumes are being processed. Maximum queued: {self._queue.maxsize}")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return {"status", "result"} for a job, or None if unknown or expired"""
+        self._expire()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {"status": job["status"], "result": job["result"]}
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = {}
+            for job in self._jobs.values():
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+        return {
+            "queued": self._queue.qsize(),
+            "max_queued": self._queue.maxsize,
+            "workers": self.max_workers,
+            "jobs": counts
+        }
+
+    def _start_workers(self):
+        if self._workers:
+            return
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, name=f"resume-job-{len(self._workers)}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            job_id, args = self._queue.get()
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    job["status"] = "running"
+
+            try:
+                result = self.process(*args)
+            except Exception as e:
+                logger.exception("Resume job %s failed", job_id)
+                metrics.EXCEPTIONS.inc('resume_job')
+                result = ({"error": f"Unexpected error: {str(e)}", "success": False}, 500)
+
+            with self._lock:
+                if job is not None:
+                    job["status"] = "completed" if result[1] == 200 else "failed"
+                    job["result"] = result
+                    job["finished"] = time.time()
+            self._queue.task_done()
+
+    def _expire(self):
+        """Forget finished jobs older than result_ttl"""
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job["finished"] is not None and job["finished"] < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
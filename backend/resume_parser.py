@@ -4,13 +4,128 @@ Lightweight approach for government deployment
 """
 
 import re
+import hashlib
+import io
+import importlib
 import json
-from typing import List, Dict
+import threading
+import time
+from contextlib import closing
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import os
 
+from skill_matcher import SkillMatcher
+
+# Extracted skill -> standard skill name used in app.
+# Keys are lower-cased once at import so standardization is a dict lookup.
+SKILL_MAPPING = {key.lower(): value for key, value in {
+    # Programming
+    "Python": "Python",
+    "Java": "Java",
+    "Javascript": "JavaScript",
+    
+    # Communication
+    "Communication": "Communication",
+    "Presentation": "Communication",
+    "Public Speaking": "Communication",
+    
+    # Languages
+    "English": "English",
+    "Hindi": "Hindi",
+    "Tamil": "Tamil",
+    "Telugu": "Telugu",
+    "Bengali": "Bengali",
+    "Marathi": "Marathi",
+    "Gujarati": "Gujarati",
+    "Kannada": "Kannada",
+    
+    # Office
+    "Ms Office": "MS Office",
+    "Microsoft Office": "MS Office",
+    "Excel": "MS Office",
+    "Word": "MS Office",
+    
+    # Other
+    "Sales": "Sales",
+    "Customer Service": "Customer Service",
+    "Data Entry": "Data Entry",
+    "Social Media": "Social Media",
+    "Accounting": "Accounting",
+    "Teaching": "Teaching",
+    "Manual Work": "Manual Work",
+    "Problem Solving": "Problem Solving",
+    "Research": "Research",
+    "Photoshop": "Photoshop",
+    "Creativity": "Creativity",
+    "Quality Control": "Quality Control",
+    "Organization": "Organization",
+    "Networking": "Networking",
+    "Writing": "Writing",
+    "Video Editing": "Video Editing",
+    "Autocad": "AutoCAD",
+    "Engineering": "Engineering",
+    "Social Work": "Social Work",
+    "Mechanical Skills": "Mechanical Skills",
+    "Electrical Work": "Electrical Work",
+    "Data Analysis": "Data Analysis"
+}.items()}
+
+# Education keywords, highest level first (same order detection ranks them)
+EDUCATION_KEYWORDS = [
+    ("Master's Degree", [
+        'master', 'mba', 'mca', 'msc', 'm.tech', 'm.sc',
+        'post graduate', 'pg'
+    ]),
+    ("Bachelor's Degree", [
+        'bachelor', 'btech', 'b.tech', 'be', 'b.e', 'bca',
+        'bcom', 'bsc', 'ba', 'graduate', 'graduation'
+    ]),
+    ("Diploma", [
+        'diploma', 'polytechnic', 'iti'
+    ]),
+    ("12th Pass", [
+        '12th', '12 th', 'xii', 'higher secondary', 'intermediate',
+        '+2', 'hsc'
+    ]),
+    ("10th Pass", [
+        '10th', '10 th', 'x', 'matriculation', 'secondary',
+        'ssc'
+    ])
+]
+
+# Keywords that must end at a word boundary (Roman numeral X)
+WORD_END_KEYWORDS = {'x'}
+
+# All keywords in one alternation. Named groups would disable re's
+# literal-prefix scan, so the level is looked up from the matched keyword.
+EDUCATION_REGEX = re.compile('|'.join(
+    re.escape(keyword) + (r'\b' if keyword in WORD_END_KEYWORDS else '')
+    for _, keywords in EDUCATION_KEYWORDS for keyword in keywords
+))
+EDUCATION_RANK = {
+    keyword: rank
+    for rank, (_, keywords) in enumerate(EDUCATION_KEYWORDS) for keyword in keywords
+}
+
+EMAIL_REGEX = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+PHONE_REGEXES = [
+    re.compile(r'\+91[\s-]?\d{10}'),  # +91 format
+    re.compile(r'0\d{10}'),            # 0 prefix
+    re.compile(r'\d{10}')              # Plain 10 digits
+]
+
 class ResumeParser:
-    def __init__(self):
-        self.skill_database = self._load_skill_database()
+    def __init__(self, skill_database: Dict = None):
+        # A copy, so add_skills never changes the caller's dictionary
+        if skill_database is None:
+            self.skill_database = self._load_skill_database()
+        else:
+            self.skill_database = {category: list(skills) for category, skills in skill_database.items()}
+        
+        # Single-pass matcher over every skill in the database
+        self.skill_matcher = self._build_skill_matcher()
+        self.skill_fingerprint = self._skill_fingerprint()
         
     def _load_skill_database(self) -> Dict:
         """Load skill patterns for extraction"""
@@ -86,6 +201,28 @@ class ResumeParser:
             ]
         }
     
+    def _build_skill_matcher(self) -> SkillMatcher:
+        """Compile all skills into one Aho-Corasick automaton"""
+        return SkillMatcher(
+            skill.lower() for skills_list in self.skill_database.values() for skill in skills_list
+        )
+    
+    def _skill_fingerprint(self) -> str:
+        """Hash of the skill database, so cached results can tell it changed"""
+        data = json.dumps(self.skill_database, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(data).hexdigest()[:16]
+    
+    def add_skills(self, category: str, skills: List[str]):
+        """
+        Extend the skill database (e.g. regional-language or trade skills)
+        
+        The matcher is rebuilt once; per-resume cost does not grow with
+        the number of skills.
+        """
+        self.skill_database.setdefault(category, []).extend(skills)
+        self.skill_matcher = self._build_skill_matcher()
+        self.skill_fingerprint = self._skill_fingerprint()
+    
     def parse_text(self, text: str) -> Dict:
         """
         Parse resume text and extract information
@@ -116,18 +253,69 @@ class ResumeParser:
             "confidence": self._calculate_confidence(extracted_skills, education)
         }
     
+    def parse_pages(self, pages: Iterable[str], early_stop_skills: Optional[int] = None) -> Dict:
+        """
+        Parse resume text delivered page by page (e.g. from iter_pdf_pages)
+        
+        Without `early_stop_skills`, gives the same result as parse_text on
+        the pages joined with newlines. With it set, stops pulling pages
+        once the highest education level (a master's degree), contact
+        details and that many skills have been found, so later pages are
+        never extracted. The result can then differ from a full parse:
+        skills and a better-matching phone number on the skipped pages
+        are missed.
+        """
+        matched = set()
+        skills = set()
+        education_rank = None
+        email = ""
+        phone, phone_rank = "", len(PHONE_REGEXES)
+        
+        for page in pages:
+            page_lower = page.lower()
+            
+            # Skill and education keywords never span a newline, so each
+            # page can be matched on its own
+            new_matches = self.skill_matcher.find_all(page_lower) - matched
+            if new_matches:
+                matched |= new_matches
+                skills |= self._standardize_skills({skill.title() for skill in new_matches})
+            
+            rank = self._education_rank(page_lower)
+            if rank is not None and (education_rank is None or rank < education_rank):
+                education_rank = rank
+            
+            if not email:
+                email = self._extract_email(page)
+            
+            # Earlier patterns win over earlier positions, as in _extract_phone
+            for rank, pattern in enumerate(PHONE_REGEXES[:phone_rank]):
+                match = pattern.search(page)
+                if match:
+                    phone, phone_rank = match.group(0), rank
+                    break
+            
+            # Only the top rank is final: a later page could hold a higher degree
+            if early_stop_skills is not None and education_rank == 0 \
+                    and (email or phone) and len(skills) >= early_stop_skills:
+                break
+        
+        extracted_skills = sorted(skills)[:15]
+        education = EDUCATION_KEYWORDS[education_rank][0] if education_rank is not None else "12th Pass"
+        
+        return {
+            "skills": extracted_skills,
+            "education": education,
+            "email": email,
+            "phone": phone,
+            "confidence": self._calculate_confidence(extracted_skills, education)
+        }
+    
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from text using pattern matching"""
-        found_skills = set()
-        
-        # Check each skill category
-        for category, skills_list in self.skill_database.items():
-            for skill in skills_list:
-                # Use word boundaries for better matching
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text, re.IGNORECASE):
-                    # Capitalize properly
-                    found_skills.add(skill.title())
+        # One pass over the text finds every skill between word boundaries
+        # (text is already lower-cased); capitalize properly
+        found_skills = {skill.title() for skill in self.skill_matcher.find_all(text)}
         
         # Convert to standardized names (matching our app's skill list)
         standardized = self._standardize_skills(found_skills)
@@ -136,117 +324,43 @@ class ResumeParser:
     
     def _standardize_skills(self, skills: set) -> set:
         """Map extracted skills to standard skill names used in app"""
-        skill_mapping = {
-            # Programming
-            "Python": "Python",
-            "Java": "Java",
-            "Javascript": "JavaScript",
-            
-            # Communication
-            "Communication": "Communication",
-            "Presentation": "Communication",
-            "Public Speaking": "Communication",
-            
-            # Languages
-            "English": "English",
-            "Hindi": "Hindi",
-            "Tamil": "Tamil",
-            "Telugu": "Telugu",
-            "Bengali": "Bengali",
-            "Marathi": "Marathi",
-            "Gujarati": "Gujarati",
-            "Kannada": "Kannada",
-            
-            # Office
-            "Ms Office": "MS Office",
-            "Microsoft Office": "MS Office",
-            "Excel": "MS Office",
-            "Word": "MS Office",
-            
-            # Other
-            "Sales": "Sales",
-            "Customer Service": "Customer Service",
-            "Data Entry": "Data Entry",
-            "Social Media": "Social Media",
-            "Accounting": "Accounting",
-            "Teaching": "Teaching",
-            "Manual Work": "Manual Work",
-            "Problem Solving": "Problem Solving",
-            "Research": "Research",
-            "Photoshop": "Photoshop",
-            "Creativity": "Creativity",
-            "Quality Control": "Quality Control",
-            "Organization": "Organization",
-            "Networking": "Networking",
-            "Writing": "Writing",
-            "Video Editing": "Video Editing",
-            "Autocad": "AutoCAD",
-            "Engineering": "Engineering",
-            "Social Work": "Social Work",
-            "Mechanical Skills": "Mechanical Skills",
-            "Electrical Work": "Electrical Work",
-            "Data Analysis": "Data Analysis"
-        }
-        
-        standardized = set()
-        for skill in skills:
-            for key, value in skill_mapping.items():
-                if skill.lower() == key.lower():
-                    standardized.add(value)
-                    break
-        
-        return standardized
+        return {SKILL_MAPPING[skill.lower()] for skill in skills if skill.lower() in SKILL_MAPPING}
     
     def _extract_education(self, text: str) -> str:
         """Extract highest education level"""
-        education_patterns = {
-            "Master's Degree": [
-                r'master', r'mba', r'mca', r'msc', r'm\.tech', r'm\.sc',
-                r'post graduate', r'pg'
-            ],
-            "Bachelor's Degree": [
-                r'bachelor', r'btech', r'b\.tech', r'be', r'b\.e', r'bca',
-                r'bcom', r'bsc', r'ba', r'graduate', r'graduation'
-            ],
-            "Diploma": [
-                r'diploma', r'polytechnic', r'iti'
-            ],
-            "12th Pass": [
-                r'12th', r'12 th', r'xii', r'higher secondary', r'intermediate',
-                r'\+2', r'hsc'
-            ],
-            "10th Pass": [
-                r'10th', r'10 th', r'x\b', r'matriculation', r'secondary',
-                r'ssc'
-            ]
-        }
+        rank = self._education_rank(text.lower())
+        if rank is None:
+            return "12th Pass"  # Default assumption
         
-        text_lower = text.lower()
+        return EDUCATION_KEYWORDS[rank][0]
+    
+    def _education_rank(self, text_lower: str) -> Optional[int]:
+        """Index into EDUCATION_KEYWORDS of the highest level mentioned"""
+        # One scan finds the first education keyword of any level
+        match = EDUCATION_REGEX.search(text_lower)
+        if not match:
+            return None
         
-        # Check in order of highest to lowest
-        for education, patterns in education_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return education
+        # Levels ranked above it can only occur further on (at the match
+        # position the alternation already prefers higher levels); those
+        # keywords are plain strings, so probe for them with str.find
+        rank = EDUCATION_RANK[match.group()]
+        start = match.start() + 1
+        for higher, (_, keywords) in enumerate(EDUCATION_KEYWORDS[:rank]):
+            if any(text_lower.find(keyword, start) != -1 for keyword in keywords):
+                return higher
         
-        return "12th Pass"  # Default assumption
+        return rank
     
     def _extract_email(self, text: str) -> str:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
+        match = EMAIL_REGEX.search(text)
         return match.group(0) if match else ""
     
     def _extract_phone(self, text: str) -> str:
         """Extract Indian phone number"""
-        phone_patterns = [
-            r'\+91[\s-]?\d{10}',  # +91 format
-            r'0\d{10}',            # 0 prefix
-            r'\d{10}'              # Plain 10 digits
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
+        for pattern in PHONE_REGEXES:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         
@@ -270,37 +384,135 @@ class ResumeParser:
 
 
 # PDF/DOCX Utilities
-def extract_text_from_pdf(file_content: bytes) -> str:
+
+# PDF text extraction backends: "pdfium" (native, fast), "pdfplumber"
+# (pdfminer layout analysis) and "auto" (pdfium, with pdfplumber for
+# pages pdfium could not read)
+PDF_BACKENDS = ('auto', 'pdfium', 'pdfplumber')
+
+# Unmapped glyphs and control characters left by broken font encodings
+GARBLED_REGEX = re.compile(r'[\ufffd\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# pdfium is not thread-safe; only matters when extraction runs inline
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _suspicious_page_text(text: str) -> bool:
+    """Whether native extraction probably lost a page's text"""
+    stripped = text.strip()
+    if not stripped:
+        return True
+    
+    if len(GARBLED_REGEX.findall(stripped)) * 10 > len(stripped):
+        return True
+    
+    # Glyph positions lost: words run together without spaces
+    return len(stripped) >= 200 and stripped.count(' ') * 40 < len(stripped)
+
+
+def _pdfplumber_pages(file_content: bytes, max_pages: int = None) -> Iterator[str]:
+    import pdfplumber
+    
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        # Check if PDF has pages
+        if not pdf.pages:
+            raise ValueError("PDF has no pages")
+        
+        pages = pdf.pages[:max_pages] if max_pages else pdf.pages
+        for page in pages:
+            page_text = page.extract_text()
+            page.close()
+            yield page_text
+
+
+def _pdfium_pages(file_content: bytes, max_pages: int = None, fallback: bool = False,
+                  stats: Dict = None) -> Iterator[str]:
+    import pypdfium2 as pdfium
+    
+    try:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_content)
+    except pdfium.PdfiumError:
+        if not fallback:
+            raise
+        # pdfminer copes with some files pdfium refuses to open
+        stats['backend'] = 'pdfplumber'
+        yield from _pdfplumber_pages(file_content, max_pages)
+        return
+    
+    plumber = None
+    try:
+        page_count = len(pdf)
+        if not page_count:
+            raise ValueError("PDF has no pages")
+        
+        for index in range(min(page_count, max_pages) if max_pages else page_count):
+            with _PDFIUM_LOCK:
+                page = pdf[index]
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range().replace('\r\n', '\n')
+                textpage.close()
+                page.close()
+            
+            if fallback and _suspicious_page_text(page_text):
+                if plumber is None:
+                    import pdfplumber
+                    plumber = pdfplumber.open(io.BytesIO(file_content))
+                plumber_page = plumber.pages[index]
+                plumber_text = plumber_page.extract_text()
+                plumber_page.close()
+                if plumber_text and plumber_text.strip():
+                    page_text = plumber_text
+                    stats['fallback_pages'] += 1
+            
+            yield page_text
+    finally:
+        if plumber is not None:
+            plumber.close()
+        with _PDFIUM_LOCK:
+            pdf.close()
+
+
+def iter_pdf_pages(file_content: bytes, max_pages: int = None, backend: str = 'auto',
+                   stats: Dict = None) -> Iterator[str]:
     """
-    Extract text from PDF file
-    Requires: pdfplumber or PyPDF2
+    Yield the text of each PDF page as it is extracted
+    Requires: pypdfium2 and/or pdfplumber, depending on `backend`
+    
+    Pages without text are skipped. Each page is released once its text
+    has been yielded, so memory stays flat on long documents. If `stats`
+    is given it receives the backend used, page counts and time spent
+    extracting.
     """
+    if stats is None:
+        stats = {}
+    stats.update(backend=backend, pages=0, fallback_pages=0, extract_seconds=0.0)
+    
     try:
-        import pdfplumber
-        import io
+        if backend not in PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend '{backend}'. Choose from: {', '.join(PDF_BACKENDS)}")
         
         # Validate file content
         if not file_content or len(file_content) < 100:
             raise ValueError("PDF file is too small or empty")
         
-        text = ""
-        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-            # Check if PDF has pages
-            if not pdf.pages:
-                raise ValueError("PDF has no pages")
-            
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        # Validate extracted text
-        if not text or len(text.strip()) < 10:
-            raise ValueError("Could not extract text from PDF. The PDF might be image-based or corrupted.")
+        if backend == 'pdfplumber':
+            pages = _pdfplumber_pages(file_content, max_pages)
+        else:
+            stats['backend'] = 'pdfium'
+            pages = _pdfium_pages(file_content, max_pages, backend == 'auto', stats)
         
-        return text
-    except ImportError:
-        raise Exception("pdfplumber not installed. Run: pip install pdfplumber")
+        with closing(pages):
+            started = time.perf_counter()
+            for page_text in pages:
+                stats['pages'] += 1
+                stats['extract_seconds'] += time.perf_counter() - started
+                if page_text:
+                    yield page_text
+                started = time.perf_counter()
+            stats['extract_seconds'] += time.perf_counter() - started
+    except ImportError as e:
+        raise Exception(f"{e.name} not installed. Run: pip install {e.name}")
     except ValueError as e:
         raise Exception(str(e))
     except Exception as e:
@@ -308,16 +520,102 @@ def extract_text_from_pdf(file_content: bytes) -> str:
         error_msg = str(e).lower()
         if "password" in error_msg or "encrypted" in error_msg:
             raise Exception("PDF is password protected or encrypted")
-        elif "damaged" in error_msg or "corrupt" in error_msg:
+        elif "damaged" in error_msg or "corrupt" in error_msg or "data format" in error_msg:
             raise Exception("PDF file appears to be corrupted")
         else:
             raise Exception(f"Could not parse PDF: {str(e)}")
 
 
-def extract_text_from_docx(file_content: bytes) -> str:
+def _limit_pages(pages: Iterable[str], max_chars: int = None) -> Iterator[str]:
+    """
+    Pass pages through until `max_chars` characters have been collected
+    
+    Raises once the pages run out if they held no meaningful text.
+    """
+    collected = 0
+    head = ""
+    for page_text in pages:
+        # Only the first few characters are needed for the emptiness check
+        if len(head.strip()) < 10:
+            head += page_text + "\n"
+        
+        yield page_text
+        
+        # Enough text for parsing; skip the remaining pages
+        collected += len(page_text) + 1
+        if max_chars and collected >= max_chars:
+            break
+    
+    # Validate extracted text
+    if len(head.strip()) < 10:
+        raise Exception("Could not extract text from PDF. The PDF might be image-based or corrupted.")
+
+
+def extract_text_from_pdf(file_content: bytes, max_pages: int = None, max_chars: int = None,
+                          backend: str = 'auto') -> str:
+    """
+    Extract text from PDF file
+    Requires: pypdfium2 and/or pdfplumber, depending on `backend`
+    
+    Reads at most `max_pages` pages and stops early once `max_chars`
+    characters of text have been collected.
+    """
+    pages = list(_limit_pages(iter_pdf_pages(file_content, max_pages, backend), max_chars))
+    return "".join(page_text + "\n" for page_text in pages)
+
+
+# (skill database it was built from, parser) for parse_pdf_resume
+_worker_parser = (None, None)
+
+
+def _parser_for(skill_database: Optional[Dict]) -> ResumeParser:
+    """This process's parser, rebuilt when the skill database it was given changes"""
+    global _worker_parser
+    source, parser = _worker_parser
+    if parser is None or source != skill_database:
+        parser = ResumeParser(skill_database)
+        source = None if skill_database is None else parser.skill_database
+        _worker_parser = (source, parser)
+    return parser
+
+
+def parse_pdf_resume(file_content: bytes, max_pages: int = None, max_chars: int = None,
+                     early_stop_skills: Optional[int] = None, backend: str = 'auto',
+                     skill_database: Optional[Dict] = None) -> Tuple[Dict, Dict]:
+    """
+    Stream a PDF's pages straight into ResumeParser.parse_pages
+    
+    Meant to run inside an extraction worker: pages are parsed as they
+    are extracted and, with `early_stop_skills`, extraction stops as soon
+    as the parser has what it needs. Pass the app parser's
+    `skill_database` so skills added with add_skills are matched here
+    too (None uses the built-in database). Returns (parsed_data, stats)
+    where stats names the backend used and the extract/parse times in ms.
+    """
+    parser = _parser_for(skill_database)
+    
+    stats = {}
+    started = time.perf_counter()
+    pages = _limit_pages(iter_pdf_pages(file_content, max_pages, backend, stats), max_chars)
+    try:
+        parsed_data = parser.parse_pages(pages, early_stop_skills)
+    finally:
+        # Closes the PDF right away when parsing stopped early
+        pages.close()
+    
+    total = time.perf_counter() - started
+    extract_seconds = stats.pop('extract_seconds')
+    stats['extract_ms'] = round(extract_seconds * 1000, 2)
+    stats['parse_ms'] = round((total - extract_seconds) * 1000, 2)
+    return parsed_data, stats
+
+
+def extract_text_from_docx(file_content: bytes, max_chars: int = None) -> str:
     """
     Extract text from DOCX file
     Requires: python-docx
+    
+    Stops collecting paragraphs once `max_chars` characters are reached.
     """
     try:
         import docx
@@ -328,7 +626,14 @@ def extract_text_from_docx(file_content: bytes) -> str:
             raise ValueError("DOCX file is too small or empty")
         
         doc = docx.Document(io.BytesIO(file_content))
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+        paragraphs = []
+        collected = 0
+        for paragraph in doc.paragraphs:
+            paragraphs.append(paragraph.text)
+            collected += len(paragraph.text) + 1
+            if max_chars and collected >= max_chars:
+                break
+        text = "\n".join(paragraphs)
         
         # Validate extracted text
         if not text or len(text.strip()) < 10:
@@ -343,6 +648,47 @@ def extract_text_from_docx(file_content: bytes) -> str:
         raise Exception(f"Could not parse DOCX: {str(e)}")
 
 
+# Bundled one-page resume parsed by warm_up()
+WARM_UP_FILES = {
+    'pdf': os.path.join(os.path.dirname(__file__), 'data', 'warmup_resume.pdf'),
+    'docx': os.path.join(os.path.dirname(__file__), 'data', 'warmup_resume.docx')
+}
+
+
+def warm_up(pdf_backend: str = 'auto') -> Dict[str, object]:
+    """
+    Import the extraction libraries and parse a bundled resume with each
+    
+    Run once per process (and as the extraction workers' initializer) so
+    the first real upload does not pay for importing pypdfium2,
+    pdfplumber / pdfminer / PIL and python-docx, or for their first-use
+    setup. Never raises: returns milliseconds per step, or the error for
+    steps that failed (e.g. an optional library is not installed).
+    """
+    timings: Dict[str, object] = {}
+    
+    def step(name, func, *args):
+        started = time.perf_counter()
+        try:
+            func(*args)
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+        except Exception as e:
+            timings[name] = f"failed: {e}"
+    
+    for module in ('pypdfium2', 'pdfplumber', 'docx'):
+        step(f"import_{module}", importlib.import_module, module)
+    
+    with open(WARM_UP_FILES['pdf'], 'rb') as f:
+        pdf = f.read()
+    for backend in dict.fromkeys((pdf_backend, 'pdfplumber')):
+        step(f"parse_pdf_{backend}", parse_pdf_resume, pdf, None, None, None, backend)
+    
+    with open(WARM_UP_FILES['docx'], 'rb') as f:
+        step("extract_docx", extract_text_from_docx, f.read())
+    
+    return timings
+
+
 # Example usage
 if __name__ == "__main__":
     parser = ResumeParser()
@@ -0,0 +1,88 @@
+"""
+Skill Matcher - Aho-Corasick automaton for multi-pattern skill extraction
+Finds every dictionary term in a single pass over the text
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the re module's \\w"""
+    return ch.isalnum() or ch == '_'
+
+
+def _at_word_boundary(text: str, position: int) -> bool:
+    """Equivalent of a regex \\b at `position` in `text`"""
+    before = position > 0 and _is_word_char(text[position - 1])
+    after = position < len(text) and _is_word_char(text[position])
+    return before != after
+
+
+class SkillMatcher:
+    """
+    Multi-pattern matcher with regex word-boundary semantics
+
+    find_all(text) returns the same terms as checking
+    re.search(r'\\b' + re.escape(term) + r'\\b', text) for every term,
+    including overlapping ones ("marketing" inside "email marketing"),
+    but scans the text once regardless of how many terms there are.
+    Terms are matched literally, so callers lower-case both sides.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+
+        for term in terms:
+            if term:
+                self._insert(term)
+        self._link()
+
+    def _insert(self, term: str):
+        state = 0
+        for ch in term:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        if term not in self._output[state]:
+            self._output[state] += (term,)
+
+    def _link(self):
+        """Breadth-first failure links; outputs include those of the fail state"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Terms that occur in `text` between word boundaries"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+
+        for end, ch in enumerate(text, start=1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for term in output[state]:
+                if term not in found and _at_word_boundary(text, end) \
+                        and _at_word_boundary(text, end - len(term)):
+                    found.add(term)
+
+        return found
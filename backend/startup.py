@@ -0,0 +1,108 @@
+"""
+Startup - Explicit start-up phase for API workers
+Times each phase and tells /api/health whether the worker is ready
+
+STARTUP_MODE=eager (servers): the catalog and parser are built at import,
+then a background thread warms everything a first request would
+otherwise pay for (catalog indexes and scorer, the gazetteer, the
+parser's matcher, the PDF / DOCX libraries with a dummy parse, and the
+extraction worker processes). /api/health answers 503 until it is done.
+
+STARTUP_MODE=lazy (CLI tools, scripts, tests): importing the app builds
+nothing; objects are created on first use and the worker is ready at once.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Imported first by app.py, so phases are measured from here
+STARTED = time.perf_counter()
+
+STARTUP_MODES = ('eager', 'lazy')
+
+logger = logging.getLogger(__name__)
+
+
+class Lazy:
+    """Stands in for an object built by `factory` on first attribute access"""
+
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def resolve(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+
+class Startup:
+    """
+    Phase timings (ms) and readiness of this worker
+
+    mark() closes a phase that ran inline since the previous mark;
+    run() executes the remaining phases, in the background with
+    background=True, and sets the worker ready when they finish.
+    """
+
+    def __init__(self, mode: str):
+        if mode not in STARTUP_MODES:
+            raise ValueError(f"Unknown startup mode: {mode}")
+        self.mode = mode
+        self.phases: Dict[str, object] = {}
+        self.error: Optional[str] = None
+        self.total_ms: Optional[float] = None
+        self._last = STARTED
+        self._ready = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def mark(self, name: str):
+        now = time.perf_counter()
+        self.phases[name] = round((now - self._last) * 1000, 2)
+        self._last = now
+
+    def run(self, steps: List[Tuple[str, Callable]], background: bool = False):
+        if background:
+            threading.Thread(target=self._run, args=(steps,), name='startup', daemon=True).start()
+        else:
+            self._run(steps)
+
+    def _run(self, steps: List[Tuple[str, Callable]]):
+        try:
+            for name, step in steps:
+                self._last = time.perf_counter()
+                details = step()
+                self.mark(name)
+                if details:
+                    self.phases[f"{name}_steps"] = details
+        except Exception as e:
+            # Serve anyway: the first requests pay for whatever was not warmed
+            self.error = f"{name}: {e}"
+            logger.exception("Startup phase %s failed", name)
+
+        self.total_ms = round((time.perf_counter() - STARTED) * 1000, 2)
+        self._ready.set()
+        logger.info("Startup (%s) finished in %.0f ms: %s", self.mode, self.total_ms, self.phases)
+
+    def stats(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "ready": self.ready,
+            "phases_ms": dict(self.phases),
+            "total_ms": self.total_ms,
+            "error": self.error
+        }
@@ -0,0 +1,42 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+# The backend modules are imported flat, as app.py imports them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Build engines on first use instead of warming up workers at import
+os.environ.setdefault('STARTUP_MODE', 'lazy')
+
+PROFILE = {
+    "education": "Bachelor's Degree",
+    "skills": ["Python", "Communication"],
+    "sector": "IT & Software",
+    "location": "Delhi"
+}
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    import app
+    yield app
+    app.extraction_pool.shutdown()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def engine(app_module, tmp_path, monkeypatch):
+    """The app's engine, on a copy of the bundled catalog that tests may change"""
+    from recommendation_engine import RecommendationEngine
+
+    path = str(tmp_path / 'internships.json')
+    shutil.copy(os.path.join(os.path.dirname(app_module.__file__), 'data', 'internships.json'), path)
+    engine = RecommendationEngine(data_path=path)
+    monkeypatch.setattr(app_module, 'recommendation_engine', engine)
+    return engine
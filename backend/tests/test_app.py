@@ -0,0 +1,111 @@
+"""
+Tests for the Flask routes in app.py
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import io
+
+import pytest
+
+import config
+from conftest import PROFILE
+from resume_parser import ResumeParser
+
+
+@pytest.mark.parametrize('field, value', [
+    ('skills', None),
+    ('skills', 'Python'),
+    ('skills', ['Python', 5]),
+    ('education', None),
+    ('sector', 3),
+    ('location', None),
+    ('location', ['Delhi'])
+])
+def test_recommend_rejects_mistyped_profile_fields(client, field, value):
+    response = client.post('/api/recommend', json=dict(PROFILE, **{field: value}))
+    assert response.status_code == 400
+    assert field in response.get_json()['error']
+
+
+def test_batch_reports_mistyped_profile_per_entry(client):
+    response = client.post('/api/recommend/batch', json={"profiles": [PROFILE, dict(PROFILE, skills=None)]})
+    results = response.get_json()['results']
+
+    assert response.status_code == 200
+    assert results[0]['success'] is True
+    assert results[1] == {"success": False, "error": "skills must be a list of strings"}
+
+
+RESUME = "Asha Rao\nasha.rao@example.com\nBachelor of Arts\nSkills: Python, Video Editing and public speaking"
+
+
+def upload_txt(client, text):
+    response = client.post('/api/resume/upload', data={'file': (io.BytesIO(text.encode('utf-8')), 'resume.txt')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    return response.get_json()['data']['skills']
+
+
+@pytest.mark.parametrize('body', [{"text": 5}, {"text": None}, {"text": ["resume"]}, ["text"], "text"])
+def test_parse_text_rejects_non_string_text(client, body):
+    response = client.post('/api/resume/parse-text', json=body)
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_resume_cache_misses_after_skills_change(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, 'resume_parser', ResumeParser())
+    before = upload_txt(client, RESUME)
+
+    app_module.resume_parser.add_skills('media', ['Video Editing'])
+    after = upload_txt(client, RESUME)
+
+    assert 'Video Editing' not in before
+    assert 'Video Editing' in after
+
+
+def test_resume_cache_key_follows_extraction_settings(app_module, monkeypatch):
+    settings = app_module.resume_file_settings()
+    monkeypatch.setattr(config, 'RESUME_EARLY_STOP_SKILLS', config.RESUME_EARLY_STOP_SKILLS + 1)
+    assert app_module.resume_file_settings() != settings
+
+
+def test_recommend_pages_with_cursor(client, engine):
+    first = client.post('/api/recommend', json=dict(PROFILE, limit=2, min_score=0)).get_json()
+    second = client.post('/api/recommend', json=dict(PROFILE, limit=2, min_score=0,
+                                                     cursor=first['next_cursor'])).get_json()
+    everything = client.post('/api/recommend', json=dict(PROFILE, limit=4, min_score=0)).get_json()
+
+    assert first['total'] == second['total'] == everything['total'] > 4
+    assert second['offset'] == 2
+    assert first['recommendations'] + second['recommendations'] == everything['recommendations']
+
+
+@pytest.mark.parametrize('body', [
+    {'limit': 0},
+    {'limit': 10 ** 6},
+    {'offset': -1},
+    {'min_score': 'high'},
+    {'cursor': 5},
+    {'cursor': 'not-a-cursor'}
+])
+def test_recommend_rejects_bad_page_fields(client, engine, body):
+    response = client.post('/api/recommend', json=dict(PROFILE, **body))
+    assert response.status_code == 400
+
+
+def test_cursor_from_another_query_is_rejected(client, engine):
+    cursor = client.post('/api/recommend', json=dict(PROFILE, limit=1, min_score=0)).get_json()['next_cursor']
+    response = client.post('/api/recommend', json=dict(PROFILE, sector='Healthcare', limit=1, cursor=cursor))
+    assert response.status_code == 400
+
+
+def test_cursor_expires_when_catalog_changes(client, engine):
+    cursor = client.post('/api/recommend', json=dict(PROFILE, limit=1, min_score=0)).get_json()['next_cursor']
+    posting = engine.catalog.get('INT001').to_dict()
+    engine.catalog.upsert([dict(posting, title='Renamed')])
+
+    response = client.post('/api/recommend', json=dict(PROFILE, limit=1, min_score=0, cursor=cursor))
+    assert response.status_code == 410
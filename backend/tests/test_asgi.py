@@ -0,0 +1,143 @@
+"""
+Tests for asgi (the Starlette app answers like the Flask app)
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+pytest.importorskip('starlette')
+pytest.importorskip('httpx')
+
+from starlette.testclient import TestClient
+
+from conftest import PROFILE
+
+
+@pytest.fixture
+def asgi_client(app_module, engine):
+    import asgi
+
+    # Not used as a context manager: the lifespan exit would shut down
+    # the extraction pool shared with the other tests
+    return TestClient(asgi.app)
+
+
+@pytest.mark.parametrize('body', [
+    PROFILE,
+    dict(PROFILE, limit=5, min_score=0, omit=['description']),
+    {"education": "Diploma"},
+    dict(PROFILE, skills='Python'),
+    dict(PROFILE, cursor='bad')
+])
+def test_recommend_matches_flask(client, asgi_client, body):
+    flask = client.post('/api/recommend', json=body)
+    response = asgi_client.post('/api/recommend', json=body)
+
+    assert response.status_code == flask.status_code
+    assert response.json() == flask.get_json()
+
+
+def test_parse_text_matches_flask(client, asgi_client):
+    for body in ({"text": "B.Tech graduate, skilled in Python, SQL and Excel. Delhi."}, {"text": "x"}, {"text": 5}, {}):
+        flask = client.post('/api/resume/parse-text', json=body)
+        response = asgi_client.post('/api/resume/parse-text', json=body)
+        assert (response.status_code, response.json()) == (flask.status_code, flask.get_json())
+
+
+@pytest.mark.parametrize('filename, content', [
+    ('resume.txt', b"Asha Rao\nasha.rao@example.com\nDiploma\nSkills: Python and Excel"),
+    ('resume.exe', b"MZ"),
+    ('resume.txt', b"a" * (5 * 1024 * 1024 + 10))
+])
+def test_upload_matches_flask(client, asgi_client, app_module, filename, content):
+    flask = client.post('/api/resume/upload', data={'file': (io.BytesIO(content), filename)},
+                        content_type='multipart/form-data')
+    response = asgi_client.post('/api/resume/upload', files={'file': (filename, content)})
+
+    assert response.status_code == flask.status_code
+    body, expected = response.json(), flask.get_json()
+    body.pop('processing', None)
+    expected.pop('processing', None)
+    assert body == expected
+
+
+def chunked_upload(filename, content, chunk_size=64 * 1024):
+    """
+    Send a multipart upload to the ASGI app in chunks without a
+    Content-Length; returns the status, the JSON body and the bytes the
+    app read
+    """
+    import asgi
+
+    boundary = 'resume-boundary'
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f'Content-Type: text/plain\r\n\r\n').encode('ascii') + content + f'\r\n--{boundary}--\r\n'.encode('ascii')
+    chunks = [body[start:start + chunk_size] for start in range(0, len(body), chunk_size)]
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'POST', 'scheme': 'http',
+        'path': '/api/resume/upload', 'raw_path': b'/api/resume/upload', 'query_string': b'', 'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'transfer-encoding', b'chunked'),
+                    (b'content-type', f'multipart/form-data; boundary={boundary}'.encode('ascii'))],
+        'client': ('127.0.0.1', 5000), 'server': ('testserver', 80)
+    }
+    read = []
+    sent = []
+
+    async def receive():
+        if len(read) < len(chunks):
+            read.append(len(chunks[len(read)]))
+            return {'type': 'http.request', 'body': chunks[len(read) - 1], 'more_body': len(read) < len(chunks)}
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    status = sent[0]['status']
+    payload = json.loads(b''.join(message.get('body', b'') for message in sent[1:]))
+    return status, payload, sum(read)
+
+
+def test_chunked_upload_is_capped_while_received(app_module):
+    status, payload, read = chunked_upload('resume.txt', b'a' * (50 * 1024 * 1024))
+
+    assert status == 400
+    assert payload['error'] == "File too large. Maximum size: 5MB"
+    assert read < 2 * app_module.MAX_FILE_SIZE
+
+
+def test_small_chunked_upload_is_parsed(app_module, engine):
+    status, payload, _ = chunked_upload('resume.txt', b"Diploma\nSkills: Python and Excel", chunk_size=16)
+    assert status == 200
+    assert 'Python' in payload['data']['skills']
+
+
+def test_upload_without_file_is_rejected(asgi_client):
+    response = asgi_client.post('/api/resume/upload', data={'name': 'resume'})
+    assert response.status_code == 400
+    assert response.json() == {"error": "No file provided", "success": False}
+
+
+def test_reference_lists_match_flask(client, asgi_client):
+    flask = client.get('/api/sectors')
+    response = asgi_client.get('/api/sectors')
+
+    assert response.json() == flask.get_json()
+    assert response.headers['etag'] == flask.headers['ETag']
+    assert asgi_client.get('/api/sectors', headers={'If-None-Match': flask.headers['ETag']}).status_code == 304
+
+
+def test_large_responses_are_compressed(asgi_client):
+    body = dict(PROFILE, limit=50, min_score=0)
+    plain = asgi_client.post('/api/recommend', json=body, headers={'Accept-Encoding': 'identity'})
+    compressed = asgi_client.post('/api/recommend', json=body, headers={'Accept-Encoding': 'gzip'})
+
+    assert 'content-encoding' not in plain.headers
+    assert compressed.headers['content-encoding'] == 'gzip'
+    assert compressed.json() == plain.json()
@@ -0,0 +1,64 @@
+"""
+Tests for benchmarks.bench_suite (statistics, baseline comparison, a small run)
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import json
+import sys
+
+from benchmarks import bench_suite
+from benchmarks.bench_suite import compare, measure, percentile, summarize
+
+
+def test_percentile_uses_nearest_rank():
+    ordered = [float(i) for i in range(1, 101)]
+    assert percentile(ordered, 0.50) == 51.0
+    assert percentile(ordered, 0.99) == 100.0
+    assert percentile([3.0], 0.95) == 3.0
+
+
+def test_measure_times_every_item_after_warmup():
+    calls = []
+    latencies = measure(calls.append, [1, 2, 3], warmup=2)
+    assert calls == [1, 2, 1, 2, 3]
+    assert len(latencies) == 3 and all(latency >= 0 for latency in latencies)
+
+
+def test_summarize_reports_milliseconds(capsys):
+    result = summarize("case", {"size": 1}, [0.004, 0.001, 0.002, 0.003])
+    assert result["count"] == 4
+    assert (result["mean_ms"], result["p50_ms"], result["p99_ms"]) == (2.5, 3.0, 4.0)
+    assert result["throughput_per_s"] == 400.0
+    assert "case" in capsys.readouterr().out
+
+
+def test_compare_prints_p50_change(tmp_path, capsys):
+    baseline = tmp_path / 'baseline.json'
+    old = [{"name": "recommend", "params": {"postings": 30}, "p50_ms": 2.0},
+           {"name": "parse", "params": {}, "p50_ms": 1.0}]
+    baseline.write_text(json.dumps({"results": old}), encoding='utf-8')
+
+    compare([{"name": "recommend", "params": {"postings": 30}, "p50_ms": 1.0},
+             {"name": "extract", "params": {}, "p50_ms": 1.0}], str(baseline))
+
+    out = capsys.readouterr().out
+    assert "-50%" in out and "extract" not in out
+
+
+def test_small_run_writes_and_compares_results(tmp_path, monkeypatch, capsys):
+    output = str(tmp_path / 'run.json')
+    argv = ['bench_suite', '--sizes', '30', '--queries', '3', '--resumes', '2', '--pages', '1',
+            '--only', 'recommend', 'parse', 'extract', '--output', output]
+    monkeypatch.setattr(sys, 'argv', argv)
+    bench_suite.main()
+
+    with open(output, 'r', encoding='utf-8') as f:
+        run = json.load(f)
+    assert {"environment", "args", "results"} <= set(run)
+    assert {result["name"] for result in run["results"]} >= {"recommend", "parse_text"}
+
+    monkeypatch.setattr(sys, 'argv', argv[:-2] + ['--baseline', output])
+    bench_suite.main()
+    assert f"p50 against {output}" in capsys.readouterr().out
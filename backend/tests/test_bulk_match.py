@@ -0,0 +1,91 @@
+"""
+Tests for the batch endpoint and the bulk_match CLI
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import argparse
+import csv
+import json
+
+import pytest
+
+import config
+from benchmarks.synthetic import generate_catalog, generate_profiles, write_catalog
+from bulk_match import run
+from conftest import PROFILE
+from recommendation_engine import RecommendationEngine
+from records import serialize
+
+
+@pytest.fixture(scope='module')
+def setup(tmp_path_factory):
+    folder = tmp_path_factory.mktemp('bulk')
+    catalog_path = write_catalog(str(folder / 'internships.json'), generate_catalog(300, seed=12))
+    profiles = generate_profiles(40, seed=13)
+    engine = RecommendationEngine(data_path=catalog_path)
+    expected = [serialize(engine.recommend(**profile)) for profile in profiles]
+    return folder, catalog_path, profiles, expected
+
+
+def bulk_args(input_path, output_path, catalog_path, workers):
+    return argparse.Namespace(input=input_path, output=output_path, workers=workers, chunk_size=7,
+                              backend='python', data=catalog_path, skills_separator=';')
+
+
+def read_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_jsonl_input_keeps_order_and_reports_bad_lines(setup, workers):
+    folder, catalog_path, profiles, expected = setup
+    input_path, output_path = str(folder / 'in.jsonl'), str(folder / f'out{workers}.jsonl')
+    with open(input_path, 'w', encoding='utf-8') as f:
+        for profile in profiles[:20]:
+            f.write(json.dumps(profile) + '\n')
+        f.write('{not json\n\n')
+        f.write(json.dumps({"education": "Diploma"}) + '\n')
+        for profile in profiles[20:]:
+            f.write(json.dumps(profile) + '\n')
+
+    assert run(bulk_args(input_path, output_path, catalog_path, workers)) == len(profiles) + 2
+    results = read_results(output_path)
+
+    good = [result for result in results if result['success']]
+    assert [result['recommendations'] for result in good] == expected
+    assert results[20]['line'] == 21 and results[20]['error'].startswith('Invalid JSON')
+    assert results[21] == {"line": 23, "success": False, "error": "Missing required field: skills"}
+
+
+def test_csv_input_splits_skills(setup):
+    folder, catalog_path, profiles, expected = setup
+    input_path, output_path = str(folder / 'in.csv'), str(folder / 'out.jsonl')
+    with open(input_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['education', 'skills', 'sector', 'location'])
+        writer.writeheader()
+        for profile in profiles:
+            writer.writerow(dict(profile, skills='; '.join(profile['skills'])))
+
+    run(bulk_args(input_path, output_path, catalog_path, 1))
+
+    assert [result['recommendations'] for result in read_results(output_path)] == expected
+
+
+def test_batch_endpoint_matches_single_requests(client, engine):
+    profiles = [PROFILE, dict(PROFILE, sector='Healthcare'), PROFILE]
+    response = client.post('/api/recommend/batch', json={"profiles": profiles})
+    results = response.get_json()['results']
+
+    assert response.status_code == 200
+    for profile, result in zip(profiles, results):
+        single = client.post('/api/recommend', json=profile).get_json()
+        assert result['recommendations'] == single['recommendations']
+
+
+def test_batch_endpoint_limits_size(client, engine, monkeypatch):
+    monkeypatch.setattr(config, 'MAX_BATCH_SIZE', 2)
+    assert client.post('/api/recommend/batch', json={"profiles": [PROFILE] * 3}).status_code == 400
+    assert client.post('/api/recommend/batch', json={"profiles": PROFILE}).status_code == 400
@@ -0,0 +1,62 @@
+"""
+Tests for catalog_db.SqliteCatalogStore
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import os
+
+import pytest
+
+from catalog_db import SqliteCatalogStore
+
+CATALOG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'internships.json')
+
+WEIGHTS = {'skill_match': 0.4, 'sector_match': 0.25, 'location_match': 0.2, 'education_match': 0.15}
+
+POSTING = {
+    'id': 'TEST001', 'title': 'Drone Survey Intern', 'company': 'Test Co', 'sector': 'Agriculture',
+    'location': 'Nagpur', 'duration': '3 months', 'stipend': '5000', 'education_required': '12th Pass',
+    'required_skills': ['Drone Piloting'], 'description': 'Survey fields'
+}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'catalog.db')
+    SqliteCatalogStore(path, json_path=CATALOG)
+    return path
+
+
+def nagpur_candidates(snapshot):
+    return [
+        snapshot.internships[position].id
+        for position in snapshot.index.candidates('12th Pass', ['Drone Piloting'], 'Agriculture', 'Nagpur',
+                                                  WEIGHTS, 100.0, within_km=0)
+    ]
+
+
+def test_snapshot_reads_one_version_while_another_store_writes(db_path):
+    reader, writer = SqliteCatalogStore(db_path), SqliteCatalogStore(db_path)
+
+    snapshot = reader.current()
+    writer.upsert([POSTING])
+
+    assert 'TEST001' not in nagpur_candidates(snapshot)
+    snapshot.close()
+
+    fresh = reader.current()
+    assert fresh.version == snapshot.version + 1
+    assert 'TEST001' in nagpur_candidates(fresh)
+    fresh.close()
+
+
+def test_closed_snapshot_ends_its_read_transaction(db_path):
+    store = SqliteCatalogStore(db_path)
+    snapshot = store.current()
+    assert store._conn().in_transaction
+
+    snapshot.close()
+    assert not store._conn().in_transaction
+    assert not store.snapshot._conn.in_transaction
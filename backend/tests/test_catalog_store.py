@@ -0,0 +1,141 @@
+"""
+Tests for catalog_store.CatalogStore updates and the admin catalog API
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import json
+import random
+
+import pytest
+
+import config
+from benchmarks.synthetic import generate_catalog, generate_profiles, load_reference_data, write_catalog
+from recommendation_engine import RecommendationEngine
+from test_recommendation_engine import full_scan
+
+TOKEN = 'test-admin-token'
+
+
+def random_posting(rnd, posting_id, reference):
+    posting = dict(rnd.choice(reference['internships']), id=posting_id)
+    posting['sector'] = rnd.choice(reference['sectors'])
+    posting['required_skills'] = rnd.sample(reference['skills'], rnd.randint(1, 5))
+    return posting
+
+
+@pytest.mark.parametrize('scoring_backend', ['python', 'numpy'])
+def test_incremental_updates_match_a_rebuild(tmp_path, scoring_backend):
+    if scoring_backend == 'numpy':
+        pytest.importorskip('numpy')
+    rnd = random.Random(17)
+    reference = load_reference_data()
+    catalog = generate_catalog(400, seed=3)
+    path = write_catalog(str(tmp_path / 'internships.json'), catalog)
+    engine = RecommendationEngine(data_path=path, scoring_backend=scoring_backend)
+    profiles = generate_profiles(15, seed=9)
+
+    for step in range(40):
+        if step % 3 == 0:
+            # Enough removals to trigger compaction along the way
+            removed = rnd.sample([posting['id'] for posting in catalog], 12)
+            assert engine.catalog.remove(removed + ['NOPE'])['missing'] == ['NOPE']
+            catalog = [posting for posting in catalog if posting['id'] not in removed]
+        else:
+            existing = rnd.choice(catalog)
+            changed = random_posting(rnd, existing['id'], reference)
+            added = random_posting(rnd, f"NEW{step:03d}", reference)
+            assert engine.catalog.upsert([changed, added]) == {"added": 1, "updated": 1}
+            catalog = [changed if posting['id'] == existing['id'] else posting for posting in catalog] + [added]
+
+        for profile in profiles:
+            got = [(match.internship.id, match.total_score) for match in engine.recommend(**profile)]
+            assert got == full_scan(catalog, **profile), (step, profile)
+
+    # Written back to the file: a fresh engine sees the same catalog
+    with open(path, 'r', encoding='utf-8') as f:
+        assert [posting['id'] for posting in json.load(f)['internships']] == [posting['id'] for posting in catalog]
+
+
+def test_reload_picks_up_file_changes(tmp_path):
+    catalog = generate_catalog(50, seed=4)
+    path = write_catalog(str(tmp_path / 'internships.json'), catalog)
+    engine = RecommendationEngine(data_path=path)
+    version = engine.catalog_version
+
+    write_catalog(path, catalog[:10])
+    engine.reload()
+
+    assert engine.catalog_version == version + 1
+    assert len(engine.catalog.current()) == 10
+
+
+@pytest.fixture
+def admin(client, engine, monkeypatch):
+    monkeypatch.setattr(config, 'ADMIN_TOKEN', TOKEN)
+
+    def call(method, url, **kwargs):
+        return client.open(url, method=method, headers={'X-Admin-Token': TOKEN}, **kwargs)
+
+    return call
+
+
+def test_admin_api_needs_the_token(client, engine, monkeypatch):
+    assert client.get('/api/admin/catalog').status_code == 403
+
+    monkeypatch.setattr(config, 'ADMIN_TOKEN', TOKEN)
+    assert client.get('/api/admin/catalog').status_code == 401
+    assert client.get('/api/admin/catalog', headers={'X-Admin-Token': 'wrong'}).status_code == 401
+
+
+def test_admin_add_update_and_delete(admin, engine):
+    posting = engine.catalog.get('INT001').to_dict()
+    new = dict(posting, id='INT999', title='Robotics Intern')
+
+    response = admin('POST', '/api/admin/internships', json={"internships": [new]})
+    assert response.status_code == 200
+    assert response.get_json()['added'] == 1
+    assert engine.catalog.get('INT999').title == 'Robotics Intern'
+
+    response = admin('PUT', '/api/admin/internships/INT999', json=dict(new, title='Drone Intern'))
+    assert response.get_json()['updated'] == 1
+    assert engine.catalog.get('INT999').title == 'Drone Intern'
+
+    assert admin('DELETE', '/api/admin/internships/INT999').status_code == 200
+    assert engine.catalog.get('INT999') is None
+    assert admin('DELETE', '/api/admin/internships/INT999').status_code == 404
+
+
+def test_admin_upsert_rejects_incomplete_postings(admin, engine):
+    response = admin('POST', '/api/admin/internships', json={"internships": [{"id": "INT999"}]})
+    assert response.status_code == 400
+    assert engine.catalog.get('INT999') is None
+
+
+@pytest.mark.parametrize('field, value', [
+    ('sector', 5), ('title', None), ('duration', ['3 months']), ('stipend', 5000),
+    ('required_skills', 'Python'), ('required_skills', ['Python', 3])
+])
+def test_admin_upsert_rejects_mistyped_fields(admin, engine, field, value):
+    original = engine.catalog.get('INT001').to_dict()
+    posting = dict(original, id='INT999', **{field: value})
+
+    response = admin('POST', '/api/admin/internships', json={"internships": [posting]})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+    assert admin('PUT', '/api/admin/internships/INT001', json=posting).status_code == 400
+    assert engine.catalog.get('INT999') is None
+    assert engine.catalog.get('INT001').to_dict() == original
+
+
+def test_mistyped_posting_leaves_the_sqlite_catalog_untouched(admin, app_module, monkeypatch):
+    engine = RecommendationEngine(data_path=app_module.recommendation_engine.data_path, storage_backend='sqlite')
+    monkeypatch.setattr(app_module, 'recommendation_engine', engine)
+    version = engine.catalog_version
+    posting = dict(engine.catalog.get('INT001').to_dict(), id='INT999', sector=5)
+
+    assert admin('POST', '/api/admin/internships', json=posting).status_code == 400
+    assert engine.catalog.get('INT999') is None
+    assert engine.catalog_version == version
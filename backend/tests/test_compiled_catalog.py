@@ -0,0 +1,69 @@
+"""
+Tests for compiled_catalog.CompiledCatalogStore
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from benchmarks.synthetic import generate_catalog, write_catalog
+from catalog_store import ReadOnlyCatalogError
+from compiled_catalog import CompiledCatalogStore
+
+WEIGHTS = {'skill_match': 0.40, 'sector_match': 0.30, 'location_match': 0.20, 'education_match': 0.10}
+
+
+@pytest.fixture
+def paths(tmp_path):
+    json_path = write_catalog(str(tmp_path / 'internships.json'), generate_catalog(200, seed=8))
+    return json_path, str(tmp_path / 'internships.bin')
+
+
+def test_round_trips_postings(paths):
+    json_path, bin_path = paths
+    catalog = generate_catalog(200, seed=8)
+    store = CompiledCatalogStore(json_path, bin_path, WEIGHTS, reload_interval=0)
+    snapshot = store.current()
+
+    assert len(snapshot) == len(catalog)
+    for position, posting in enumerate(catalog):
+        assert snapshot.internships[position].to_dict() == posting
+
+
+def test_workers_share_the_compiled_file(paths):
+    json_path, bin_path = paths
+    first = CompiledCatalogStore(json_path, bin_path, WEIGHTS, reload_interval=0)
+    compiled = os.stat(bin_path).st_mtime_ns
+
+    second = CompiledCatalogStore(json_path, bin_path, WEIGHTS, reload_interval=0)
+
+    assert os.stat(bin_path).st_mtime_ns == compiled
+    assert second.current().internships[0].to_dict() == first.current().internships[0].to_dict()
+
+
+def test_recompiles_when_the_json_catalog_changes(paths):
+    json_path, bin_path = paths
+    store = CompiledCatalogStore(json_path, bin_path, WEIGHTS, reload_interval=0.001)
+
+    write_catalog(json_path, generate_catalog(20, seed=9))
+    os.utime(json_path, ns=(os.stat(json_path).st_atime_ns, os.stat(json_path).st_mtime_ns + 10 ** 9))
+    store._checked -= 1
+
+    snapshot = store.current()
+    assert snapshot.version == 2
+    assert len(snapshot) == 20
+    # Another worker starting now maps the recompiled file
+    assert len(CompiledCatalogStore(json_path, bin_path, WEIGHTS, reload_interval=0).current()) == 20
+
+
+def test_is_read_only(paths):
+    store = CompiledCatalogStore(*paths, WEIGHTS, reload_interval=0)
+    with pytest.raises(ReadOnlyCatalogError):
+        store.upsert([])
+    with pytest.raises(ReadOnlyCatalogError):
+        store.remove(['SYN000001'])
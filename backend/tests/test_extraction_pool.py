@@ -0,0 +1,71 @@
+"""
+Tests for extraction_pool.ExtractionPool
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import threading
+import time
+
+import pytest
+
+from extraction_pool import ExtractionBusy, ExtractionPool, ExtractionTimeout
+
+
+def nap(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def pool():
+    pool = ExtractionPool(max_workers=1, timeout=1.0)
+    pool.warm_up()
+    yield pool
+    pool.shutdown()
+
+
+def run_concurrently(pool, jobs):
+    """Run each job's pool.run(nap, seconds) from its own thread; results or exceptions in order"""
+    outcomes = [None] * len(jobs)
+
+    def worker(index, seconds):
+        try:
+            outcomes[index] = pool.run(nap, seconds)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i, seconds)) for i, seconds in enumerate(jobs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_queue_wait_does_not_count_against_timeout(pool):
+    # Three jobs of 0.6s on one worker take 1.8s in all; each is within the 1s limit
+    assert run_concurrently(pool, [0.6, 0.6, 0.6]) == [0.6, 0.6, 0.6]
+
+
+def test_busy_when_no_worker_frees_up(pool):
+    pool.queue_timeout = 0.1
+    outcomes = run_concurrently(pool, [0.8, 0.8])
+    assert 0.8 in outcomes
+    assert any(isinstance(outcome, ExtractionBusy) for outcome in outcomes)
+
+
+def test_wait_for_worker_is_never_busy(pool):
+    pool.queue_timeout = 0.1
+    first = threading.Thread(target=pool.run, args=(nap, 0.5))
+    first.start()
+    time.sleep(0.1)
+    assert pool.run(nap, 0.2, wait_for_worker=True) == 0.2
+    first.join()
+
+
+def test_overrun_is_killed_and_pool_recovers(pool):
+    with pytest.raises(ExtractionTimeout):
+        pool.run(nap, 5)
+    assert pool.run(nap, 0.1) == 0.1
@@ -0,0 +1,88 @@
+"""
+Tests for geo location scoring and the within_km filter
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import pytest
+
+import config
+from conftest import PROFILE
+from geo import distance_km, get_gazetteer, location_score, resolve, within
+
+
+@pytest.fixture(autouse=True)
+def geo_scoring(monkeypatch):
+    monkeypatch.setattr(config, 'LOCATION_SCORING', 'geo')
+
+
+def test_resolves_names_aliases_and_parts():
+    assert resolve('bombay').name == 'Mumbai'
+    assert resolve('pune, maharashtra').name == 'Pune'
+    assert resolve('maharashtra').kind == 'state'
+    assert resolve('remote') is None
+
+
+def test_location_score_rules():
+    mumbai, pune = resolve('mumbai'), resolve('pune')
+    expected = 100.0 * 0.5 ** (mumbai.distance_to(pune) / config.LOCATION_HALF_DISTANCE_KM)
+
+    assert location_score('mumbai', 'bombay') == 100.0
+    assert location_score('maharashtra', 'pune') == 70.0
+    assert location_score('mumbai', 'pune') == pytest.approx(expected)
+    assert 0 < expected < 70
+    # Farther than LOCATION_MAX_KM
+    assert location_score('mumbai', 'delhi') == 0.0
+    # Unknown places keep the text rules
+    assert location_score('remote', 'remote') == 100.0
+    assert location_score('work from home', 'home') == 70.0
+
+
+def test_text_mode_ignores_distance(monkeypatch):
+    monkeypatch.setattr(config, 'LOCATION_SCORING', 'text')
+    assert location_score('mumbai', 'pune') == 0.0
+    assert location_score('mumbai', 'bombay') == 0.0
+
+
+def test_grid_finds_the_same_cities_as_a_full_scan():
+    gazetteer = get_gazetteer()
+    cities = [place for place in gazetteer.places if place.kind == 'city']
+
+    for place in cities:
+        for km in (10, 75, 300):
+            near = {city.id for city in gazetteer.cities_within(place, km)}
+            assert near == {city.id for city in cities if place.distance_to(city) <= km}
+
+
+def test_within():
+    assert within('delhi', 'noida', 50)
+    assert not within('delhi', 'noida', 5)
+    assert within('maharashtra', 'pune', 1)
+    assert not within('delhi', 'remote', 1000)
+
+
+def test_within_km_keeps_only_nearby_postings(client, engine):
+    body = dict(PROFILE, within_km=50, limit=50, min_score=0)
+    response = client.post('/api/recommend', json=body)
+    delhi = resolve('delhi')
+
+    assert response.status_code == 200
+    locations = {match['location'] for match in response.get_json()['recommendations']}
+    assert locations
+    for location in locations:
+        place = resolve(location.lower())
+        assert place is delhi or distance_km(delhi.lat, delhi.lon, place.lat, place.lon) <= 50
+
+
+@pytest.mark.parametrize('within_km', [0, -5, '50', True])
+def test_within_km_must_be_a_positive_number(client, engine, within_km):
+    response = client.post('/api/recommend', json=dict(PROFILE, within_km=within_km))
+    assert response.status_code == 400
+
+
+def test_within_km_needs_a_known_location_and_geo_mode(client, engine, monkeypatch):
+    assert client.post('/api/recommend', json=dict(PROFILE, location='Atlantis', within_km=50)).status_code == 400
+
+    monkeypatch.setattr(config, 'LOCATION_SCORING', 'text')
+    assert client.post('/api/recommend', json=dict(PROFILE, within_km=50)).status_code == 400
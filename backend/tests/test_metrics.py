@@ -0,0 +1,75 @@
+"""
+Tests for metrics and the /api/metrics endpoint
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import pytest
+
+import config
+import metrics
+from conftest import PROFILE
+from metrics import Collected, Counter, Histogram, Registry
+
+
+def test_counter_renders_per_label():
+    counter = Counter('things_total', 'Things', ('kind',))
+    counter.inc('a')
+    counter.inc('a', amount=2)
+    counter.inc('b"x')
+
+    assert counter.value('a') == 3
+    assert counter.render() == [
+        '# HELP things_total Things', '# TYPE things_total counter',
+        'things_total{kind="a"} 3', 'things_total{kind="b\\"x"} 1'
+    ]
+
+
+def test_histogram_buckets_and_window_quantiles():
+    histogram = Histogram('latency_seconds', 'Latency', ('route',), buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(seconds, 'r')
+    lines = histogram.render()
+
+    assert 'latency_seconds_bucket{route="r",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="r",le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{route="r",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{route="r"} 4' in lines
+    counts = histogram.window_counts('r')
+    assert counts == [2, 1, 1]
+    assert histogram.quantile(0.5, counts) == pytest.approx(0.1)
+    assert histogram.quantile(0.99, counts) == 1.0
+
+
+def test_disabled_metrics_record_nothing(monkeypatch):
+    monkeypatch.setattr(config, 'METRICS_ENABLED', False)
+    counter = Counter('off_total', 'Off')
+    counter.inc()
+    assert counter.value() == 0
+
+
+def test_registry_rejects_duplicate_names():
+    registry = Registry()
+    registry.register(Collected('size', 'Size', 'gauge', lambda: 3))
+    with pytest.raises(ValueError):
+        registry.register(Counter('size', 'Size'))
+    assert registry.render() == '# HELP size Size\n# TYPE size gauge\nsize 3\n'
+
+
+def test_metrics_endpoint_reports_requests(client, engine):
+    client.post('/api/recommend', json=PROFILE)
+    response = client.get('/api/metrics')
+    text = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+    assert 'pmi_stage_seconds_count{route="get_recommendations",stage="total"}' in text
+    assert f'pmi_catalog_internships {len(engine.internships)}' in text
+    assert 'pmi_cache_hits_total{cache="recommend"}' in text
+    assert metrics.CANDIDATES_SCORED.value() > 0
+
+
+def test_metrics_endpoint_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(config, 'METRICS_ENABLED', False)
+    assert client.get('/api/metrics').status_code == 404
@@ -0,0 +1,112 @@
+"""
+Tests for profiling (stack sampling of live requests)
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+import config
+import profiling
+from conftest import PROFILE
+from profiling import StackSampler, collapse
+
+
+def make_sampler(directory, **limits):
+    settings = dict(interval=0.001, max_bytes=1 << 20, max_per_minute=2, max_concurrent=1)
+    settings.update(limits)
+    return StackSampler(str(directory), **settings)
+
+
+def test_collapse_lists_frames_root_first():
+    def inner():
+        return collapse(sys._getframe())
+
+    frames = inner().split(';')
+    assert frames[-1].startswith('tests/test_profiling.py:inner:')
+    assert frames[-2].startswith('tests/test_profiling.py:test_collapse_lists_frames_root_first:')
+
+
+def test_begin_respects_the_budget(tmp_path):
+    sampler = make_sampler(tmp_path, max_concurrent=5)
+    assert sampler.begin('recommend') and sampler.begin('recommend')
+    assert not sampler.begin('recommend')
+    assert sampler.begin('recommend', forced=True)
+    sampler.end()
+
+
+def test_begin_respects_the_concurrency_limit(tmp_path):
+    sampler = make_sampler(tmp_path)
+    assert sampler.begin('recommend', forced=True)
+    other = []
+    thread = threading.Thread(target=lambda: other.append(sampler.begin('recommend', forced=True)))
+    thread.start()
+    thread.join()
+    sampler.end()
+    assert other == [False]
+
+
+def busy_request(sampler, seconds):
+    sampler.begin('recommend')
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+    sampler.end()
+
+
+def test_samples_are_written_as_collapsed_stacks(tmp_path):
+    sampler = make_sampler(tmp_path)
+    thread = threading.Thread(target=busy_request, args=(sampler, 0.2))
+    thread.start()
+    thread.join()
+    sampler.flush()
+
+    # The sampler thread may be writing the same stacks; wait for its file
+    deadline = time.monotonic() + 5
+    while not [name for name in os.listdir(tmp_path) if name.endswith('.collapsed')]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    [name] = [name for name in os.listdir(tmp_path) if name.endswith('.collapsed')]
+    assert name.startswith('recommend-') and name.endswith('.collapsed')
+    with open(tmp_path / name, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines and all(':busy_request:' in line for line in lines)
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in lines) > 1
+
+
+def test_prune_deletes_the_oldest_files(tmp_path):
+    sampler = make_sampler(tmp_path, max_bytes=150)
+    for age, name in enumerate(['new', 'middle', 'old']):
+        path = tmp_path / f'{name}.collapsed'
+        path.write_text('x' * 100)
+        os.utime(path, (1000 - age, 1000 - age))
+    sampler.prune()
+    assert os.listdir(tmp_path) == ['new.collapsed']
+
+
+@pytest.fixture
+def sampler(tmp_path, monkeypatch):
+    sampler = make_sampler(tmp_path)
+    monkeypatch.setattr(profiling, '_sampler', sampler)
+    monkeypatch.setattr(config, 'ADMIN_TOKEN', 'test-admin-token')
+    return sampler
+
+
+def test_admin_header_profiles_a_request(client, engine, sampler):
+    response = client.post('/api/recommend', json=PROFILE,
+                           headers={'X-Profile': '1', 'X-Admin-Token': 'test-admin-token'})
+    assert response.headers.get('X-Profiled') == '1'
+    assert not sampler.active
+
+
+def test_requests_are_not_profiled_by_default(client, engine, sampler, monkeypatch):
+    monkeypatch.setattr(config, 'PROFILE_SAMPLE_RATE', 0)
+    for headers in ({}, {'X-Profile': '1'}, {'X-Profile': '1', 'X-Admin-Token': 'wrong'}):
+        assert 'X-Profiled' not in client.post('/api/recommend', json=PROFILE, headers=headers).headers
@@ -0,0 +1,65 @@
+"""
+Tests for query_cache.QueryCache and the recommendation result cache
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import query_cache
+from conftest import PROFILE
+from query_cache import QueryCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_byte_bound_evicts_and_skips_oversized_values():
+    cache = QueryCache(max_entries=10, max_bytes=10)
+    cache.set('a', 'x' * 4, size=6)
+    cache.set('b', 'y' * 4, size=6)
+    cache.set('c', 'z' * 100, size=100)
+
+    assert cache.get('a') is None and cache.get('c') is None
+    assert cache.get('b') == 'yyyy'
+    assert cache.stats()['bytes'] == 6
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(query_cache.time, 'monotonic', lambda: now[0])
+    cache = QueryCache(ttl=5)
+    cache.set('a', 1)
+
+    now[0] += 4
+    assert cache.get('a') == 1
+    now[0] += 2
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1 and len(cache) == 0
+
+
+def test_zero_entries_disables_the_cache():
+    cache = QueryCache(max_entries=0)
+    cache.set('a', 1)
+    assert not cache.enabled and cache.get('a') is None
+
+
+def test_recommendations_are_cached_until_the_catalog_changes(engine):
+    first = engine.recommend(**PROFILE)
+    assert engine.recommend(**PROFILE) is first
+    assert engine.recommend(PROFILE['education'], [s.upper() for s in PROFILE['skills']],
+                            PROFILE['sector'].lower(), PROFILE['location']) is first
+
+    posting = engine.catalog.get('INT001').to_dict()
+    engine.catalog.upsert([dict(posting, title='Renamed Intern')])
+
+    assert engine.recommend(**PROFILE) is not first
+    assert engine.cache.stats()['hits'] == 2
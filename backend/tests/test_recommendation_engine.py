@@ -0,0 +1,214 @@
+"""
+Tests for recommendation_engine.RecommendationEngine
+
+Rankings are checked against a full scan of the catalog with the
+original scoring rules, on a synthetic catalog.
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import random
+
+import pytest
+
+import config
+from benchmarks.synthetic import generate_catalog, generate_profiles, write_catalog
+from catalog_index import normalize
+from geo import location_score
+from recommendation_engine import MAX_RECOMMENDATIONS, RELEVANCE_THRESHOLD, RecommendationEngine
+
+EDUCATION_LEVELS = {'10th Pass': 1, '12th Pass': 2, 'Diploma': 3, "Bachelor's Degree": 4, "Master's Degree": 5}
+
+WEIGHTS = {'skill_match': 0.40, 'sector_match': 0.30, 'location_match': 0.20, 'education_match': 0.10}
+
+# (scoring backend, storage backend)
+BACKENDS = [('python', 'json'), ('numpy', 'json'), ('python', 'sqlite'), ('numpy', 'compiled')]
+
+# Profiles the generator does not produce: no skills, repeated skills, odd case
+EDGE_PROFILES = [
+    {'education': '10th Pass', 'skills': [], 'sector': 'Healthcare', 'location': 'Remote'},
+    {'education': 'PhD', 'skills': ['python', 'Python', ' PYTHON '], 'sector': 'it & software', 'location': 'delhi'},
+    {'education': "Master's Degree", 'skills': ['Welding'], 'sector': 'Unknown', 'location': 'Nowhere'}
+]
+
+
+def full_scan(catalog, education, skills, sector, location, min_score=RELEVANCE_THRESHOLD, limit=MAX_RECOMMENDATIONS):
+    """(id, total score) of every posting scoring above min_score, best first, with the original rules"""
+    user_skills = [s.lower().strip() for s in skills]
+    user_level = EDUCATION_LEVELS.get(education, 0)
+
+    scored = []
+    for posting in catalog:
+        posting_skills = [s.lower().strip() for s in posting['required_skills']]
+        skill = 0.0
+        if user_skills and posting_skills:
+            skill = min(sum(1 for s in user_skills if s in posting_skills) / len(posting_skills) * 100, 100)
+
+        sector_score = 100.0 if sector.lower().strip() == posting['sector'].lower().strip() else 0.0
+
+        posting_location = normalize(posting['location'])
+        location_match = location_score(normalize(location), posting_location)
+        if location_match == 0 and ('remote' in posting_location or 'anywhere' in posting_location):
+            location_match = 50.0
+
+        required_level = EDUCATION_LEVELS.get(posting['education_required'], 0)
+        education_match = 100.0 if user_level >= required_level else 50.0 if user_level == required_level - 1 else 0.0
+
+        total = (skill * WEIGHTS['skill_match'] + sector_score * WEIGHTS['sector_match']
+                 + location_match * WEIGHTS['location_match'] + education_match * WEIGHTS['education_match'])
+        scored.append((posting['id'], round(total, 2)))
+
+    # Stable: ties keep catalog order
+    scored.sort(key=lambda item: item[1], reverse=True)
+    relevant = [item for item in scored if item[1] > min_score]
+    return relevant if limit is None else relevant[:limit]
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    return generate_catalog(2000, seed=11)
+
+
+@pytest.fixture(scope='module')
+def catalog_path(catalog, tmp_path_factory):
+    return write_catalog(str(tmp_path_factory.mktemp('catalog') / 'internships.json'), catalog)
+
+
+@pytest.fixture(scope='module')
+def profiles():
+    return generate_profiles(300, seed=5) + EDGE_PROFILES
+
+
+@pytest.fixture(scope='module')
+def expected(catalog, profiles):
+    """Full-scan rankings per LOCATION_SCORING mode, computed once for all backends"""
+    rankings = {}
+
+    def ranking(location_scoring):
+        if location_scoring not in rankings:
+            previous, config.LOCATION_SCORING = config.LOCATION_SCORING, location_scoring
+            try:
+                rankings[location_scoring] = [full_scan(catalog, **profile) for profile in profiles]
+            finally:
+                config.LOCATION_SCORING = previous
+        return rankings[location_scoring]
+
+    return ranking
+
+
+def make_engine(path, scoring_backend='python', storage_backend='json'):
+    engine = RecommendationEngine(data_path=path, scoring_backend=scoring_backend, storage_backend=storage_backend)
+    engine.cache.max_entries = 0
+    engine.ranked_cache.max_entries = 0
+    return engine
+
+
+@pytest.mark.parametrize('location_scoring', ['text', 'geo'])
+@pytest.mark.parametrize('scoring_backend, storage_backend', BACKENDS)
+def test_recommend_matches_full_scan(catalog_path, profiles, expected, monkeypatch,
+                                     location_scoring, scoring_backend, storage_backend):
+    if scoring_backend == 'numpy':
+        pytest.importorskip('numpy')
+    rankings = expected(location_scoring)
+    monkeypatch.setattr(config, 'LOCATION_SCORING', location_scoring)
+    engine = make_engine(catalog_path, scoring_backend, storage_backend)
+
+    for profile, ranking in zip(profiles, rankings):
+        got = [(match.internship.id, match.total_score) for match in engine.recommend(**profile)]
+        assert got == ranking, profile
+
+
+def test_candidates_prune_without_losing_matches(catalog, catalog_path, profiles):
+    engine = make_engine(catalog_path)
+    snapshot = engine.catalog.current()
+    positions = {posting['id']: position for position, posting in enumerate(catalog)}
+
+    pruned = 0
+    for profile in profiles:
+        candidates = set(snapshot.index.candidates(
+            profile['education'], profile['skills'], profile['sector'], profile['location'],
+            engine.weights, RELEVANCE_THRESHOLD
+        ))
+        relevant = full_scan(catalog, **profile, limit=None)
+        assert {positions[posting_id] for posting_id, _ in relevant} <= candidates, profile
+        pruned += len(candidates) < len(catalog)
+
+    assert pruned > len(profiles) // 2
+
+
+def test_numpy_batch_matches_single_recommendations(catalog_path, profiles):
+    pytest.importorskip('numpy')
+    engine = make_engine(catalog_path, 'numpy')
+
+    batch = engine.recommend_batch(profiles)
+    single = [engine.recommend(**profile) for profile in profiles]
+
+    for batch_matches, matches in zip(batch, single):
+        assert [match.to_dict() for match in batch_matches] == [match.to_dict() for match in matches]
+
+
+@pytest.mark.parametrize('min_score', [RELEVANCE_THRESHOLD, 0, 47.5])
+@pytest.mark.parametrize('scoring_backend', ['python', 'numpy'])
+def test_pages_walk_the_full_ranking(catalog, catalog_path, profiles, scoring_backend, min_score):
+    if scoring_backend == 'numpy':
+        pytest.importorskip('numpy')
+    # Deeper pages are slices of the cached ranking
+    engine = RecommendationEngine(data_path=catalog_path, scoring_backend=scoring_backend)
+
+    for profile in profiles[:40] + EDGE_PROFILES:
+        ranking = full_scan(catalog, **profile, min_score=min_score, limit=None)
+        got, cursor = [], None
+        while True:
+            page = engine.recommend_page(**profile, limit=50, min_score=min_score, cursor=cursor)
+            assert page.total == len(ranking)
+            got += [(match.internship.id, match.total_score) for match in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert got == ranking, profile
+
+
+def test_rank_matches_a_stable_sort_on_rounded_scores(catalog_path):
+    engine = make_engine(catalog_path)
+    rnd = random.Random(21)
+
+    for _ in range(200):
+        # Few distinct values, so many ties, some only equal once rounded
+        rows = [(position, 0, 0, 0, 0, rnd.choice([10.0, 20.001, 30.004, 29.996, 55.5, 80.0]))
+                for position in range(rnd.randint(0, 60))]
+        expected = sorted((row for row in rows if round(row[-1], 2) > RELEVANCE_THRESHOLD),
+                          key=lambda row: round(row[-1], 2), reverse=True)
+
+        assert engine._rank(iter(rows), None) == expected
+        for limit in (1, 5, 100):
+            assert engine._rank(iter(rows), limit) == expected[:limit]
+
+
+def test_results_are_built_only_for_the_top_postings(catalog_path, monkeypatch):
+    engine = make_engine(catalog_path)
+    built = []
+    build_result = engine._build_result
+    monkeypatch.setattr(engine, '_build_result', lambda *args: built.append(args[1]) or build_result(*args))
+
+    matches = engine.recommend(**generate_profiles(1, seed=2)[0])
+
+    assert len(built) == len(matches) <= MAX_RECOMMENDATIONS
+
+
+def test_min_score_applies_to_rounded_totals(catalog, catalog_path, profiles):
+    pytest.importorskip('numpy')
+    engines = [make_engine(catalog_path, backend) for backend in ('python', 'numpy')]
+
+    checked = 0
+    for profile in profiles[:30]:
+        # Just below each rounded score: a total such as 26.6667 is under
+        # min_score 26.667 but its rounded score 26.67 is above it
+        for min_score in sorted({score - 0.003 for _, score in full_scan(catalog, **profile, limit=None)})[-5:]:
+            ranking = full_scan(catalog, **profile, min_score=min_score, limit=None)
+            for engine in engines:
+                page = engine.recommend_page(**profile, limit=len(catalog), min_score=min_score)
+                assert [(match.internship.id, match.total_score) for match in page.items] == ranking, profile
+            checked += 1
+
+    assert checked > 100
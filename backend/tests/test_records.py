@@ -0,0 +1,71 @@
+"""
+Tests for records (Internship, Recommendation, InternTable)
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import gc
+import json
+import os
+
+import pytest
+
+from records import RECOMMENDATION_FIELDS, InternTable, Internship, Recommendation, from_dicts, serialize
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'internships.json')
+
+
+@pytest.fixture(scope='module')
+def postings():
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)['internships']
+
+
+def test_postings_round_trip(postings):
+    extended = [dict(posting, featured=True) for posting in postings[:3]] + postings[3:]
+    assert [internship.to_dict() for internship in from_dicts(extended)] == extended
+
+
+def test_records_have_no_instance_dict(postings):
+    internship = Internship.from_dict(postings[0])
+    assert not hasattr(internship, '__dict__')
+    with pytest.raises(AttributeError):
+        internship.rating = 5
+
+
+def test_repeated_values_are_shared(postings):
+    first, second = from_dicts([postings[0], dict(postings[0], id='copy')])
+    assert first.sector is second.sector
+    assert first.required_skills[0] is second.required_skills[0]
+    assert first.sector_code == second.sector_code and first.skill_keys is not second.skill_keys
+    assert first.sector_key == first.sector.lower().strip()
+
+
+def test_from_dicts_restores_the_collector(postings):
+    assert gc.isenabled()
+    from_dicts(postings)
+    assert gc.isenabled()
+
+
+def test_intern_table_codes_are_stable():
+    table = InternTable()
+    delhi = table.code_of('Delhi ')
+    assert table.code_of('delhi') == delhi == table.find('delhi')
+    assert table.code('mumbai') == delhi + 1
+    assert table.find('chennai') == -1
+    assert table.value(delhi) == 'delhi'
+
+
+def test_recommendation_shape_and_omit(postings):
+    internship = Internship.from_dict(postings[0])
+    recommendation = Recommendation(internship, 72.5, 50.0, 100.0, 100.0, 100.0, 'Good match')
+    data = recommendation.to_dict()
+
+    assert tuple(data) == RECOMMENDATION_FIELDS
+    assert data['score_breakdown'] == {'skill_match': 50.0, 'sector_match': 100.0,
+                                       'location_match': 100.0, 'education_match': 100.0}
+    assert serialize([recommendation], omit=('description', 'explanation')) == [
+        {key: value for key, value in data.items() if key not in ('description', 'explanation')}
+    ]
+    assert serialize(None) == []
@@ -0,0 +1,56 @@
+"""
+Tests for the cached /api/sectors and /api/skills pick-lists
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import json
+import os
+
+import pytest
+
+from reference_data import FALLBACK_LISTS, ReferenceData
+
+
+def write_lists(path, sectors, skills):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"internships": [], "sectors": sectors, "skills": skills}, f)
+
+
+def test_etag_follows_the_file_contents(tmp_path):
+    path = str(tmp_path / 'internships.json')
+    write_lists(path, ["Healthcare"], ["Nursing"])
+    data = ReferenceData(path)
+    sectors, etag = data.get('sectors')
+    assert sectors == ["Healthcare"]
+    assert data.get('sectors')[1] == etag
+
+    write_lists(path, ["Healthcare", "Retail"], ["Nursing"])
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10 ** 9))
+    sectors, new_etag = data.get('sectors')
+
+    assert sectors == ["Healthcare", "Retail"]
+    assert new_etag != etag
+
+
+def test_missing_file_serves_the_fallback_lists(tmp_path):
+    data = ReferenceData(str(tmp_path / 'missing.json'))
+    assert data.get('skills')[0] == FALLBACK_LISTS['skills']
+
+
+@pytest.mark.parametrize('name', ['sectors', 'skills'])
+def test_not_modified_when_etag_matches(client, name):
+    response = client.get(f'/api/{name}')
+    etag = response.headers['ETag']
+
+    assert response.status_code == 200
+    assert response.get_json()[name]
+    assert 'max-age' in response.headers['Cache-Control']
+
+    cached = client.get(f'/api/{name}', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+    assert cached.headers['ETag'] == etag
+
+    assert client.get(f'/api/{name}', headers={'If-None-Match': '"stale"'}).status_code == 200
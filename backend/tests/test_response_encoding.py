@@ -0,0 +1,88 @@
+"""
+Tests for response_encoding and compressed /api/recommend responses
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import gzip
+import json
+
+import pytest
+from flask import Flask
+from werkzeug.http import parse_accept_header
+
+from conftest import PROFILE
+from response_encoding import FastJSONProvider, compress, compress_response
+
+PAYLOAD = {"success": True, "count": 2, "b": [1.5, None, "Delhi"], "a": {"z": 1, "y": "x"}}
+
+
+def test_orjson_encodes_like_the_stdlib_provider():
+    pytest.importorskip('orjson')
+    app = Flask(__name__)
+    fast, stdlib = FastJSONProvider(app, 'orjson'), FastJSONProvider(app, 'stdlib')
+
+    assert fast.dumps_bytes(PAYLOAD) == stdlib.dumps_bytes(PAYLOAD)
+    assert json.loads(fast.dumps_bytes({"city": "बेंगलुरु"})) == {"city": "बेंगलुरु"}
+    # Integers orjson cannot encode fall back to the stdlib encoder
+    assert json.loads(fast.dumps_bytes({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+
+def make_response(body, etag=None):
+    app = Flask(__name__)
+    with app.app_context():
+        response = app.response_class(body, mimetype='application/json')
+        if etag:
+            response.set_etag(etag)
+        return response
+
+
+def test_compresses_large_responses_the_client_accepts():
+    body = json.dumps([PAYLOAD] * 200).encode('utf-8')
+    response = make_response(body, etag='abc')
+
+    encoding = compress_response(response, parse_accept_header('gzip, deflate'), ('gzip',), 1024)
+
+    assert encoding == 'gzip'
+    assert gzip.decompress(response.get_data()) == body
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert response.get_etag() == ('abc', True)
+
+
+@pytest.mark.parametrize('accept, size', [('gzip', 100), ('identity', 10000), ('', 10000)])
+def test_leaves_small_or_unaccepted_responses_alone(accept, size):
+    body = b'x' * size
+    response = make_response(body)
+
+    assert compress_response(response, parse_accept_header(accept), ('gzip',), 1024) is None
+    assert response.get_data() == body
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_gzip_output_is_reproducible():
+    body = json.dumps([PAYLOAD] * 50).encode('utf-8')
+    assert compress(body, 'gzip') == compress(body, 'gzip')
+
+
+def test_recommend_response_is_compressed_when_accepted(client, engine):
+    body = dict(PROFILE, limit=30, min_score=0)
+    plain = client.post('/api/recommend', json=body, headers={'Accept-Encoding': 'identity'})
+    packed = client.post('/api/recommend', json=body, headers={'Accept-Encoding': 'gzip'})
+
+    assert packed.headers['Content-Encoding'] == 'gzip'
+    assert len(packed.data) < len(plain.data)
+    assert json.loads(gzip.decompress(packed.data)) == plain.get_json()
+
+
+def test_recommend_omits_requested_fields(client, engine):
+    response = client.post('/api/recommend', json=dict(PROFILE, omit=['description', 'score_breakdown']))
+    matches = response.get_json()['recommendations']
+
+    assert matches
+    for match in matches:
+        assert 'description' not in match and 'score_breakdown' not in match
+        assert 'total_score' in match
+
+    assert client.post('/api/recommend', json=dict(PROFILE, omit=['id'])).status_code == 400
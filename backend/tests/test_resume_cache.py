@@ -0,0 +1,51 @@
+"""
+Tests for resume_cache.ResumeCache and its keys
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+from resume_cache import ResumeCache, file_key, fingerprint, normalize_text, text_key
+
+PARSED = {"skills": ["Python"], "education": "Diploma", "email": "", "phone": "", "confidence": 40.0}
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    path = str(tmp_path / 'resumes.db')
+    ResumeCache(sqlite_path=path).set('text::abc', PARSED)
+
+    cache = ResumeCache(sqlite_path=path)
+    assert cache.get('text::abc') == PARSED
+    assert cache.get('text::abc') == PARSED
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_disk_tier_evicts_least_recently_used_rows(tmp_path):
+    cache = ResumeCache(max_entries=0, sqlite_path=str(tmp_path / 'resumes.db'), max_disk_entries=2)
+    cache.set('a', PARSED)
+    cache.set('b', PARSED)
+    cache.get('a')
+    cache.set('c', PARSED)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == PARSED and cache.get('c') == PARSED
+
+
+def test_memory_only_cache():
+    cache = ResumeCache(max_entries=1)
+    cache.set('a', PARSED)
+    cache.set('b', PARSED)
+
+    assert cache.get('a') is None and cache.get('b') == PARSED
+    assert not cache.stats()['disk_enabled']
+
+
+def test_keys_separate_inputs_and_settings():
+    settings = fingerprint('skills', 5)
+    assert fingerprint('skills', 5) == settings != fingerprint('skills', 6)
+
+    assert file_key(b'resume', 'PDF', settings) == file_key(b'resume', 'pdf', settings)
+    assert file_key(b'resume', 'pdf', settings) != file_key(b'resume', 'docx', settings)
+    assert file_key(b'resume', 'pdf', settings) != file_key(b'resume', 'pdf', fingerprint('skills', 6))
+
+    assert text_key(normalize_text('Python\r\nSQL \n')) == text_key(normalize_text(' Python\nSQL'))
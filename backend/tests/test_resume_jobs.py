@@ -0,0 +1,105 @@
+"""
+Tests for resume_jobs.ResumeJobQueue and the /api/resume/jobs endpoints
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import io
+import threading
+import time
+
+import pytest
+
+from resume_jobs import QueueFull, ResumeJobQueue
+
+
+def wait_for(queue, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job['result'] is not None:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_jobs_run_in_the_background():
+    queue = ResumeJobQueue(lambda name: ({"name": name}, 200 if name != 'bad' else 400), max_workers=2)
+    ok, bad = queue.submit('resume'), queue.submit('bad')
+
+    assert wait_for(queue, ok) == {"status": "completed", "result": ({"name": "resume"}, 200)}
+    assert wait_for(queue, bad)['status'] == "failed"
+    assert queue.get('unknown') is None
+
+
+def test_full_queue_rejects_and_recovers():
+    release = threading.Event()
+    queue = ResumeJobQueue(lambda: (release.wait(5), 200), max_workers=1, max_queued=1)
+    running = queue.submit()
+    while queue.get(running)['status'] != 'running':
+        time.sleep(0.01)
+    queued = queue.submit()
+
+    with pytest.raises(QueueFull):
+        queue.submit()
+
+    release.set()
+    wait_for(queue, queued)
+    wait_for(queue, queue.submit())
+
+
+def test_crashing_job_reports_500():
+    queue = ResumeJobQueue(lambda: 1 / 0)
+    payload, status = wait_for(queue, queue.submit())['result']
+    assert status == 500 and not payload['success']
+
+
+def test_finished_jobs_expire():
+    queue = ResumeJobQueue(lambda: ({}, 200), result_ttl=0.05)
+    job_id = queue.submit()
+    wait_for(queue, job_id)
+    time.sleep(0.1)
+    assert queue.get(job_id) is None
+
+
+def post_job(client, text):
+    return client.post('/api/resume/jobs', data={'file': (io.BytesIO(text.encode('utf-8')), 'resume.txt')},
+                       content_type='multipart/form-data')
+
+
+def test_job_api_returns_the_upload_result(client):
+    text = "Asha Rao\nasha.rao@example.com\nDiploma\nSkills: Python and Excel"
+    response = post_job(client, text)
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+
+    deadline = time.monotonic() + 10
+    while (response := client.get(f'/api/resume/jobs/{job_id}')).status_code == 202:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+    upload = client.post('/api/resume/upload', data={'file': (io.BytesIO(text.encode('utf-8')), 'resume.txt')},
+                         content_type='multipart/form-data')
+    body = response.get_json()
+    assert response.status_code == 200 and body['status'] == 'completed'
+    assert body['data'] == upload.get_json()['data']
+    assert client.get('/api/resume/jobs/unknown').status_code == 404
+
+
+def test_job_api_returns_429_when_full(client, app_module, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(app_module, 'resume_jobs',
+                        ResumeJobQueue(lambda *args: (release.wait(5), 200), max_workers=1, max_queued=1))
+    try:
+        running = post_job(client, "Skills: Python").get_json()['job_id']
+        while app_module.resume_jobs.get(running)['status'] != 'running':
+            time.sleep(0.01)
+        queued = post_job(client, "Skills: Python")
+        response = post_job(client, "Skills: Python")
+    finally:
+        release.set()
+
+    assert queued.status_code == 202
+    assert response.status_code == 429
+    assert 'Retry-After' in response.headers
@@ -0,0 +1,167 @@
+"""
+Tests for resume_parser.ResumeParser
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import random
+import re
+
+import pytest
+
+import resume_parser
+from benchmarks.synthetic import generate_resume_pdf, generate_resume_text
+from resume_parser import EDUCATION_KEYWORDS, ResumeParser, extract_text_from_pdf, parse_pdf_resume
+
+# The original per-level patterns, searched one by one from the highest level
+EDUCATION_PATTERNS = {
+    "Master's Degree": [r'master', r'mba', r'mca', r'msc', r'm\.tech', r'm\.sc', r'post graduate', r'pg'],
+    "Bachelor's Degree": [r'bachelor', r'btech', r'b\.tech', r'be', r'b\.e', r'bca', r'bcom', r'bsc', r'ba',
+                          r'graduate', r'graduation'],
+    "Diploma": [r'diploma', r'polytechnic', r'iti'],
+    "12th Pass": [r'12th', r'12 th', r'xii', r'higher secondary', r'intermediate', r'\+2', r'hsc'],
+    "10th Pass": [r'10th', r'10 th', r'x\b', r'matriculation', r'secondary', r'ssc']
+}
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return ResumeParser()
+
+
+def test_early_stop_waits_for_higher_degree_on_later_page(parser):
+    pages = [
+        "Asha Rao\nasha.rao@example.com\nBachelor of Technology, 2019\nSkills: Python, SQL, Java",
+        "Master of Business Administration, 2023\nExperience: data analyst"
+    ]
+
+    full = parser.parse_text('\n'.join(pages))
+    early = parser.parse_pages(pages, early_stop_skills=1)
+
+    assert full['education'] == "Master's Degree"
+    assert early['education'] == full['education']
+
+
+def test_early_stop_skips_pages_after_top_degree(parser):
+    read = []
+
+    def pages():
+        for page in ["asha.rao@example.com\nMBA\nSkills: Python, SQL", "Skills: Java"]:
+            read.append(page)
+            yield page
+
+    result = parser.parse_pages(pages(), early_stop_skills=1)
+
+    assert len(read) == 1
+    assert result['education'] == "Master's Degree"
+
+
+def test_pages_match_parse_text_without_early_stop(parser):
+    pages = ["asha.rao@example.com\nBachelor of Science\nSkills: Python", "Skills: Java, SQL\nMaster of Science"]
+    assert parser.parse_pages(pages) == parser.parse_text('\n'.join(pages))
+
+
+def scan_education(text):
+    text_lower = text.lower()
+    for education, patterns in EDUCATION_PATTERNS.items():
+        if any(re.search(pattern, text_lower) for pattern in patterns):
+            return education
+    return "12th Pass"
+
+
+def test_education_matches_pattern_by_pattern_scan(parser):
+    rnd = random.Random(8)
+    keywords = [keyword for _, level in EDUCATION_KEYWORDS for keyword in level]
+    filler = ['Skills', 'python', 'worked at', 'Delhi', 'the', 'box', 'Phoenix', '2019', '\n', 'M.Tech.', 'B.E']
+    texts = ['', 'no degree here', 'Box office', 'Class X', 'class xi', 'CBSE +2 board', 'TEXT']
+    texts += [' '.join(rnd.choice(keywords + filler) for _ in range(rnd.randint(1, 8))) for _ in range(2000)]
+
+    for text in texts:
+        assert parser._extract_education(text) == scan_education(text), text
+
+
+def test_standardization_is_case_insensitive(parser):
+    found = {'Python', 'Javascript', 'Public Speaking', 'Excel', 'Autocad', 'Welding'}
+
+    assert parser._standardize_skills(found) == {'Python', 'JavaScript', 'Communication', 'MS Office', 'AutoCAD'}
+    assert parser._standardize_skills({'PYTHON', 'ms office'}) == {'Python', 'MS Office'}
+
+
+def text_pdf(lines):
+    """A one-page PDF showing `lines` in Helvetica"""
+    stream = "BT /F1 12 Tf 72 720 Td 14 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return pdf.encode('ascii')
+
+
+def test_pdf_worker_follows_added_skills():
+    pytest.importorskip('pypdfium2')
+    pdf = text_pdf(["Asha Rao, asha.rao@example.com", "Skills: Python, Video Editing"])
+    app_parser = ResumeParser()
+
+    before, _ = parse_pdf_resume(pdf, skill_database=app_parser.skill_database)
+    app_parser.add_skills('media', ['Video Editing'])
+    after, _ = parse_pdf_resume(pdf, skill_database=app_parser.skill_database)
+
+    assert 'Video Editing' not in before['skills']
+    assert 'Video Editing' in after['skills']
+    assert parse_pdf_resume(pdf)[0]['skills'] == before['skills']
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pdf_backends_agree(seed):
+    pytest.importorskip('pypdfium2')
+    pytest.importorskip('pdfplumber')
+    pdf = generate_resume_pdf(generate_resume_text(seed, pages=2))
+
+    results = {}
+    for backend in resume_parser.PDF_BACKENDS:
+        parsed, stats = parse_pdf_resume(pdf, backend=backend)
+        assert stats['backend'] == ('pdfplumber' if backend == 'pdfplumber' else 'pdfium')
+        assert stats['pages'] == 2 and stats['fallback_pages'] == 0
+        results[backend] = parsed
+
+    assert results['pdfium'] == results['auto'] == results['pdfplumber']
+
+
+def test_suspicious_pdfium_pages_fall_back_to_pdfplumber(monkeypatch):
+    pytest.importorskip('pypdfium2')
+    pytest.importorskip('pdfplumber')
+    pdf = generate_resume_pdf(generate_resume_text(1, pages=2))
+    monkeypatch.setattr(resume_parser, '_suspicious_page_text', lambda text: True)
+
+    parsed, stats = parse_pdf_resume(pdf, backend='auto')
+
+    assert stats['fallback_pages'] == 2
+    assert parsed == parse_pdf_resume(pdf, backend='pdfplumber')[0]
+    assert parse_pdf_resume(pdf, backend='pdfium')[1]['fallback_pages'] == 0
+
+
+def test_suspicious_page_text():
+    assert resume_parser._suspicious_page_text('  \n')
+    assert resume_parser._suspicious_page_text('\ufffd\ufffd ab')
+    assert resume_parser._suspicious_page_text('NoSpacesBetweenWords' * 20)
+    assert not resume_parser._suspicious_page_text('Skills: Python, SQL and Excel')
+
+
+def test_unknown_pdf_backend_is_rejected():
+    pdf = generate_resume_pdf(generate_resume_text(0))
+    with pytest.raises(Exception, match="Unknown PDF backend"):
+        extract_text_from_pdf(pdf, backend='ocr')
@@ -0,0 +1,57 @@
+"""
+Tests for skill_matcher.SkillMatcher
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import random
+import re
+
+import pytest
+
+from benchmarks.synthetic import generate_resume_text
+from resume_parser import ResumeParser
+from skill_matcher import SkillMatcher
+
+TRICKY_TEXTS = [
+    "email marketing, digital marketing and marketing",
+    "python3 pythonic (python) _python python_ python.",
+    "c++/c#; node.js & html5 html, css-3",
+    "ms office\nmicrosoft office\tword-processing word",
+    "",
+    "x",
+    "data entry data entryoperator dataentry",
+    "à python é hindi ü english"
+]
+
+
+@pytest.fixture(scope='module')
+def terms():
+    parser = ResumeParser()
+    terms = {skill.lower() for skills in parser.skill_database.values() for skill in skills}
+    # Terms that start or end with a non-word character
+    return sorted(terms | {'c++', 'c#', 'node.js', '.net', 'css-3'})
+
+
+def regex_matches(terms, text):
+    """The original extractor: one word-bounded regex search per term"""
+    return {term for term in terms if re.search(r'\b' + re.escape(term) + r'\b', text)}
+
+
+def test_matches_regex_word_boundaries(terms):
+    matcher = SkillMatcher(terms)
+    texts = TRICKY_TEXTS + [generate_resume_text(seed).lower() for seed in range(50)]
+
+    for text in texts:
+        assert matcher.find_all(text) == regex_matches(terms, text), text
+
+
+def test_matches_regex_on_random_fragments(terms):
+    matcher = SkillMatcher(terms)
+    rnd = random.Random(3)
+    pieces = terms + [' ', ',', '.', '-', '_', '+', 'a', '1', '\n']
+
+    for _ in range(500):
+        text = ''.join(rnd.choice(pieces) for _ in range(rnd.randint(1, 12)))
+        assert matcher.find_all(text) == regex_matches(terms, text), text
@@ -0,0 +1,96 @@
+"""
+Tests for startup (Lazy objects, phase timing, eager and lazy app start-up)
+
+Run from backend/:
+    python -m pytest tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from startup import Lazy, Startup
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_lazy_builds_once_on_first_use():
+    built = []
+
+    def factory():
+        built.append(1)
+        return {'ready': True}
+
+    lazy = Lazy(factory)
+    assert built == []
+
+    threads = [threading.Thread(target=lambda: lazy.get('ready')) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert built == [1]
+    assert lazy.get('ready') is True and lazy.resolve() == {'ready': True}
+
+
+def test_phases_are_timed_and_failures_still_finish():
+    phase = Startup('eager')
+    phase.mark('imports')
+    phase.run([('first', lambda: {'step': 1.0}), ('broken', lambda: 1 / 0), ('never', lambda: None)])
+
+    stats = phase.stats()
+    assert phase.ready and stats['ready']
+    assert set(stats['phases_ms']) == {'imports', 'first', 'first_steps'}
+    assert stats['phases_ms']['first_steps'] == {'step': 1.0}
+    assert stats['error'].startswith('broken:')
+    assert stats['total_ms'] is not None
+
+
+def test_background_run_sets_ready():
+    release = threading.Event()
+    phase = Startup('eager')
+    phase.run([('slow', release.wait)], background=True)
+
+    assert not phase.ready
+    release.set()
+    assert phase.wait(5)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        Startup('fast')
+
+
+def test_lazy_app_is_ready_at_once(client):
+    response = client.get('/api/health')
+    assert response.status_code == 200
+    assert response.get_json()['startup']['mode'] == 'lazy'
+
+
+EAGER_CHILD = r'''
+import json
+import app
+client = app.app.test_client()
+first = client.get('/api/health').status_code
+assert app.startup_phase.wait(60)
+health = client.get('/api/health')
+print(json.dumps({"first": first, "status": health.status_code, "startup": health.get_json()["startup"]}))
+'''
+
+
+def test_eager_app_warms_up_before_reporting_healthy():
+    env = dict(os.environ, STARTUP_MODE='eager', EXTRACTION_WORKERS='0')
+    output = subprocess.run([sys.executable, '-c', EAGER_CHILD], cwd=BACKEND, env=env,
+                            capture_output=True, text=True, timeout=120, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    assert result['first'] in (200, 503)
+    assert result['status'] == 200
+    startup = result['startup']
+    assert startup['mode'] == 'eager' and startup['error'] is None
+    assert {'imports', 'catalog', 'parser', 'warm_catalog', 'warm_parser', 'warm_extraction'} <= set(startup['phases_ms'])
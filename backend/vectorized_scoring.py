@@ -0,0 +1,228 @@
+"""
+Vectorized Scoring Backend
+Compiles the catalog into NumPy columns and scores it in a few array ops
+Same transparent formula as the pure-Python path
+"""
+
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from catalog_index import EDUCATION_LEVELS, normalize
+import geo
+from records import Internship
+
+
+class VectorizedScorer:
+    """
+    Array-backed copy of the catalog
+
+    Columns (one row per internship):
+        skill_matrix     - skill membership bits (postings x known skills)
+        skill_counts     - number of required skills as listed
+        sector_ids       - id into sector_lookup
+        location_ids     - id into location_keys
+        education_levels - required education level
+        remote           - posting is remote / anywhere
+        active           - False for removed postings (None in the catalog)
+    """
+
+    def __init__(self, internships: List[Optional[Internship]], weights: Dict[str, float]):
+        self.weights = weights
+
+        self.skill_lookup: Dict[str, int] = {}
+        self.sector_lookup: Dict[str, int] = {}
+        self.location_lookup: Dict[str, int] = {}
+        self.location_keys: List[str] = []
+
+        size = len(internships)
+        self.skill_counts = np.zeros(size, dtype=np.float64)
+        self.sector_ids = np.zeros(size, dtype=np.int32)
+        self.location_ids = np.zeros(size, dtype=np.int32)
+        self.education_levels = np.zeros(size, dtype=np.int8)
+        self.remote = np.zeros(size, dtype=bool)
+        self.active = np.zeros(size, dtype=bool)
+
+        skill_rows = [self._set_row(position, internship) for position, internship in enumerate(internships)]
+
+        self.skill_matrix = np.zeros((size, max(len(self.skill_lookup), 1)), dtype=np.uint8)
+        for position, columns in enumerate(skill_rows):
+            self.skill_matrix[position, columns] = 1
+
+    def _set_row(self, position: int, internship: Optional[Internship]) -> List[int]:
+        """Fill one row's scalar columns; returns its skill columns"""
+        if internship is None:
+            self.skill_counts[position] = 0
+            self.active[position] = False
+            return []
+
+        self.skill_counts[position] = internship.skill_count
+        columns = [self.skill_lookup.setdefault(s, len(self.skill_lookup)) for s in internship.skill_keys]
+
+        sector = internship.sector_key
+        self.sector_ids[position] = self.sector_lookup.setdefault(sector, len(self.sector_lookup))
+
+        location = internship.location_key
+        if location not in self.location_lookup:
+            self.location_lookup[location] = len(self.location_keys)
+            self.location_keys.append(location)
+        self.location_ids[position] = self.location_lookup[location]
+        self.remote[position] = internship.remote
+
+        self.education_levels[position] = internship.education_level
+        self.active[position] = True
+        return columns
+
+    def updated(self, internships: List[Optional[Internship]], positions) -> 'VectorizedScorer':
+        """
+        Scorer for a new catalog list that differs only at `positions`
+
+        Columns are copied (and grown for new positions or skills) and
+        only the changed rows are recomputed, so this scorer stays valid
+        for readers of the old catalog.
+        """
+        scorer = VectorizedScorer.__new__(VectorizedScorer)
+        scorer.weights = self.weights
+        scorer.skill_lookup = dict(self.skill_lookup)
+        scorer.sector_lookup = dict(self.sector_lookup)
+        scorer.location_lookup = dict(self.location_lookup)
+        scorer.location_keys = list(self.location_keys)
+
+        size, old_size = len(internships), len(self.skill_counts)
+
+        def grown(column):
+            copy = np.zeros(size, dtype=column.dtype)
+            copy[:min(size, old_size)] = column[:size]
+            return copy
+
+        for name in ('skill_counts', 'sector_ids', 'location_ids', 'education_levels', 'remote', 'active'):
+            setattr(scorer, name, grown(getattr(self, name)))
+
+        skill_rows = {position: scorer._set_row(position, internships[position]) for position in positions}
+
+        width = max(len(scorer.skill_lookup), 1)
+        scorer.skill_matrix = np.zeros((size, width), dtype=np.uint8)
+        scorer.skill_matrix[:min(size, old_size), :self.skill_matrix.shape[1]] = self.skill_matrix[:size]
+        for position, columns in skill_rows.items():
+            scorer.skill_matrix[position] = 0
+            scorer.skill_matrix[position, columns] = 1
+
+        return scorer
+
+    def _skill_columns(self, positions: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """Membership (postings x columns) of the given skill columns"""
+        return self.skill_matrix[np.ix_(positions, columns)]
+
+    def score(self, education: str, skills: List[str], sector: str, location: str,
+              positions: Optional[np.ndarray] = None, within_km: float = None) -> Dict[str, np.ndarray]:
+        """
+        Score the catalog (or only the given positions) for one profile
+
+        Returns arrays keyed like score_breakdown plus 'total'. The skill
+        array is uncapped ('skill_raw') so callers can apply the same
+        min(score, 100) as the Python path.
+        """
+        profile = {
+            'education': education, 'skills': skills, 'sector': sector, 'location': location,
+            'within_km': within_km
+        }
+        scores = self.score_many([profile], positions)
+        return {key: values[0] for key, values in scores.items()}
+
+    def score_many(self, profiles: List[Dict],
+                   positions: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Score many profiles at once
+
+        Returns (profiles x postings) arrays with the same keys as score().
+        A profile's optional 'within_km' zeroes the total of postings
+        farther away.
+        """
+        if positions is None:
+            positions = np.arange(len(self.skill_counts))
+
+        # Skill match: count user skills present in each posting, using only
+        # the skill columns some profile in the batch asked for
+        column_lookup: Dict[int, int] = {}
+        user_rows = []
+        for profile in profiles:
+            row: Dict[int, int] = {}
+            for skill in profile['skills']:
+                column = self.skill_lookup.get(normalize(skill))
+                if column is not None:
+                    local = column_lookup.setdefault(column, len(column_lookup))
+                    row[local] = row.get(local, 0) + 1
+            user_rows.append(row)
+
+        user_skills = np.zeros((len(profiles), len(column_lookup)), dtype=np.float64)
+        for row_number, row in enumerate(user_rows):
+            for local, count in row.items():
+                user_skills[row_number, local] = count
+
+        skill_counts = self.skill_counts[positions]
+        if column_lookup:
+            columns = np.fromiter(column_lookup.keys(), dtype=np.intp)
+            matches = user_skills @ self._skill_columns(positions, columns).T
+            with np.errstate(divide='ignore', invalid='ignore'):
+                skill_raw = np.where(skill_counts > 0, (matches / skill_counts) * 100, 0.0)
+        else:
+            skill_raw = np.zeros((len(profiles), len(positions)), dtype=np.float64)
+        skill_score = np.minimum(skill_raw, 100.0)
+
+        # Sector match: exact normalized sector
+        sector_ids = np.array([
+            self.sector_lookup.get(normalize(profile['sector']), -1) for profile in profiles
+        ], dtype=np.int32)
+        sector_score = np.where(self.sector_ids[positions] == sector_ids[:, None], 100.0, 0.0)
+
+        # Location match: score each distinct location once, then gather
+        user_locations = [normalize(profile['location']) for profile in profiles]
+        location_table = np.array([
+            [geo.location_score(user_loc, key) for key in self.location_keys] or [0.0]
+            for user_loc in user_locations
+        ])
+        location_score = location_table[:, self.location_ids[positions]]
+        location_score = np.where(
+            (location_score == 0.0) & self.remote[positions], 50.0, location_score
+        )
+
+        # Education match: meets requirement or one level below
+        user_levels = np.array([
+            EDUCATION_LEVELS.get(profile['education'], 0) for profile in profiles
+        ])[:, None]
+        levels = self.education_levels[positions]
+        education_score = np.where(
+            user_levels >= levels, 100.0, np.where(user_levels == levels - 1, 50.0, 0.0)
+        )
+
+        total = (
+            skill_score * self.weights['skill_match'] +
+            sector_score * self.weights['sector_match'] +
+            location_score * self.weights['location_match'] +
+            education_score * self.weights['education_match']
+        )
+
+        # Removed postings never pass the relevance threshold
+        active = self.active[positions]
+        if not active.all():
+            total = np.where(active, total, 0.0)
+
+        # Distance limit: same gather over a per-location allowed table
+        if any(profile.get('within_km') is not None for profile in profiles):
+            allowed_table = np.array([
+                [
+                    profile.get('within_km') is None or geo.within(user_loc, key, profile['within_km'])
+                    for key in self.location_keys
+                ] or [False]
+                for profile, user_loc in zip(profiles, user_locations)
+            ])
+            total = np.where(allowed_table[:, self.location_ids[positions]], total, 0.0)
+
+        return {
+            'skill_raw': skill_raw,
+            'skill_match': skill_score,
+            'sector_match': sector_score,
+            'location_match': location_score,
+            'education_match': education_score,
+            'total': total
+        }
@@ -113,19 +113,45 @@ class ApiService {
     }
   }
 
+  // Reference lists cached across screens, revalidated with ETags
+  static final Map<String, String> _etags = {};
+  static final Map<String, List<String>> _cachedLists = {};
+
+  // GET a reference list, reusing the cached copy on 304 Not Modified
+  Future<List<String>> _getReferenceList(String path, String key) async {
+    final headers = <String, String>{};
+    final etag = _etags[path];
+    if (etag != null && _cachedLists.containsKey(path)) {
+      headers['If-None-Match'] = etag;
+    }
+
+    final response = await http.get(
+      Uri.parse('$baseUrl$path'),
+      headers: headers,
+    );
+
+    if (response.statusCode == 304 && _cachedLists.containsKey(path)) {
+      return _cachedLists[path]!;
+    }
+
+    if (response.statusCode == 200) {
+      final data = jsonDecode(response.body);
+      final values = List<String>.from(data[key]);
+      _cachedLists[path] = values;
+      final newEtag = response.headers['etag'];
+      if (newEtag != null) {
+        _etags[path] = newEtag;
+      }
+      return values;
+    }
+
+    throw Exception('Failed to load $key');
+  }
+
   // Get available sectors (for dynamic loading)
   Future<List<String>> getSectors() async {
     try {
-      final response = await http.get(
-        Uri.parse('$baseUrl/api/sectors'),
-      );
-
-      if (response.statusCode == 200) {
-        final data = jsonDecode(response.body);
-        return List<String>.from(data['sectors']);
-      } else {
-        throw Exception('Failed to load sectors');
-      }
+      return await _getReferenceList('/api/sectors', 'sectors');
     } catch (e) {
       throw Exception('Sectors loading error: $e');
     }
@@ -134,16 +160,7 @@ class ApiService {
   // Get available skills (for dynamic loading)
   Future<List<String>> getSkills() async {
     try {
-      final response = await http.get(
-        Uri.parse('$baseUrl/api/skills'),
-      );
-
-      if (response.statusCode == 200) {
-        final data = jsonDecode(response.body);
-        return List<String>.from(data['skills']);
-      } else {
-        throw Exception('Failed to load skills');
-      }
+      return await _getReferenceList('/api/skills', 'skills');
     } catch (e) {
       throw Exception('Skills loading error: $e');
     }